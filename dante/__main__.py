@@ -6,7 +6,16 @@ from dante.cli import cli
 
 def main():
     """Dante main function"""
+    from dante.core import daemon
+
+    # Commands are run by the daemon if it's running
+    code = daemon.forward(argv=sys.argv[1:]) if len(sys.argv) > 1 else None
+    if code is not None:
+        return code
+
     from dante.config import Config
+    from dante.core import color
+    from dante.commands.utils import set_environment
 
     # Read from config file when used in cli mode
     Config.read_from_file()
@@ -18,6 +27,8 @@ def main():
     else:
         # Otherwise run the command
         args = parser.parse_args()
+        set_environment(args)
+        color.init()
         args.func(args) if hasattr(args, 'func') else parser.print_help()
 
 
@@ -0,0 +1,255 @@
+"""Asyncio counterparts of the api. Reading environments and requirement
+files and running operations is done in executors, so the event loop is not
+blocked and many environments can be checked at the same time.
+"""
+
+import asyncio
+from functools import partial
+from collections import OrderedDict
+
+from dante.config import current_settings, use_settings
+from dante.core import operations
+from dante.core import environment as environments
+from dante.core.models import RequirementCollection
+
+# Checks that can be run by check_environment
+CHECKS = ['conflicts', 'cyclic', 'missing', 'duplicates', 'validate']
+
+
+async def run_in_executor(func, *args, executor=None, **kwargs):
+    """Run a blocking function in an executor. Unlike run_in_executor of the
+        event loop, the function runs with settings used by the caller.
+    :param func: Function to run
+    :param args: Function arguments
+    :param executor: Executor to run the function in, defaults to the
+        default executor of the event loop
+    :param kwargs: Function keyword arguments
+    :return: Function result
+    """
+    settings = current_settings()
+
+    def run():
+        with use_settings(settings=settings):
+            return func(*args, **kwargs)
+
+    # Inside a coroutine the running loop is returned
+    return await asyncio.get_event_loop().run_in_executor(executor, run)
+
+
+def _load_environment(path=None):
+    """Load an environment and read it's distributions
+    :param path: Environment path, see environment.load
+    :return: Environment object
+    """
+    environment = (
+        environments.load(path=path) if path else environments.create()
+    )
+    # Distributions are read on first use, reading them here keeps it off
+    # the event loop
+    environment.index
+    return environment
+
+
+async def load_environment(path=None, executor=None):
+    """Load an environment from a snapshot file, a virtualenv or a
+        site-packages directory
+    :param path: Environment path, running interpreter's environment is
+        loaded if not provided
+    :param executor: Executor to run in
+    :return: Environment object
+    """
+    return await run_in_executor(_load_environment, path, executor=executor)
+
+
+async def read_requirements(filepaths, environment=None, executor=None):
+    """Read requirement files into a single collection
+    :param filepaths: List of requirement file paths
+    :param environment: Environment the requirements are looked up in
+    :param executor: Executor to run in
+    :return: Requirements collection
+    """
+    return await run_in_executor(
+        RequirementCollection.from_files,
+        filepaths=filepaths,
+        environment=environment,
+        executor=executor,
+    )
+
+
+async def dependency_list(ignore_list=None, requirements=None,
+                          environment=None, executor=None):
+    """Returns all installed packages, see operations.dependency_list
+    :param ignore_list: List of package keys to ignore
+    :param requirements: Collection of requirements
+    :param environment: Environment to retrieve packages from
+    :param executor: Executor to run in
+    :return: List of packages
+    """
+    return await run_in_executor(
+        operations.dependency_list,
+        ignore_list=ignore_list,
+        requirements=requirements,
+        environment=environment,
+        executor=executor,
+    )
+
+
+async def conflicting_dependencies(packages=None, allow_named_versions=False,
+                                   named_version_patterns=None,
+                                   executor=None):
+    """Returns conflicting dependencies, see
+        operations.conflicting_dependencies
+    :param packages: Collection of packages
+    :param allow_named_versions: Whether named versions are allowed
+    :param named_version_patterns: Patterns for matching named versions
+    :param executor: Executor to run in
+    :return: List of conflicting dependencies
+    """
+    return await run_in_executor(
+        operations.conflicting_dependencies,
+        packages=packages,
+        allow_named_versions=allow_named_versions,
+        named_version_patterns=named_version_patterns,
+        executor=executor,
+    )
+
+
+async def cyclic_dependencies(packages=None, executor=None):
+    """Returns all cyclic dependencies, see operations.cyclic_dependencies
+    :param packages: Collection of packages
+    :param executor: Executor to run in
+    :return: List of found cyclic paths
+    """
+    return await run_in_executor(
+        operations.cyclic_dependencies, packages=packages, executor=executor
+    )
+
+
+async def missing_requirements(packages=None, requirements=None,
+                               ignore_list=None, executor=None):
+    """Returns missing requirements, see operations.missing_requirements
+    :param packages: Collection of packages
+    :param requirements: Collection of requirements
+    :param ignore_list: List of package keys to ignore
+    :param executor: Executor to run in
+    :return: List of missing requirements
+    """
+    return await run_in_executor(
+        operations.missing_requirements,
+        packages=packages,
+        requirements=requirements,
+        ignore_list=ignore_list,
+        executor=executor,
+    )
+
+
+async def duplicate_packages(environment=None, ignore_list=None,
+                             executor=None):
+    """Returns packages that are installed multiple times, see
+        operations.duplicate_packages
+    :param environment: Environment to retrieve packages from
+    :param ignore_list: List of package keys to ignore
+    :param executor: Executor to run in
+    :return: List of active packages and packages shadowed by them
+    """
+    return await run_in_executor(
+        operations.duplicate_packages,
+        environment=environment,
+        ignore_list=ignore_list,
+        executor=executor,
+    )
+
+
+async def validate_requirements(packages=None, requirements=None,
+                                locked=None, ignore_list=None,
+                                executor=None):
+    """Run all requirement validations, see
+        operations.validate_requirements
+    :param packages: Collection of packages
+    :param requirements: Collection of requirements
+    :param locked: Collection of locked requirements
+    :param ignore_list: List of package keys to ignore
+    :param executor: Executor to run in
+    :return: ValidationResult object
+    """
+    return await run_in_executor(
+        operations.validate_requirements,
+        packages=packages,
+        requirements=requirements,
+        locked=locked,
+        ignore_list=ignore_list,
+        executor=executor,
+    )
+
+
+def _parse_package_requirements(packages):
+    """Parse requirements of all packages, so checks running at the same
+        time find them parsed
+    :param packages: Collection of packages
+    :return: None
+    """
+    for package in packages:
+        package.obj.requires()
+
+
+async def check_environment(environment, requirements=None, locked=None,
+                            checks=None, ignore_list=None, executor=None):
+    """Run checks on an environment. Packages are read once and independent
+        checks run at the same time. Checks of requirements are skipped if
+        requirements are not provided.
+    :param environment: Environment object, see load_environment
+    :param requirements: Collection of requirements
+    :param locked: Collection of locked requirements
+    :param checks: List of check names, defaults to configured checks
+    :param ignore_list: List of package keys to ignore, defaults to the
+        configured ignore list
+    :param executor: Executor to run in
+    :return: Results of checks indexed by check name, in the order of CHECKS
+    """
+    settings = current_settings()
+    checks = [
+        name for name in CHECKS
+        if name in (settings.checks if checks is None else checks) and (
+            requirements is not None or name not in ['missing', 'validate']
+        )
+    ]
+    ignore_list = list(ignore_list or settings.ignore_list)
+
+    packages = await dependency_list(
+        ignore_list=ignore_list, environment=environment, executor=executor
+    )
+    await run_in_executor(
+        _parse_package_requirements, packages, executor=executor
+    )
+
+    coroutines = {
+        'conflicts': partial(
+            conflicting_dependencies,
+            packages=packages,
+            allow_named_versions=settings.allow_named_versions,
+            named_version_patterns=settings.named_version_patterns,
+        ),
+        'cyclic': partial(cyclic_dependencies, packages=packages),
+        'missing': partial(
+            missing_requirements,
+            packages=packages,
+            requirements=requirements,
+            ignore_list=ignore_list,
+        ),
+        'duplicates': partial(
+            duplicate_packages,
+            environment=environment,
+            ignore_list=ignore_list,
+        ),
+        'validate': partial(
+            validate_requirements,
+            packages=packages,
+            requirements=requirements,
+            locked=locked,
+            ignore_list=ignore_list,
+        ),
+    }
+    results = await asyncio.gather(*(
+        coroutines[name](executor=executor) for name in checks
+    ))
+    return OrderedDict(zip(checks, results))
@@ -1,3 +1,12 @@
+from dante.config import Settings, use_settings
+from dante.core.environment import (
+    Environment,
+    LiveEnvironment,
+    PathEnvironment,
+    SnapshotEnvironment,
+    FakeEnvironment,
+)
+from dante.core.session import Session
 from dante.core.models import (
     Package,
     Requirement,
@@ -20,11 +29,21 @@ from dante.core.operations import (
     required_version_mismatch,
     unnecessary_packages,
     unnecessary_locks,
+    validate_requirements,
+    environment_diff,
     get_graph,
     render_graph,
 )
 
 __all__ = [
+    'Settings',
+    'use_settings',
+    'Environment',
+    'LiveEnvironment',
+    'PathEnvironment',
+    'SnapshotEnvironment',
+    'FakeEnvironment',
+    'Session',
     'Package',
     'Requirement',
     'PackageCollection',
@@ -44,6 +63,8 @@ __all__ = [
     'required_version_mismatch',
     'unnecessary_packages',
     'unnecessary_locks',
+    'validate_requirements',
+    'environment_diff',
     'get_graph',
     'render_graph',
 ]
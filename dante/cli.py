@@ -1,11 +1,28 @@
 import argparse
 
 
+def positive_int(value):
+    """Parse a positive integer argument
+    :param value: Argument string
+    :return: Integer value
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            '"{}" is not a positive integer'.format(value)
+        )
+    return number
+
+
 def cli():
     """Returns argument parser for dante
     :return: argument parser object
     """
-    from dante import commands, __version__
+    from dante import __version__
+    from dante.commands import lazy_command
 
     parser = argparse.ArgumentParser(
         description='Python dependency management utility'
@@ -16,29 +33,52 @@ def cli():
     parser.add_argument(
         '-i', '--ignore', action='append', help='Ignore package'
     )
+    parser.add_argument(
+        '--site-packages',
+        action='append',
+        metavar='PATH',
+        help='Inspect packages installed in site-packages directory'
+    )
+    parser.add_argument(
+        '--venv',
+        metavar='PATH',
+        help='Inspect packages installed in virtualenv'
+    )
+    parser.add_argument(
+        '--snapshot',
+        metavar='FILE',
+        help='Inspect packages stored in environment snapshot'
+    )
 
-    subparsers = parser.add_subparsers()
+    subparsers = parser.add_subparsers(dest='command')
 
     # CONFIG
     parser_config = subparsers.add_parser(
         name='config',
         help='Print configuration'
     )
-    parser_config.set_defaults(func=commands.config_command)
+    parser_config.set_defaults(func=lazy_command('config_command'))
 
     # CONFLICTS
     parser_conflicts = subparsers.add_parser(
         name='conflicts',
         help='Check for conflicts in required dependencies'
     )
-    parser_conflicts.set_defaults(func=commands.conflicts_command)
+    parser_conflicts.set_defaults(func=lazy_command('conflicts_command'))
 
     # CYCLIC
     parser_cyclic = subparsers.add_parser(
         name='cyclic',
         help='Check for cyclic dependencies'
     )
-    parser_cyclic.set_defaults(func=commands.cyclic_command)
+    parser_cyclic.set_defaults(func=lazy_command('cyclic_command'))
+
+    # DUPLICATES
+    parser_duplicates = subparsers.add_parser(
+        name='duplicates',
+        help='Check for packages installed multiple times'
+    )
+    parser_duplicates.set_defaults(func=lazy_command('duplicates_command'))
 
     # LIST
     parser_list = subparsers.add_parser(
@@ -51,7 +91,7 @@ def cli():
         action='append',
         help='Requirement file(s)'
     )
-    parser_list.set_defaults(func=commands.list_command)
+    parser_list.set_defaults(func=lazy_command('list_command'))
 
     # DEPENDENCY TREE
     parser_dependency = subparsers.add_parser(
@@ -67,7 +107,18 @@ def cli():
         action='append',
         help='Requirement file(s)'
     )
-    parser_dependency.set_defaults(func=commands.tree_command)
+    parser_dependency.add_argument(
+        '-d',
+        '--depth',
+        type=int,
+        help='Show only a number of requirement levels'
+    )
+    parser_dependency.add_argument(
+        '--reverse',
+        action='store_true',
+        help='Show packages requiring the specified package'
+    )
+    parser_dependency.set_defaults(func=lazy_command('tree_command'))
 
     # MISSING
     parser_missing = subparsers.add_parser(
@@ -80,7 +131,9 @@ def cli():
         action='append',
         help='Requirement file(s)'
     )
-    parser_missing.set_defaults(func=commands.missing_requirements_command)
+    parser_missing.set_defaults(func=lazy_command(
+        'missing_requirements_command'
+    ))
 
     # CHECK
     parser_check = subparsers.add_parser(
@@ -99,13 +152,118 @@ def cli():
         action='append',
         help='Lock file(s)'
     )
-    parser_check.set_defaults(func=commands.check_all)
+    parser_check.set_defaults(func=lazy_command('check_all'))
     parser_check.add_argument(
         '-s',
         '--strict',
         action='store_true',
         help='Packages not required cause an error'
     )
+    parser_check.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        help='Number of checks run at the same time in worker processes '
+             '(defaults to all)'
+    )
+    parser_check.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Run checks even if nothing changed since the last run'
+    )
+    parser_check.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop at the first failing check'
+    )
+    parser_check.add_argument(
+        '--projects',
+        nargs='+',
+        metavar='DIR',
+        help='Check projects in directories (or glob patterns), '
+             'each with it\'s own configuration'
+    )
+
+    # AUDIT
+    parser_audit = subparsers.add_parser(
+        name='audit',
+        help='Run checks on all environments found under paths'
+    )
+    parser_audit.add_argument(
+        'paths',
+        nargs='+',
+        metavar='PATH',
+        help='Virtualenv, site-packages or snapshot path, or a directory '
+             'to search for them'
+    )
+    parser_audit.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        help='Number of environments checked at the same time '
+             '(defaults to the number of CPUs)'
+    )
+    parser_audit.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop checking an environment at the first problem found'
+    )
+    parser_audit.set_defaults(func=lazy_command('audit_command'))
+
+    # WATCH
+    parser_watch = subparsers.add_parser(
+        name='watch',
+        help='Run checks whenever requirements or installed packages change'
+    )
+    parser_watch.add_argument(
+        '-r',
+        '--requirements',
+        action='append',
+        help='Requirement file(s)'
+    )
+    parser_watch.add_argument(
+        '-l',
+        '--lock',
+        action='append',
+        help='Lock file(s)'
+    )
+    parser_watch.add_argument(
+        '-s',
+        '--strict',
+        action='store_true',
+        help='Packages not required cause an error'
+    )
+    parser_watch.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        help='Number of checks run at the same time (defaults to all)'
+    )
+    parser_watch.add_argument(
+        '--interval',
+        type=float,
+        default=1.0,
+        help='Seconds between checking for changes, if they are polled'
+    )
+    parser_watch.add_argument(
+        '--debounce',
+        type=float,
+        default=0.5,
+        help='Seconds without changes before checks are run'
+    )
+    parser_watch.set_defaults(func=lazy_command('watch_command'))
+
+    # DAEMON
+    parser_daemon = subparsers.add_parser(
+        name='daemon',
+        help='Serve commands from a single process with warm caches'
+    )
+    parser_daemon.add_argument(
+        '--stop',
+        action='store_true',
+        help='Stop the running daemon'
+    )
+    parser_daemon.set_defaults(func=lazy_command('daemon_command'))
 
     # LOCK
     parser_lock = subparsers.add_parser(
@@ -130,7 +288,7 @@ def cli():
         '--file',
         help='Specify path for lock file'
     )
-    parser_lock.set_defaults(func=commands.lock_command)
+    parser_lock.set_defaults(func=lazy_command('lock_command'))
 
     # VALIDATE
     parser_validate = subparsers.add_parser(
@@ -155,14 +313,49 @@ def cli():
         action='store_true',
         help='Packages not required cause an error'
     )
-    parser_validate.set_defaults(func=commands.validate_command)
+    parser_validate.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop at the first failing validation'
+    )
+    parser_validate.add_argument(
+        '--files-only',
+        action='store_true',
+        help='Compare requirement and lock files without reading the '
+             'environment'
+    )
+    parser_validate.set_defaults(func=lazy_command('validate_command'))
+
+    # VERIFY
+    parser_verify = subparsers.add_parser(
+        'verify',
+        help='Verify installed package files against package records'
+    )
+    parser_verify.add_argument(
+        '-s',
+        '--sample',
+        type=positive_int,
+        help='Verify only a number of randomly chosen packages'
+    )
+    parser_verify.add_argument(
+        '--seed',
+        type=int,
+        help='Random seed used for choosing packages'
+    )
+    parser_verify.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        help='Number of worker processes (defaults to number of CPUs)'
+    )
+    parser_verify.set_defaults(func=lazy_command('verify_command'))
 
     # GRAPH
     parser_graph = subparsers.add_parser(
         name='graph',
         help='Export a dependency graph using graphviz'
     )
-    parser_graph.set_defaults(func=commands.graph_command)
+    parser_graph.set_defaults(func=lazy_command('graph_command'))
     parser_graph.add_argument(
         '-s',
         '--strict',
@@ -189,4 +382,39 @@ def cli():
     parser_graph.add_argument('--node_attr', help='Node attributes')
     parser_graph.add_argument('--edge_attr', help='Edge attributes')
 
+    # SNAPSHOT
+    parser_snapshot = subparsers.add_parser(
+        name='snapshot',
+        help='Display or save a snapshot of installed packages'
+    )
+    parser_snapshot.add_argument(
+        '-o',
+        '--output',
+        help='Snapshot file path'
+    )
+    parser_snapshot.set_defaults(func=lazy_command('snapshot_command'))
+
+    # DIFF
+    parser_diff = subparsers.add_parser(
+        name='diff',
+        help='Show differences between environments'
+    )
+    parser_diff.add_argument(
+        'environment',
+        help='Snapshot file, virtualenv or site-packages directory'
+    )
+    parser_diff.add_argument(
+        'other',
+        nargs='?',
+        help='Snapshot file, virtualenv or site-packages directory '
+             '(defaults to the inspected environment)'
+    )
+    parser_diff.add_argument(
+        '-j',
+        '--json',
+        action='store_true',
+        help='Display differences in json format'
+    )
+    parser_diff.set_defaults(func=lazy_command('diff_command'))
+
     return parser
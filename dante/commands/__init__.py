@@ -1,24 +1,62 @@
-from dante.commands.check import check_all
-from dante.commands.list import list_command
-from dante.commands.lock import lock_command
-from dante.commands.tree import tree_command
-from dante.commands.graph import graph_command
-from dante.commands.cyclic import cyclic_command
-from dante.commands.config import config_command
-from dante.commands.conflicts import conflicts_command
-from dante.commands.validate import validate_command
-from dante.commands.missing_requirements import missing_requirements_command
-
-
-__all__ = [
-    'check_all',
-    'list_command',
-    'lock_command',
-    'tree_command',
-    'graph_command',
-    'cyclic_command',
-    'config_command',
-    'conflicts_command',
-    'missing_requirements_command',
-    'validate_command',
-]
+from importlib import import_module
+from collections import OrderedDict
+
+# Command functions mapped to modules they are defined in. Modules are
+# imported only when their command is used, to keep the cli startup fast.
+COMMANDS = OrderedDict([
+    ('check_all', 'dante.commands.check'),
+    ('audit_command', 'dante.commands.audit'),
+    ('list_command', 'dante.commands.list'),
+    ('lock_command', 'dante.commands.lock'),
+    ('tree_command', 'dante.commands.tree'),
+    ('graph_command', 'dante.commands.graph'),
+    ('cyclic_command', 'dante.commands.cyclic'),
+    ('daemon_command', 'dante.commands.daemon'),
+    ('diff_command', 'dante.commands.diff'),
+    ('duplicates_command', 'dante.commands.duplicates'),
+    ('config_command', 'dante.commands.config'),
+    ('snapshot_command', 'dante.commands.snapshot'),
+    ('conflicts_command', 'dante.commands.conflicts'),
+    ('verify_command', 'dante.commands.verify'),
+    ('watch_command', 'dante.commands.watch'),
+    ('validate_command', 'dante.commands.validate'),
+    (
+        'missing_requirements_command',
+        'dante.commands.missing_requirements'
+    ),
+])
+
+
+def load_command(name):
+    """Import a command function
+    :param name: Command function name
+    :return: Command function
+    """
+    return getattr(import_module(COMMANDS[name]), name)
+
+
+def lazy_command(name):
+    """Create a function that imports a command function when it's called
+    :param name: Command function name
+    :return: Function calling the command
+    """
+    def command(*args, **kwargs):
+        return load_command(name)(*args, **kwargs)
+
+    command.__name__ = name
+    return command
+
+
+def __getattr__(name):
+    """Import command functions on first attribute access (Python 3.7+)
+    :param name: Command function name
+    :return: Command function
+    """
+    if name in COMMANDS:
+        return load_command(name)
+    raise AttributeError(
+        "module '{}' has no attribute '{}'".format(__name__, name)
+    )
+
+
+__all__ = list(COMMANDS)
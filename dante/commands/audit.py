@@ -0,0 +1,156 @@
+import io
+import sys
+import time
+from functools import partial
+from argparse import Namespace
+
+from dante import messages
+from dante.config import current_settings, use_settings
+from dante.core import environment
+from dante.core.printer import Printer
+from dante.commands import load_command
+
+# Checks of installed packages that do not need requirement files, mapped to
+# their commands
+AUDIT_CHECKS = {
+    'conflicts': 'conflicts_command',
+    'cyclic': 'cyclic_command',
+    'duplicates': 'duplicates_command',
+}
+
+
+def audit_environment(path, checks, ignore=None, fail_fast=False,
+                      settings=None):
+    """Run checks on a single environment. Errors are reported as a part of
+        the result, so a broken environment does not stop the audit.
+    :param path: Environment path, see environment.load
+    :param checks: List of check names
+    :param ignore: List of package keys to ignore
+    :param fail_fast: Stop checks at the first problem found
+    :param settings: Settings the checks run with, workers do not inherit
+        settings in use
+    :return: Dictionary with environment path, status, failed checks or
+        error and duration in seconds
+    """
+    from dante.core.operations import dependency_list
+
+    start = time.monotonic()
+    failed, error = [], None
+    try:
+        with use_settings(settings=settings):
+            environment.use(environment.load(path=path))
+            args = Namespace(ignore=ignore, fail_fast=fail_fast)
+            packages = dependency_list(ignore_list=ignore)
+            for name in checks:
+                command = load_command(name=AUDIT_CHECKS[name])
+                printer = Printer(stream=io.StringIO())
+                success = (
+                    command(args, exit_on_failure=False, printer=printer)
+                    if name == 'duplicates' else
+                    command(
+                        args,
+                        packages=packages,
+                        exit_on_failure=False,
+                        printer=printer
+                    )
+                )
+                if not success:
+                    failed.append(name)
+                    if fail_fast:
+                        break
+    except Exception as e:
+        error = '{}: {}'.format(type(e).__name__, e)
+
+    return {
+        'path': path,
+        'status': (
+            messages.ERROR if error else
+            messages.FAILED if failed else
+            messages.PASSED
+        ),
+        'failed': failed,
+        'error': error,
+        'duration': time.monotonic() - start,
+    }
+
+
+def print_result(result, printer):
+    """Print audit result of an environment on a single line
+    :param result: Result of audit_environment
+    :param printer: Printer object
+    :return: None
+    """
+    details = result['error'] or ', '.join(result['failed'])
+    message = messages.AUDIT_RESULT.format(
+        status=result['status'],
+        duration=result['duration'],
+        path=result['path'],
+    ) + (': {}'.format(details) if details else '')
+
+    if result['status'] == messages.PASSED:
+        printer.success(message)
+    elif result['status'] == messages.FAILED:
+        printer.error(message)
+    else:
+        printer.warning(message)
+
+
+def audit_command(args, printer=None):
+    """Runs checks on all environments found under provided paths in a
+        process pool, printing results as environments are checked
+    :param args: Command arguments
+    :param printer: Printer object
+    :return: None
+    """
+    import multiprocessing
+
+    settings = current_settings()
+    ignore_list = list(args.ignore or settings.ignore_list)
+    checks = [name for name in AUDIT_CHECKS if name in settings.checks]
+
+    printer = printer or Printer()
+    paths = []
+    real_paths = set()
+    for root in args.paths:
+        root_paths = environment.discover(roots=[root])
+        if not root_paths:
+            printer.warning(messages.AUDIT_PATH_NOT_FOUND.format(path=root))
+        # Environments found under multiple roots are audited once
+        for path in root_paths:
+            if environment.real_path(path) not in real_paths:
+                real_paths.add(environment.real_path(path))
+                paths.append(path)
+    if not paths:
+        printer.error(messages.AUDIT_NOT_FOUND)
+        sys.exit(1)
+
+    audit = partial(
+        audit_environment,
+        checks=checks,
+        ignore=ignore_list,
+        fail_fast=getattr(args, 'fail_fast', False),
+        settings=settings,
+    )
+    start = time.monotonic()
+    counts = {
+        messages.PASSED: 0,
+        messages.FAILED: 0,
+        messages.ERROR: 0,
+    }
+    # Environments are checked in separate processes, so each one has it's
+    # own environment in use and a crashing check affects only it's worker
+    with multiprocessing.Pool(processes=args.jobs) as pool:
+        for result in pool.imap_unordered(audit, paths):
+            counts[result['status']] += 1
+            print_result(result=result, printer=printer)
+            (printer.stream or sys.stdout).flush()
+
+    printer.info(messages.AUDIT_TOTALS.format(
+        count=len(paths),
+        duration=time.monotonic() - start,
+        passed=counts[messages.PASSED],
+        failed=counts[messages.FAILED],
+        errors=counts[messages.ERROR],
+    ))
+    if counts[messages.PASSED] != len(paths):
+        sys.exit(1)
@@ -1,8 +1,143 @@
+import io
+import os
 import sys
+import glob
+from copy import copy
+from collections import OrderedDict
 
-import dante
-from dante.config import Config
-from dante.core.operations import dependency_list
+from dante import messages
+from dante.config import Settings, current_settings, use_settings
+from dante.core import cache, color
+from dante.core.printer import Printer
+from dante.core.environment import current_environment
+from dante.commands import load_command
+from dante.commands.utils import validate_files, read_requirement_files
+
+# Available checks mapped to their commands, in the order their output is
+# printed. Commands are imported only if the results are not cached.
+CHECKS = OrderedDict([
+    ('validate', 'validate_command'),
+    ('conflicts', 'conflicts_command'),
+    ('cyclic', 'cyclic_command'),
+    ('missing', 'missing_requirements_command'),
+    ('duplicates', 'duplicates_command'),
+])
+
+# Checks with results that can be reused for packages that did not change
+INCREMENTAL_CHECKS = ['validate', 'conflicts', 'missing']
+
+# Check arguments, settings and colors of a worker process, see _init_worker
+_worker_state = None
+
+
+def _run_check(name, arguments, settings=None, colors=False):
+    """Run a check, buffering it's output
+    :param name: Check name
+    :param arguments: Keyword arguments of the check command
+    :param settings: Settings the check runs with, workers do not inherit
+        settings in use
+    :param colors: Whether output is colored, the buffer is not a terminal
+    :return: Whether the check was successful and it's output
+    """
+    output = io.StringIO()
+    with use_settings(settings=settings):
+        success = load_command(name=CHECKS[name])(
+            printer=Printer(stream=output, colors=colors),
+            exit_on_failure=False,
+            **arguments
+        )
+    return success, output.getvalue()
+
+
+def _init_worker(check_arguments, settings, colors):
+    """Keep arguments of checks in a worker process. Workers are forked, so
+        the arguments are inherited instead of being pickled.
+    :param check_arguments: Keyword arguments of check commands indexed by
+        check name
+    :param settings: Settings checks run with
+    :param colors: Whether output is colored
+    :return: None
+    """
+    global _worker_state
+    _worker_state = (check_arguments, settings, colors)
+
+
+def _run_worker_check(name):
+    """Run a check in a worker process
+    :param name: Check name
+    :return: Whether the check was successful and it's output
+    """
+    check_arguments, settings, colors = _worker_state
+    return _run_check(
+        name=name,
+        arguments=check_arguments[name],
+        settings=settings,
+        colors=colors,
+    )
+
+
+def _can_fork():
+    """Check whether worker processes can be forked. Forking a process
+        running other threads is not safe and the daemon does not fork, so
+        it's socket and caches are not copied to workers.
+    :return: Whether worker processes can be forked
+    """
+    import threading
+    import multiprocessing
+    from dante.core import daemon
+
+    return (
+        'fork' in multiprocessing.get_all_start_methods() and
+        threading.active_count() == 1 and
+        not daemon.running_command()
+    )
+
+
+def _cache_key(args, requirements_files, lock_files, colors=False):
+    """Create a cache key for check results from everything they depend on
+    :param args: Command arguments
+    :param requirements_files: List of requirement file paths
+    :param lock_files: List of lock file paths
+    :param colors: Whether output is colored
+    :return: Cache key or None if results can not be cached
+    """
+    fingerprint = current_environment().fingerprint()
+    if fingerprint is None:
+        return None
+
+    return cache.cache_key(
+        fingerprint,
+        [
+            [os.path.abspath(path), cache.file_hash(path)]
+            for path in requirements_files + lock_files
+        ],
+        current_settings().to_json(),
+        args.ignore,
+        args.strict,
+        getattr(args, 'fail_fast', False),
+        colors,
+    )
+
+
+def _state_key(args, requirements_files, lock_files):
+    """Create a key of the state incremental checks are based on. Unlike
+        the cache key, it does not change when packages or files change.
+    :param args: Command arguments
+    :param requirements_files: List of requirement file paths
+    :param lock_files: List of lock file paths
+    :return: State key or None if checks can not be incremental
+    """
+    identity = current_environment().identity()
+    if identity is None:
+        return None
+
+    return cache.cache_key(
+        'state',
+        identity,
+        [os.path.abspath(path) for path in requirements_files + lock_files],
+        current_settings().to_json(),
+        args.ignore,
+    )
 
 
 def check_all(args):
@@ -10,30 +145,220 @@ def check_all(args):
     :param args: Command arguments
     :return: None
     """
+    if getattr(args, 'projects', None):
+        return check_projects(args)
+
+    settings = current_settings()
     ignore_list = args.ignore or []
-    checks_ok = []
+    jobs = getattr(args, 'jobs', None)
+    fail_fast = getattr(args, 'fail_fast', False)
+    checks = [name for name in CHECKS if name in settings.checks]
+    requirements_files = list(
+        args.requirements or settings.requirements_files
+    )
+    lock_files = list(args.lock or settings.lock_files)
+    # Checks write to buffers, colors are decided by stdout they end up in
+    colors = color.enabled(stream=sys.stdout)
+
+    key = (
+        None if getattr(args, 'no_cache', False) else
+        _cache_key(
+            args=args,
+            requirements_files=requirements_files,
+            lock_files=lock_files,
+            colors=colors,
+        )
+    )
+    result = cache.load_result(key=key) if key else None
+    if result:
+        # Nothing changed since the last run
+        sys.stdout.write(result['output'])
+        if not result['success']:
+            sys.exit(1)
+        return
+
+    from dante.core.operations import dependency_list
 
+    # Environment and requirement files are read once for all checks.
+    # Missing files are reported by the checks themselves.
     packages = dependency_list(ignore_list=ignore_list)
+    requirements = locked = None
+    if ('validate' in checks or 'missing' in checks) and validate_files(
+            files=requirements_files + lock_files, exit_on_failure=False):
+        # Lock files are used only by validation
+        requirements, locked = read_requirement_files(filepaths=[
+            requirements_files, lock_files if 'validate' in checks else []
+        ])
+
+    # Arguments are passed to every check, so concurrent runs of checks
+    # (e.g. in the daemon) do not share them
+    check_arguments = {
+        'validate': dict(
+            args=args,
+            packages=packages,
+            requirements=requirements,
+            locked=locked,
+        ),
+        'conflicts': dict(args=args, packages=packages),
+        'cyclic': dict(args=args, packages=packages),
+        'missing': dict(
+            args=args, packages=packages, requirements=requirements
+        ),
+        'duplicates': dict(args=args),
+    }
+
+    state_key = key and _state_key(
+        args=args,
+        requirements_files=requirements_files,
+        lock_files=lock_files,
+    )
+    incremental_checks = []
+    if state_key and set(checks) & set(INCREMENTAL_CHECKS):
+        from dante.core.incremental import check_packages
+
+        # Only packages affected by changes since the last run are checked,
+        # results of other packages are reused
+        incremental, state = check_packages(
+            packages=packages,
+            requirements=requirements,
+            locked=locked,
+            ignore_list=list(args.ignore or settings.ignore_list),
+            state=cache.load_result(key=state_key),
+        )
+        cache.save_result(key=state_key, result=state)
+        check_arguments['conflicts']['conflicting'] = incremental.conflicts
+        incremental_checks.append('conflicts')
+        if requirements is not None:
+            check_arguments['missing']['missing'] = incremental.missing
+            incremental_checks.append('missing')
+        if locked is not None:
+            check_arguments['validate']['lock_version_mismatch'] = (
+                incremental.lock_version_mismatch
+            )
+
+    # Import commands and parse package requirements before checks are
+    # started, so it's done only once and not in every worker
+    for name in checks:
+        load_command(name=CHECKS[name])
+    if any(name not in incremental_checks + ['duplicates']
+           for name in checks):
+        for package in packages:
+            package.obj.requires()
+
+    results = []
+    if jobs == 1 or len(checks) < 2 or not _can_fork():
+        # Checks are CPU bound, without worker processes they do not gain
+        # anything from running at the same time
+        for name in checks:
+            results.append(_run_check(
+                name=name,
+                arguments=check_arguments[name],
+                settings=settings,
+                colors=colors,
+            ))
+            if fail_fast and not results[-1][0]:
+                break
+    else:
+        import multiprocessing
+
+        with multiprocessing.get_context('fork').Pool(
+            processes=jobs or len(checks),
+            initializer=_init_worker,
+            initargs=(check_arguments, settings, colors),
+        ) as pool:
+            # Results are received in the order of checks, remaining checks
+            # are terminated with the pool after the first failure
+            for result in pool.imap(_run_worker_check, checks):
+                results.append(result)
+                if fail_fast and not result[0]:
+                    break
 
-    if 'validate' in Config.checks:
-        checks_ok.append(dante.commands.validate_command(
-            args=args, packages=packages, exit_on_failure=False,
-        ))
+    checks_ok = all(success for success, _ in results)
+    output = ''.join(check_output for _, check_output in results)
+    sys.stdout.write(output)
+    if key:
+        cache.save_result(
+            key=key, result={'success': checks_ok, 'output': output}
+        )
+
+    if not checks_ok:
+        sys.exit(1)
+
+
+def project_directories(patterns):
+    """Find project directories matching provided paths or glob patterns
+    :param patterns: List of directory paths or glob patterns
+    :return: List of absolute directory paths, in the order they were matched
+    """
+    directories = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)) or [pattern]:
+            path = os.path.abspath(path)
+            if os.path.isdir(path) and path not in directories:
+                directories.append(path)
+    return directories
+
+
+def project_paths(directory, paths):
+    """Resolve file paths of a project against it's directory
+    :param directory: Project directory
+    :param paths: List of file paths, relative ones are relative to the
+        project directory
+    :return: List of absolute file paths or None if paths are not provided
+    """
+    return [
+        os.path.abspath(os.path.join(directory, path)) for path in paths
+    ] if paths else None
 
-    if 'conflicts' in Config.checks:
-        checks_ok.append(dante.commands.conflicts_command(
-            args=args, packages=packages, exit_on_failure=False,
-        ))
 
-    if 'cyclic' in Config.checks:
-        checks_ok.append(dante.commands.cyclic_command(
-            args=args, packages=packages, exit_on_failure=False,
-        ))
+def check_projects(args):
+    """Run checks for multiple projects, each with it's own configuration
+        and requirement files, in the same environment. The environment is
+        read and parsed files are kept only once for all projects.
+    :param args: Command arguments
+    :return: None
+    """
+    printer = Printer()
+    cwd = os.getcwd()
+    fail_fast = getattr(args, 'fail_fast', False)
+    directories = project_directories(patterns=args.projects)
+    if not directories:
+        printer.error(messages.PROJECTS_NOT_FOUND)
+        sys.exit(1)
 
-    if 'missing' in Config.checks:
-        checks_ok.append(dante.commands.missing_requirements_command(
-            args=args, packages=packages, exit_on_failure=False,
-        ))
+    results = []
+    for directory in directories:
+        printer.info(messages.PROJECT_CHECKS.format(project=directory))
+        # Projects are checked as if dante was run in their directory, with
+        # their own settings used only while they are checked. Paths are
+        # resolved against the directory, the working directory is not
+        # changed, so other threads (e.g. of the daemon) are not affected.
+        project_args = copy(args)
+        project_args.projects = None
+        project_args.requirements = project_paths(
+            directory=directory, paths=args.requirements
+        )
+        project_args.lock = project_paths(directory=directory, paths=args.lock)
+        try:
+            with use_settings(Settings.from_file(directory=directory)):
+                check_all(project_args)
+            success = True
+        except SystemExit as e:
+            success = not e.code
+        sys.stdout.flush()
+        results.append((directory, success))
+        if fail_fast and not success:
+            break
 
-    if not all(checks_ok):
+    printer.table(
+        headers=[messages.PROJECT, messages.STATUS],
+        tabular_data=[
+            [
+                os.path.relpath(directory, cwd),
+                messages.PASSED if success else messages.FAILED,
+            ]
+            for directory, success in results
+        ]
+    )
+    if not all(success for _, success in results):
         sys.exit(1)
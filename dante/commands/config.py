@@ -1,4 +1,4 @@
-from dante.config import Config
+from dante.config import current_settings
 from dante.core.printer import Printer
 
 
@@ -7,6 +7,7 @@ def config_command(_):
     :param _: Command arguments
     :return: None
     """
+    settings = current_settings()
     printer = Printer()
-    message = Config.to_json()
+    message = settings.to_json()
     printer.print_message(message=message)
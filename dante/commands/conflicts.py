@@ -1,32 +1,37 @@
 import sys
+from itertools import islice
 
 from dante import messages
-from dante.config import Config
+from dante.config import current_settings
 from dante.core.printer import Printer
-from dante.core.operations import dependency_list, conflicting_dependencies
+from dante.core.operations import (
+    dependency_list,
+    iter_conflicting_dependencies,
+)
 
 
-def conflicts_command(args, packages=None, exit_on_failure=True):
+def conflicts_command(args, packages=None, exit_on_failure=True,
+                      printer=None, conflicting=None):
     """Runs detection of dependency conflicts
     :param args: Command arguments
     :param packages: Collection of packages
     :param exit_on_failure: Enable/disable exiting application on failure
+    :param printer: Printer object
+    :param conflicting: Conflicting dependencies, detected if not provided
     :return: None
     """
-    ignore_list = (
-        args.ignore or Config.ignore_list or []
-    )
-
-    printer = Printer()
-    packages = (
-        packages or dependency_list(ignore_list=ignore_list)
-    )
-
-    conflicting = [
-        (package, required_by)
-        for package, required_by
-        in conflicting_dependencies(packages=packages)
-    ]
+    settings = current_settings()
+    ignore_list = list(args.ignore or settings.ignore_list)
+    fail_fast = getattr(args, 'fail_fast', False)
+
+    printer = printer or Printer()
+    if conflicting is None:
+        packages = (
+            packages or dependency_list(ignore_list=ignore_list)
+        )
+        conflicting = iter_conflicting_dependencies(packages=packages)
+    # The first conflict is enough to fail
+    conflicting = islice(conflicting, 1 if fail_fast else None)
 
     headers = [
         messages.PACKAGE,
@@ -1,28 +1,39 @@
 import sys
 
 from dante import messages
-from dante.config import Config
+from dante.config import current_settings
 from dante.core.printer import Printer
-from dante.core.operations import dependency_list, cyclic_dependencies
+from dante.core.operations import (
+    dependency_list,
+    cyclic_dependencies,
+    find_cyclic_dependency,
+)
 
 
-def cyclic_command(args, packages=None, exit_on_failure=True):
+def cyclic_command(args, packages=None, exit_on_failure=True,
+                   printer=None):
     """Runs detection of cyclical dependencies
     :param args: Command arguments
     :param packages: Collection of packages
     :param exit_on_failure: Enable/disable exiting application on failure
+    :param printer: Printer object
     :return: None
     """
-    ignore_list = (
-        args.ignore or Config.ignore_list or []
-    )
+    settings = current_settings()
+    ignore_list = list(args.ignore or settings.ignore_list)
+    fail_fast = getattr(args, 'fail_fast', False)
 
-    printer = Printer()
+    printer = printer or Printer()
     packages = (
         packages or dependency_list(ignore_list=ignore_list)
     )
 
-    cyclic_paths = cyclic_dependencies(packages=packages)
+    if fail_fast:
+        # Finding a single cyclic path is enough to fail
+        cyclic_path = find_cyclic_dependency(packages=packages)
+        cyclic_paths = [cyclic_path] if cyclic_path else []
+    else:
+        cyclic_paths = cyclic_dependencies(packages=packages)
 
     if cyclic_paths:
         printer.error(messages.CYCLIC_FOUND)
@@ -0,0 +1,40 @@
+import sys
+import signal
+import socket
+
+from dante import messages
+from dante.core import daemon
+from dante.core.printer import Printer
+
+
+def daemon_command(args, printer=None):
+    """Runs the daemon serving commands until it's stopped, or stops the
+        running daemon
+    :param args: Command arguments
+    :param printer: Printer object
+    :return: None
+    """
+    printer = printer or Printer()
+    if args.stop:
+        if daemon.stop():
+            printer.success(messages.DAEMON_STOPPED)
+        else:
+            printer.warning(messages.DAEMON_NOT_RUNNING)
+        return
+
+    if not hasattr(socket, 'AF_UNIX'):
+        printer.error(messages.DAEMON_NOT_SUPPORTED)
+        sys.exit(1)
+    if daemon.is_running():
+        printer.error(messages.DAEMON_RUNNING)
+        sys.exit(1)
+
+    # Socket is removed when the daemon is terminated
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    server = daemon.Daemon()
+    printer.info(messages.DAEMON_STARTED.format(path=server.path))
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        pass
+    printer.success(messages.DAEMON_STOPPED)
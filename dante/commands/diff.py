@@ -0,0 +1,128 @@
+import os
+import sys
+import json
+
+from dante import messages
+from dante.config import current_settings
+from dante.core import environment
+from dante.core.printer import Printer
+from dante.core.models import PackageCollection
+from dante.core.operations import ADDED, REMOVED, environment_diff
+
+
+def diff_command(args, exit_on_failure=True):
+    """Display differences in packages and requirements between two
+        environments
+    :param args: Command arguments
+    :param exit_on_failure: Enable/disable exiting application on failure
+    :return: Whether the environments are equal
+    """
+    settings = current_settings()
+    ignore_list = list(args.ignore or settings.ignore_list)
+    paths = [args.environment] + ([args.other] if args.other else [])
+
+    printer = Printer()
+    invalid_paths = [path for path in paths if not os.path.exists(path)]
+    for path in invalid_paths:
+        printer.error(messages.ENVIRONMENT_NOT_FOUND.format(path=path))
+    if invalid_paths:
+        return sys.exit(1) if exit_on_failure else False
+
+    environments = [environment.load(path=path) for path in paths]
+    if len(environments) == 1:
+        # Compare with the environment in use if only one is provided
+        environments.append(environment.current_environment())
+
+    packages, other_packages = [
+        PackageCollection.installed_packages(
+            ignore_list=ignore_list, environment=environment_
+        )
+        for environment_ in environments
+    ]
+    diff = environment_diff(
+        packages=packages, other_packages=other_packages
+    )
+
+    package_changes = [
+        (
+            (package or other_package).key,
+            change,
+            package.version_id if package else None,
+            other_package.version_id if other_package else None,
+        )
+        for change, package, other_package, _, _ in diff
+    ]
+    requirement_changes = [
+        (
+            package.key,
+            requirement.key,
+            change,
+            str(requirement.specified_version),
+        )
+        for _, package, _, removed, added in diff
+        for change, requirements in ((REMOVED, removed), (ADDED, added))
+        for requirement in requirements
+    ]
+
+    if args.json:
+        print(json.dumps({
+            'packages': [
+                dict(zip(('package', 'change', 'old', 'new'), row))
+                for row in package_changes
+            ],
+            'requirements': [
+                dict(zip(('package', 'requirement', 'change', 'required'),
+                         row))
+                for row in requirement_changes
+            ],
+        }))
+    elif diff:
+        printer.error(messages.DIFF_FOUND)
+        printer.table(
+            headers=[
+                messages.PACKAGE,
+                messages.CHANGE,
+                messages.OLD,
+                messages.NEW,
+            ],
+            tabular_data=[
+                [
+                    printer.colored_message(
+                        message=key,
+                        message_color=printer.color_package
+                    ),
+                    change,
+                    old or '',
+                    new or '',
+                ]
+                for key, change, old, new in package_changes
+            ]
+        )
+        if requirement_changes:
+            printer.table(
+                headers=[
+                    messages.PACKAGE,
+                    messages.REQUIREMENT,
+                    messages.CHANGE,
+                    messages.REQUIRED,
+                ],
+                tabular_data=[
+                    [
+                        printer.colored_message(
+                            message=key,
+                            message_color=printer.color_package
+                        ),
+                        requirement_key,
+                        change,
+                        required,
+                    ]
+                    for key, requirement_key, change, required
+                    in requirement_changes
+                ]
+            )
+    else:
+        printer.success(messages.DIFF_OK)
+
+    if diff:
+        return sys.exit(1) if exit_on_failure else False
+    return True
@@ -0,0 +1,61 @@
+import sys
+from itertools import islice
+
+from dante import messages
+from dante.config import current_settings
+from dante.core.printer import Printer
+from dante.core.operations import iter_duplicate_packages
+
+
+def duplicates_command(args, exit_on_failure=True, printer=None):
+    """Runs detection of packages installed multiple times, where only the
+        first one found on the path is active
+    :param args: Command arguments
+    :param exit_on_failure: Enable/disable exiting application on failure
+    :param printer: Printer object
+    :return: None
+    """
+    settings = current_settings()
+    ignore_list = list(args.ignore or settings.ignore_list)
+    fail_fast = getattr(args, 'fail_fast', False)
+
+    printer = printer or Printer()
+    duplicates = islice(
+        iter_duplicate_packages(ignore_list=ignore_list),
+        # The first duplicate is enough to fail
+        1 if fail_fast else None
+    )
+
+    headers = [
+        messages.PACKAGE,
+        messages.INSTALLED,
+        messages.STATUS,
+        messages.LOCATION,
+    ]
+
+    tabular_data = [
+        [
+            printer.colored_message(
+                message=package.key,
+                message_color=printer.color_package
+            ),
+            package.version_id,
+            status,
+            package.obj.location,
+        ]
+        for active, shadowed in duplicates
+        for package, status in (
+            [(active, messages.ACTIVE)] +
+            [(package, messages.SHADOWED) for package in shadowed]
+        )
+    ]
+
+    if tabular_data:
+        printer.error(messages.DUPLICATES_FOUND)
+        printer.table(headers=headers, tabular_data=tabular_data)
+        if exit_on_failure:
+            sys.exit(1)
+        return False
+
+    printer.success(messages.DUPLICATES_OK)
+    return True
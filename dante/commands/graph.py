@@ -1,7 +1,7 @@
 import sys
 
 from dante import messages
-from dante.config import Config
+from dante.config import current_settings
 from dante.core.printer import Printer
 from dante.core.operations import (
     dependency_list,
@@ -17,18 +17,17 @@ def graph_command(args, packages=None, exit_on_failure=True):
     :param exit_on_failure: Enable/disable exiting application on failure
     :return: None
     """
-    ignore_list = (
-        args.ignore or Config.ignore_list or []
-    )
-
-    name = args.name or Config.graph_name
-    filename = args.filename or Config.graph_filename
-    file_format = args.format or Config.graph_format
-    engine = args.engine or Config.graph_engine
-    strict = args.strict or Config.graph_strict
-    graph_attr = args.graph_attr or Config.graph_attributes
-    node_attr = args.node_attr or Config.graph_node_attributes
-    edge_attr = args.edge_attr or Config.graph_edge_attributes
+    settings = current_settings()
+    ignore_list = list(args.ignore or settings.ignore_list)
+
+    name = args.name or settings.graph_name
+    filename = args.filename or settings.graph_filename
+    file_format = args.format or settings.graph_format
+    engine = args.engine or settings.graph_engine
+    strict = args.strict or settings.graph_strict
+    graph_attr = args.graph_attr or dict(settings.graph_attributes)
+    node_attr = args.node_attr or dict(settings.graph_node_attributes)
+    edge_attr = args.edge_attr or dict(settings.graph_edge_attributes)
     view = args.view or False
     render = args.render or False
 
@@ -1,5 +1,5 @@
 from dante import messages
-from dante.config import Config
+from dante.config import current_settings
 from dante.core.printer import Printer
 from dante.commands.utils import validate_files
 from dante.core.operations import dependency_list
@@ -13,12 +13,9 @@ def list_command(args, packages=None, exit_on_failure=True):
     :param exit_on_failure: Enable/disable exiting application on failure
     :return: None
     """
-    requirements_files = (
-        args.requirements or Config.requirements_files or []
-    )
-    ignore_list = (
-        args.ignore or Config.ignore_list or []
-    )
+    settings = current_settings()
+    requirements_files = list(args.requirements or settings.requirements_files)
+    ignore_list = list(args.ignore or settings.ignore_list)
 
     printer = Printer()
     if not validate_files(
@@ -1,6 +1,6 @@
 from dante import messages
 from dante.core import color
-from dante.config import Config
+from dante.config import current_settings
 from dante.core.printer import Printer
 from dante.commands.utils import validate_files
 from dante.core.models import RequirementCollection
@@ -14,14 +14,11 @@ def lock_command(args, packages=None, exit_on_failure=True):
     :param exit_on_failure: Enable/disable exiting application on failure
     :return: None
     """
-    requirements_files = (
-        args.requirements or Config.requirements_files or []
-    )
-    ignore_list = (
-        args.ignore or Config.ignore_list or []
-    )
+    settings = current_settings()
+    requirements_files = list(args.requirements or settings.requirements_files)
+    ignore_list = list(args.ignore or settings.ignore_list)
     save_lock = args.save or False
-    lock_filepath = args.file or Config.lock_file_path
+    lock_filepath = args.file or settings.lock_file_path
 
     printer = Printer()
     if not validate_files(
@@ -1,53 +1,57 @@
 import sys
+from itertools import islice
 
 from dante import messages
-from dante.config import Config
+from dante.config import current_settings
 from dante.core.printer import Printer
 from dante.core.models import RequirementCollection
 from dante.commands.utils import validate_files
-from dante.core.operations import dependency_list, missing_requirements
+from dante.core.operations import dependency_list, iter_missing_requirements
 
 
-def missing_requirements_command(args, packages=None, exit_on_failure=True):
+def missing_requirements_command(args, packages=None, exit_on_failure=True,
+                                 requirements=None, printer=None,
+                                 missing=None):
     """Runs detection of required packages that are not installed
     :param args: Command arguments
     :param packages: Collection of packages
     :param exit_on_failure: Enable/disable exiting application on failure
+    :param requirements: Collection of requirements, read from requirement
+        files if not provided
+    :param printer: Printer object
+    :param missing: Missing requirements, detected if not provided
     :return: None
     """
-    requirements_files = (
-        args.requirements or Config.requirements_files or []
-    )
-    ignore_list = (
-        args.ignore or Config.ignore_list or []
-    )
+    settings = current_settings()
+    requirements_files = list(args.requirements or settings.requirements_files)
+    ignore_list = list(args.ignore or settings.ignore_list)
+    fail_fast = getattr(args, 'fail_fast', False)
 
-    printer = Printer()
-    if not validate_files(
-            files=requirements_files,
-            printer=printer,
-            exit_on_failure=exit_on_failure):
-        return False
-
-    requirements = RequirementCollection()
-    for requirements_file in requirements_files:
-        requirements.extend(
-            RequirementCollection.from_file(filepath=requirements_file)
-        )
+    printer = printer or Printer()
+    if requirements is None:
+        if not validate_files(
+                files=requirements_files,
+                printer=printer,
+                exit_on_failure=exit_on_failure):
+            return False
 
-    packages = (
-        packages or dependency_list(ignore_list=ignore_list)
-    )
+        requirements = RequirementCollection()
+        for requirements_file in requirements_files:
+            requirements.extend(
+                RequirementCollection.from_file(filepath=requirements_file)
+            )
 
-    missing = [
-        (package, required_by)
-        for package, required_by
-        in missing_requirements(
+    if missing is None:
+        packages = (
+            packages or dependency_list(ignore_list=ignore_list)
+        )
+        missing = iter_missing_requirements(
             packages=packages,
             requirements=requirements,
             ignore_list=ignore_list
         )
-    ]
+    # The first missing requirement is enough to fail
+    missing = islice(missing, 1 if fail_fast else None)
 
     headers = [
         messages.PACKAGE,
@@ -0,0 +1,25 @@
+from dante import messages
+from dante.core.printer import Printer
+from dante.core.environment import current_environment
+from dante.core.snapshot import save_snapshot, to_json
+
+
+def snapshot_command(args):
+    """Display or save a snapshot of the environment's packages
+    :param args: Command arguments
+    :return: None
+    """
+    output = args.output
+
+    printer = Printer()
+    distributions = current_environment().working_set
+
+    if output:
+        save_snapshot(distributions=distributions, filepath=output)
+        printer.success(message=messages.SNAPSHOT_EXPORTED.format(
+            file_path=output
+        ))
+    else:
+        print(to_json(distributions=distributions))
+
+    return True
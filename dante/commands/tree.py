@@ -1,11 +1,14 @@
 import sys
 
 from dante import messages
-from dante.config import Config
+from dante.config import current_settings
 from dante.core.operations import (
+    TREE_CYCLIC,
+    TREE_REPEATED,
     dependency_list,
-    dependency_tree,
-    package_dependency_tree
+    tree_roots,
+    iter_dependency_tree,
+    iter_reverse_dependency_tree,
 )
 from dante.core.printer import Printer
 from dante.commands.utils import validate_files
@@ -19,33 +22,42 @@ def tree_command(args, packages=None, exit_on_failure=True):
     :param exit_on_failure: Enable/disable exiting application on failure
     :return: None
     """
+    settings = current_settings()
     package_key = args.package
-    requirements_files = (
-        args.requirements or Config.requirements_files or []
-    )
-    ignore_list = (
-        args.ignore or Config.ignore_list or []
-    )
+    max_depth = getattr(args, 'depth', None)
+    reverse = getattr(args, 'reverse', False)
+    requirements_files = list(args.requirements or settings.requirements_files)
+    ignore_list = list(args.ignore or settings.ignore_list)
 
     printer = Printer()
 
-    if not validate_files(
-            files=requirements_files,
-            printer=printer,
-            exit_on_failure=exit_on_failure
-    ):
-        return False
+    if reverse and not package_key:
+        printer.error(messages.TREE_REVERSE_PACKAGE)
+        sys.exit(1)
 
+    # Requirement files are used only for the tree of the entire environment
     requirements = RequirementCollection()
-    for requirements_file in requirements_files:
-        requirements.extend(
-            RequirementCollection.from_file(filepath=requirements_file)
-        )
+    if not package_key:
+        if not validate_files(
+                files=requirements_files,
+                printer=printer,
+                exit_on_failure=exit_on_failure
+        ):
+            return False
+
+        for requirements_file in requirements_files:
+            requirements.extend(
+                RequirementCollection.from_file(filepath=requirements_file)
+            )
 
     package_string = '{package} [{installed}: {version}]'
     requirement_string = (
         '{spacing}{package} [{installed}: {version} | {required}: {spec}]'
     )
+    marks = {
+        TREE_REPEATED: messages.TREE_REPEATED,
+        TREE_CYCLIC: messages.TREE_CYCLIC,
+    }
 
     packages = (
         packages or dependency_list(ignore_list=ignore_list)
@@ -58,50 +70,56 @@ def tree_command(args, packages=None, exit_on_failure=True):
                 messages.PACKAGE_NOT_FOUND.format(package=package_key)
             )
             sys.exit(1)
-
-        tree = {
-            package: package_dependency_tree(dependency=package)
-        }
+        roots = [package]
     else:
-        tree = dependency_tree(
+        roots = tree_roots(
             packages=packages,
             requirements=requirements if requirements else None
         )
 
-    if not tree:
+    if not roots:
         printer.info(messages.PACKAGES_NOT_FOUND)
 
-    def print_dependency_tree(requirements_list, indent=0):
-        spacing = ' ' * indent
-        for requirement in requirements_list:
-            printer.info(
-                requirement_string
-                .format(
-                    spacing=spacing,
-                    package=printer.colored_message(
-                        message=requirement.key,
-                        message_color=printer.color_package
-                    ),
-                    installed=messages.INSTALLED,
-                    version=requirement.version_id,
-                    required=messages.REQUIRED,
-                    spec=requirement.specified_version
-                ),
+    if reverse:
+        # Packages are shown with the versions of their parents they require
+        nodes = iter_reverse_dependency_tree(
+            dependency=roots[0], packages=packages, max_depth=max_depth
+        )
+        required = messages.REQUIRES
+    else:
+        nodes = (
+            (depth, dependency, dependency.specified_version, mark)
+            for depth, dependency, mark in iter_dependency_tree(
+                roots, max_depth=max_depth
+            )
+        )
+        required = messages.REQUIRED
+
+    def tree_lines():
+        for depth, dependency, spec, mark in nodes:
+            package = printer.colored_message(
+                message=dependency.key,
+                message_color=printer.color_package
             )
-            print_dependency_tree(requirements_list[requirement], indent + 2)
-
-    for dependency in tree:
-        printer.info(
-            package_string
-            .format(
-                package=printer.colored_message(
-                    message=dependency.key,
-                    message_color=printer.color_package
-                ),
+            if not depth:
+                yield package_string.format(
+                    package=package,
+                    installed=messages.INSTALLED,
+                    version=dependency.version
+                )
+                continue
+
+            line = requirement_string.format(
+                spacing=' ' * depth * 2,
+                package=package,
                 installed=messages.INSTALLED,
-                version=dependency.version
+                version=dependency.version_id,
+                required=required,
+                spec=spec
             )
-        )
-        print_dependency_tree(tree[dependency], indent=2)
+            yield '{} ({})'.format(line, marks[mark]) if mark else line
+
+    # Lines are printed while the tree is walked
+    printer.lines(tree_lines())
 
     return True
@@ -1,7 +1,14 @@
 import os
 import sys
 
+from dante import messages
+from dante.core import environment
 from dante.core.printer import Printer
+from dante.core.cache import file_hash
+
+# Requirement files parsed by this process, with hashes of their contents.
+# They are parsed again only if they change, e.g. while watching them.
+_parsed_files = {}
 
 
 def validate_files(files, printer=None, exit_on_failure=True):
@@ -23,3 +30,75 @@ def validate_files(files, printer=None, exit_on_failure=True):
         else sys.exit(1) if exit_on_failure
         else False
     )
+
+
+def read_requirement_files(filepaths, printer=None, standalone=False):
+    """Read requirement files, exiting the application if any of them is
+        invalid
+    :param filepaths: List of requirement file path lists, each read into a
+        single collection
+    :param printer: Printer object
+    :param standalone: Parse requirements without pkg_resources
+    :return: List of requirement collections
+    """
+    from dante.core.models import RequirementCollection
+
+    def read(filepath):
+        key = (os.path.abspath(filepath), standalone)
+        contents_hash = file_hash(filepath)
+        if _parsed_files.get(key, (None, None))[0] != contents_hash:
+            _parsed_files[key] = (
+                contents_hash,
+                RequirementCollection.from_file(
+                    filepath=filepath, standalone=standalone
+                )
+            )
+        return _parsed_files[key][1]
+
+    printer = printer or Printer()
+    try:
+        return [
+            RequirementCollection(
+                requirement for path in paths for requirement in read(path)
+            )
+            for paths in filepaths
+        ]
+    except Exception as e:
+        # Always exit on invalid requirements
+        printer.error('{}: {}'.format(messages.REQUIREMENTS_PARSING_ERROR, e))
+        sys.exit(1)
+
+
+def set_environment(args, printer=None):
+    """Set the environment inspected by commands from command arguments
+    :param args: Command arguments
+    :param printer: Printer object
+    :return: None
+    """
+    printer = printer or Printer()
+    site_packages = getattr(args, 'site_packages', None) or []
+    venv = getattr(args, 'venv', None)
+    snapshot = getattr(args, 'snapshot', None)
+
+    invalid_paths = [
+        path for path in site_packages if not os.path.isdir(path)
+    ]
+    if venv and not environment.venv_site_packages(venv=venv):
+        invalid_paths.append(venv)
+    if snapshot and not os.path.isfile(snapshot):
+        invalid_paths.append(snapshot)
+
+    for path in invalid_paths:
+        printer.error(messages.ENVIRONMENT_NOT_FOUND.format(path=path))
+    if invalid_paths:
+        sys.exit(1)
+
+    try:
+        environment.use(environment.create(
+            site_packages=site_packages, venv=venv, snapshot=snapshot
+        ))
+    except (ValueError, KeyError, TypeError) as e:
+        printer.error(messages.SNAPSHOT_INVALID.format(
+            file_path=snapshot, error=e
+        ))
+        sys.exit(1)
@@ -1,10 +1,10 @@
 import sys
+from functools import partial
 
 from dante import messages
-from dante.config import Config
+from dante.config import current_settings
 from dante.core.printer import Printer
-from dante.commands.utils import validate_files
-from dante.core.models import RequirementCollection
+from dante.commands.utils import validate_files, read_requirement_files
 from dante.core.operations import (
     dependency_list,
     unlocked_requirements,
@@ -12,88 +12,119 @@ from dante.core.operations import (
     lock_version_mismatch,
     required_version_mismatch,
     unnecessary_packages,
-    unnecessary_locks
+    unnecessary_locks,
+    validate_requirements,
+    validate_requirement_files,
+    first_validation_failure,
 )
 
 
-def validate_command(args, packages=None, exit_on_failure=True):
+def validate_command(args, packages=None, exit_on_failure=True,
+                     requirements=None, locked=None, printer=None,
+                     lock_version_mismatch=None):
     """Runs requirement file validation
     :param args: Command arguments
     :param packages: Collection of packages
     :param exit_on_failure: Enable/disable exiting application on failure
+    :param requirements: Collection of requirements, read from requirement
+        files if not provided
+    :param locked: Collection of locked requirements, read from lock files
+        if not provided
+    :param printer: Printer object
+    :param lock_version_mismatch: Lock version mismatches, detected if not
+        provided
     :return: None
     """
+    settings = current_settings()
     strict = args.strict or False
-    ignore_list = (
-        args.ignore or Config.ignore_list or []
-    )
-    requirements_files = (
-        args.requirements or Config.requirements_files or []
-    )
-    lock_files = (
-        args.lock or Config.lock_files or []
-    )
+    ignore_list = list(args.ignore or settings.ignore_list)
+    requirements_files = list(args.requirements or settings.requirements_files)
+    lock_files = list(args.lock or settings.lock_files)
+    fail_fast = getattr(args, 'fail_fast', False)
+    # Only requirement and lock files are compared, without reading the
+    # environment, which may not exist yet
+    files_only = getattr(args, 'files_only', False)
 
-    printer = Printer()
-    if not validate_files(
-            files=requirements_files,
-            printer=printer,
-            exit_on_failure=exit_on_failure
-        ) or not validate_files(
-            files=lock_files,
+    printer = printer or Printer()
+    if requirements is None or locked is None:
+        if not validate_files(
+                files=requirements_files,
+                printer=printer,
+                exit_on_failure=exit_on_failure
+            ) or not validate_files(
+                files=lock_files,
+                printer=printer,
+                exit_on_failure=exit_on_failure):
+            return False
+
+        requirements, locked = read_requirement_files(
+            filepaths=[requirements_files, lock_files],
             printer=printer,
-            exit_on_failure=exit_on_failure):
-        return False
-
-    try:
-        requirements = RequirementCollection.from_files(
-            filepaths=requirements_files
+            standalone=files_only,
         )
-        locked = RequirementCollection.from_files(filepaths=lock_files)
-    except Exception as e:
-        # Always exit on invalid requirements
-        printer.error('{}: {}'.format(messages.REQUIREMENTS_PARSING_ERROR, e))
-        sys.exit(1)
 
-    checks_ok = []
-    packages = (
-        packages or dependency_list(ignore_list=ignore_list)
-    )
+    if files_only:
+        packages = None
+        validation = validate_requirement_files(
+            requirements=requirements,
+            locked=locked,
+            ignore_list=ignore_list,
+        )
+    elif fail_fast:
+        packages = packages or dependency_list(ignore_list=ignore_list)
+        # Validations stop at the first failure
+        validation = first_validation_failure(
+            packages=packages,
+            requirements=requirements,
+            locked=locked,
+            ignore_list=ignore_list,
+            strict=strict,
+            lock_version_mismatch=lock_version_mismatch,
+        )
+    else:
+        packages = packages or dependency_list(ignore_list=ignore_list)
+        validation = validate_requirements(
+            packages=packages,
+            requirements=requirements,
+            locked=locked,
+            ignore_list=ignore_list,
+            lock_version_mismatch=lock_version_mismatch,
+        )
 
-    checks_ok.append(check_unlocked_requirements(
-        requirements=requirements,
-        printer=printer,
-    ))
-    checks_ok.append(check_unset_locks(
-        requirements=requirements,
-        locked=locked,
-        printer=printer,
-    ))
-    checks_ok.append(check_package_version_mismatch(
-        packages=packages,
-        locked=locked,
-        printer=printer,
-    ))
-    checks_ok.append(check_requirement_version_mismatch(
+    validations = [
+        partial(check_unlocked_requirements, requirements=requirements),
+        partial(check_unset_locks, requirements=requirements, locked=locked),
+    ]
+    if not files_only:
+        validations.append(partial(
+            check_package_version_mismatch, packages=packages, locked=locked
+        ))
+    validations.append(partial(
+        check_requirement_version_mismatch,
         requirements=requirements,
         locked=locked,
-        printer=printer,
     ))
-
-    if strict:
-        checks_ok.append(check_unnecessary_packages(
+    if strict and not files_only:
+        validations.append(partial(
+            check_unnecessary_packages,
             packages=packages,
             requirements=requirements,
             locked=locked,
-            printer=printer,
         ))
-        checks_ok.append(check_unnecessary_locks(
+    if strict:
+        validations.append(partial(
+            check_unnecessary_locks,
             requirements=requirements,
             locked=locked,
             ignore_list=ignore_list,
-            printer=printer,
         ))
 
+    checks_ok = []
+    for check in validations:
+        checks_ok.append(check(printer=printer, validation=validation))
+        if fail_fast and not checks_ok[-1]:
+            break
+
     return (
         sys.exit(1) if exit_on_failure else False
         if not all(checks_ok)
@@ -101,15 +132,19 @@ def validate_command(args, packages=None, exit_on_failure=True):
     )
 
 
-def check_unlocked_requirements(requirements, printer=None):
+def check_unlocked_requirements(requirements, printer=None, validation=None):
     """Run validation that checks if there are requirements that are not locked
         to a version
     :param requirements: Collection of requirements
     :param printer: Printer object
+    :param validation: Precomputed validation results
     :return: Whether the validation was successful
     """
     printer = printer or Printer()
-    requirements_unlocked = unlocked_requirements(requirements=requirements)
+    requirements_unlocked = (
+        validation.unlocked_requirements if validation else
+        unlocked_requirements(requirements=requirements)
+    )
 
     headers = [
         messages.PACKAGE,
@@ -139,16 +174,20 @@ def check_unlocked_requirements(requirements, printer=None):
     return True
 
 
-def check_unset_locks(requirements, locked, printer=None):
+def check_unset_locks(requirements, locked, printer=None, validation=None):
     """Run validation that checks if there are requirements missing in
         locked requirements
     :param requirements: Collection of requirements
     :param locked: Collection of locked requirements
     :param printer: Printer object
+    :param validation: Precomputed validation results
     :return: Whether the validation was successful
     """
     printer = printer or Printer()
-    locks_unset = unset_locks(requirements=requirements, locked=locked)
+    locks_unset = (
+        validation.unset_locks if validation else
+        unset_locks(requirements=requirements, locked=locked)
+    )
 
     headers = [
         messages.PACKAGE,
@@ -178,17 +217,20 @@ def check_unset_locks(requirements, locked, printer=None):
     return True
 
 
-def check_package_version_mismatch(packages, locked, printer=None):
+def check_package_version_mismatch(packages, locked, printer=None,
+                                   validation=None):
     """Run validation that checks if there are mismatches between installed
         packages and locked requirements
     :param packages: Collection of packages
     :param locked: Collection of locked requirements
     :param printer: Printer object
+    :param validation: Precomputed validation results
     :return: Whether the validation was successful
     """
     printer = printer or Printer()
-    locked_versions = lock_version_mismatch(
-        packages=packages, locked=locked
+    locked_versions = (
+        validation.lock_version_mismatch if validation else
+        lock_version_mismatch(packages=packages, locked=locked)
     )
 
     headers = [
@@ -221,18 +263,20 @@ def check_package_version_mismatch(packages, locked, printer=None):
     return True
 
 
-def check_requirement_version_mismatch(requirements, locked, printer=None):
+def check_requirement_version_mismatch(requirements, locked, printer=None,
+                                       validation=None):
     """Run validation that checks if there are version mismatches between
         requirements and locked requirements
     :param requirements: Collection of requirements
     :param locked: Collection of locked requirements
     :param printer: Printer object
+    :param validation: Precomputed validation results
     :return: Whether the validation was successful
     """
     printer = printer or Printer()
-    locked_versions = required_version_mismatch(
-        requirements=requirements,
-        locked=locked
+    locked_versions = (
+        validation.required_version_mismatch if validation else
+        required_version_mismatch(requirements=requirements, locked=locked)
     )
 
     headers = [
@@ -266,18 +310,22 @@ def check_requirement_version_mismatch(requirements, locked, printer=None):
 
 
 def check_unnecessary_packages(
-        packages, requirements, locked, printer=None):
+        packages, requirements, locked, printer=None, validation=None):
     """Run validation that checks if there are unnecessary installed packages
         in the environment that are not required by anything
     :param packages: Collection of packages
     :param requirements: Collection of requirements
     :param locked: Collection of locked requirements
     :param printer: Printer object
+    :param validation: Precomputed validation results
     :return: Whether the validation was successful
     """
     printer = printer or Printer()
-    lock_not_required = unnecessary_packages(
-        packages=packages, requirements=requirements, locked=locked
+    lock_not_required = (
+        validation.unnecessary_packages if validation else
+        unnecessary_packages(
+            packages=packages, requirements=requirements, locked=locked
+        )
     )
 
     headers = [
@@ -308,19 +356,24 @@ def check_unnecessary_packages(
     return True
 
 
-def check_unnecessary_locks(requirements, locked, ignore_list, printer=None):
+def check_unnecessary_locks(requirements, locked, ignore_list, printer=None,
+                            validation=None):
     """Run validation that checks if there are unnecessary locked requirements
         that are not required by anything
     :param requirements: Collection of requirements
     :param locked: Collection of locked requirements
     :param printer: Printer object
+    :param validation: Precomputed validation results
     :return: Whether the validation was successful
     """
     printer = printer or Printer()
-    lock_not_required = unnecessary_locks(
-        requirements=requirements,
-        locked=locked,
-        ignore_list=ignore_list,
+    lock_not_required = (
+        validation.unnecessary_locks if validation else
+        unnecessary_locks(
+            requirements=requirements,
+            locked=locked,
+            ignore_list=ignore_list,
+        )
     )
 
     headers = [
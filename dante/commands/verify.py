@@ -0,0 +1,72 @@
+import os
+import sys
+
+from dante import messages
+from dante.config import current_settings
+from dante.core.printer import Printer
+from dante.core.integrity import verify_packages
+from dante.core.operations import dependency_list
+
+
+def verify_command(args, packages=None, exit_on_failure=True):
+    """Runs verification of installed package files against package records
+    :param args: Command arguments
+    :param packages: Collection of packages
+    :param exit_on_failure: Enable/disable exiting application on failure
+    :return: None
+    """
+    settings = current_settings()
+    ignore_list = list(args.ignore or settings.ignore_list)
+
+    printer = Printer()
+    packages = (
+        packages or dependency_list(ignore_list=ignore_list)
+    )
+
+    verified, unverifiable = verify_packages(
+        packages=packages,
+        jobs=args.jobs,
+        sample=args.sample,
+        seed=args.seed,
+    )
+
+    headers = [
+        messages.PACKAGE,
+        messages.INSTALLED,
+        messages.STATUS,
+        messages.FILE,
+    ]
+
+    tabular_data = [
+        [
+            printer.colored_message(
+                message=package.key,
+                message_color=printer.color_package
+            ),
+            package.version_id,
+            status,
+            os.path.relpath(path, package.obj.location),
+        ]
+        for package, missing, modified, untracked in verified
+        for status, paths in (
+            (messages.MISSING, missing),
+            (messages.MODIFIED, modified),
+            (messages.UNTRACKED, untracked),
+        )
+        for path in paths
+    ]
+
+    if unverifiable:
+        printer.warning(messages.VERIFY_SKIPPED.format(
+            packages=', '.join(package.key for package in unverifiable)
+        ))
+
+    if tabular_data:
+        printer.error(messages.VERIFY_FOUND)
+        printer.table(headers=headers, tabular_data=tabular_data)
+        if exit_on_failure:
+            sys.exit(1)
+        return False
+
+    printer.success(messages.VERIFY_OK.format(count=len(verified)))
+    return True
@@ -0,0 +1,45 @@
+import os
+
+from dante import messages
+from dante.config import current_settings
+from dante.core import environment
+from dante.core.printer import Printer
+from dante.core.watcher import create_watcher
+from dante.commands.check import check_all
+
+
+def watch_command(args, printer=None):
+    """Runs checks whenever requirement files, lock files or installed
+        packages change, until interrupted
+    :param args: Command arguments
+    :param printer: Printer object
+    :return: None
+    """
+    settings = current_settings()
+    requirements_files = list(args.requirements or settings.requirements_files)
+    lock_files = list(args.lock or settings.lock_files)
+
+    printer = printer or Printer()
+    locations = environment.current_environment().locations()
+    watcher = create_watcher(
+        files=requirements_files + lock_files + [
+            path for path in locations if not os.path.isdir(path)
+        ],
+        directories=[path for path in locations if os.path.isdir(path)],
+        interval=args.interval,
+    )
+
+    with watcher:
+        try:
+            while True:
+                try:
+                    # Results of packages that did not change are reused
+                    check_all(args)
+                except SystemExit:
+                    # Failed checks are reported, watching continues
+                    pass
+                printer.info(messages.WATCHING)
+                watcher.wait(debounce=args.debounce)
+                environment.use(environment.current_environment().reload())
+        except KeyboardInterrupt:
+            return
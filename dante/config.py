@@ -1,13 +1,275 @@
 import os
 import json
-from copy import deepcopy
-from collections import OrderedDict
+import threading
+from contextlib import contextmanager
+from collections import OrderedDict, namedtuple
 from configparser import ConfigParser
 
+# Options of a configuration, in the order they are exported
+OPTIONS = [
+    'parser',
+    'any_version',
+    'checks',
+    'ignore_list',
+    'allow_named_versions',
+    'named_version_patterns',
+    'requirements_files',
+    'lock_files',
+    'lock_file_path',
+    'graph_name',
+    'graph_filename',
+    'graph_format',
+    'graph_engine',
+    'graph_attributes',
+    'graph_strict',
+    'graph_node_attributes',
+    'graph_edge_attributes',
+]
 
-class Config:
+# Stacks of settings used by each thread, see use_settings
+_local = threading.local()
+
+
+class Settings(namedtuple('Settings', ['directory'] + OPTIONS)):
+    """Immutable configuration of a single run. Lists are stored as tuples
+    and dictionaries as tuples of their items, so settings can be shared by
+    threads running with different configurations and sent to processes.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def create(cls, directory=None, **options):
+        """Create settings, freezing option values
+        :param directory: Project directory relative file paths are
+            resolved against, defaults to the current directory
+        :param options: Option values
+        :return: Settings object
+        """
+        def freeze(value):
+            if isinstance(value, (list, tuple)):
+                return tuple(value)
+            if isinstance(value, dict):
+                return tuple(value.items())
+            return value
+
+        return cls(
+            directory=os.path.abspath(directory or os.getcwd()),
+            **{option: freeze(value) for option, value in options.items()}
+        )
+
+    @classmethod
+    def defaults(cls, directory=None):
+        """Create default settings
+        :param directory: Project directory
+        :return: Settings object
+        """
+        return cls.create(directory=directory, **{
+            'parser': Config.DEFAULT_PARSER,
+            'any_version': Config.DEFAULT_ANY_VERSION,
+            'checks': Config.DEFAULT_CHECKS,
+            'ignore_list': Config.DEFAULT_IGNORE_LIST,
+            'allow_named_versions': Config.DEFAULT_ALLOW_NAMED_VERSIONS,
+            'named_version_patterns': Config.DEFAULT_NAMED_VERSION_PATTERNS,
+            'requirements_files': Config.DEFAULT_REQUIREMENTS_FILES,
+            'lock_files': Config.DEFAULT_LOCK_FILES,
+            'lock_file_path': Config.DEFAULT_LOCK_FILE_PATH,
+            'graph_name': Config.GRAPH_DEFAULT_NAME,
+            'graph_filename': Config.GRAPH_DEFAULT_FILENAME,
+            'graph_format': Config.GRAPH_DEFAULT_FORMAT,
+            'graph_engine': Config.GRAPH_DEFAULT_ENGINE,
+            'graph_attributes': Config.GRAPH_DEFAULT_ATTRIBUTES,
+            'graph_strict': Config.GRAPH_DEFAULT_STRICT,
+            'graph_node_attributes': Config.GRAPH_DEFAULT_NODE_ATTRIBUTES,
+            'graph_edge_attributes': Config.GRAPH_DEFAULT_EDGE_ATTRIBUTES,
+        })
+
+    @classmethod
+    def from_file(cls, directory=None, defaults=None):
+        """Read settings from the configuration file of a project
+        :param directory: Project directory, defaults to the current
+            directory
+        :param defaults: Settings used for options missing in the file,
+            defaults to default settings of the project
+        :return: Settings object
+        """
+        directory = os.path.abspath(directory or os.getcwd())
+        settings = (
+            defaults._replace(directory=directory) if defaults
+            else cls.defaults(directory=directory)
+        )
+        config_file = os.path.join(directory, Config.CONFIG_FILE_NAME)
+        if not os.path.exists(config_file):
+            # If config file does not exist use default config
+            return settings
+
+        parser = ConfigParser()
+        parser.read(config_file)
+        options = settings._asdict()
+        del options['directory']
+        section = Config.SECTION
+
+        if parser.has_section(section):
+            options['any_version'] = Config.get_option(
+                parser, section, 'any_version', settings.any_version
+            )
+            options['checks'] = Config.get_list(
+                parser, section, 'checks', settings.checks
+            )
+            options['ignore_list'] = Config.get_list(
+                parser, section, 'ignore_list', settings.ignore_list
+            )
+            allow_named_versions = Config.get_option(
+                parser,
+                section,
+                'allow_named_versions',
+                settings.allow_named_versions
+            )
+            options['allow_named_versions'] = (
+                str(allow_named_versions).lower() == 'true'
+            )
+            options['named_version_patterns'] = Config.get_list(
+                parser,
+                section,
+                'named_version_patterns',
+                settings.named_version_patterns
+            )
+            options['lock_file_path'] = Config.get_option(
+                parser,
+                section,
+                'lock_file_path',
+                settings.lock_file_path
+            )
+            options['requirements_files'] = [
+                settings.absolute_path(file_) for file_ in Config.get_list(
+                    parser,
+                    section,
+                    'requirements_files',
+                    settings.requirements_files
+                )
+            ]
+            options['lock_files'] = [
+                settings.absolute_path(file_) for file_ in Config.get_list(
+                    parser,
+                    section,
+                    'lock_files',
+                    settings.lock_files
+                )
+            ]
+            options['graph_name'] = Config.get_option(
+                parser, section, 'graph_name', settings.graph_name
+            )
+            options['graph_filename'] = Config.get_option(
+                parser, section, 'graph_filename', settings.graph_filename
+            )
+            options['graph_format'] = Config.get_option(
+                parser, section, 'graph_format', settings.graph_format
+            )
+            options['graph_engine'] = Config.get_option(
+                parser, section, 'graph_engine', settings.graph_engine
+            )
+            graph_strict = Config.get_option(
+                parser, section, 'graph_strict', settings.graph_strict
+            )
+            options['graph_strict'] = (
+                str(graph_strict).lower() == 'true'
+            )
+
+        for option, section, default in [
+                ('graph_attributes',
+                 Config.GRAPH_ATTRIBUTE_SECTION,
+                 Config.GRAPH_DEFAULT_ATTRIBUTES),
+                ('graph_node_attributes',
+                 Config.GRAPH_NODE_SECTION,
+                 Config.GRAPH_DEFAULT_NODE_ATTRIBUTES),
+                ('graph_edge_attributes',
+                 Config.GRAPH_EDGE_SECTION,
+                 Config.GRAPH_DEFAULT_EDGE_ATTRIBUTES)]:
+            if parser.has_section(section):
+                items = dict(default)
+                items.update(dict(parser.items(section=section)))
+                options[option] = items
+
+        return cls.create(directory=directory, **options)
+
+    def absolute_path(self, file_path):
+        """Get absolute path for a file
+        :param file_path: Path relative to the project directory
+        :return: Absolute path string
+        """
+        return os.path.join(self.directory, file_path)
+
+    def to_json(self):
+        """Return options in json format
+        :return: json string with options as keys
+        """
+        return json.dumps(OrderedDict((
+            ('dante', OrderedDict((
+                ('any_version', self.any_version),
+                ('checks', self.checks),
+                ('ignore_list', self.ignore_list),
+                ('allow_named_versions', self.allow_named_versions),
+                ('named_version_patterns', self.named_version_patterns),
+                ('lock_file_path', self.lock_file_path),
+                ('requirements_files', self.requirements_files),
+                ('lock_files', self.lock_files),
+                ('graph_name', self.graph_name),
+                ('graph_filename', self.graph_filename),
+                ('graph_format', self.graph_format),
+                ('graph_engine', self.graph_engine),
+                ('graph_strict', self.graph_strict)))),
+            ('graph_attributes', dict(self.graph_attributes)),
+            ('graph_node_attributes', dict(self.graph_node_attributes)),
+            ('graph_edge_attributes', dict(self.graph_edge_attributes)),
+            )), indent=4)
+
+
+def current_settings():
+    """Retrieve settings of the running context, which are the settings of
+        Config unless other settings are used
+    :return: Settings object
+    """
+    stack = getattr(_local, 'settings', None)
+    settings = stack[-1] if stack else None
+    return settings if settings is not None else Config.settings()
+
+
+@contextmanager
+def use_settings(settings=None):
+    """Use settings in the running context (e.g. a thread) until the end of
+        the block, without changing settings of other contexts
+    :param settings: Settings object, settings of Config are used if not
+        provided
+    :return: Context manager yielding the settings in use
+    """
+    stack = _local.__dict__.setdefault('settings', [])
+    stack.append(settings)
+    try:
+        yield current_settings()
+    finally:
+        stack.pop()
+
+
+class _ConfigType(type):
+    def __setattr__(cls, name, value):
+        """Discard settings created from previous options when an option
+            is changed
+        :param name: Attribute name
+        :param value: Attribute value
+        :return: None
+        """
+        super().__setattr__(name, value)
+        if name in OPTIONS:
+            super().__setattr__('_settings', None)
+
+
+class Config(metaclass=_ConfigType):
+    """Configuration of the command line, read from the configuration file
+    of the current directory. Options are not read directly, settings
+    created from them are used instead, see current_settings.
+    """
+    CONFIG_FILE_NAME = 'setup.cfg'
     PARENT_DIR = os.path.abspath(os.getcwd())
-    CONFIG_FILE = os.path.join(PARENT_DIR, 'setup.cfg')
+    CONFIG_FILE = os.path.join(PARENT_DIR, CONFIG_FILE_NAME)
 
     SECTION = 'dante'
     GRAPH_ATTRIBUTE_SECTION = 'dante:graph_attributes'
@@ -61,15 +323,8 @@ class Config:
     graph_node_attributes = GRAPH_DEFAULT_NODE_ATTRIBUTES
     graph_edge_attributes = GRAPH_DEFAULT_EDGE_ATTRIBUTES
 
-    def __getattribute__(self, item):
-        """Return a copy of the attribute if that attribute is a list or a dict
-        :param item: Requested attribute
-        :return: Attribute or copy of that attribute
-        """
-        if isinstance(item, list) or isinstance(item, dict):
-            return deepcopy(item)
-
-        return item
+    # Settings created from the options, see settings
+    _settings = None
 
     @staticmethod
     def absolute_path(file_path):
@@ -80,99 +335,53 @@ class Config:
         return os.path.join(Config.PARENT_DIR, file_path)
 
     @classmethod
-    def read_from_file(cls):
-        """Read and set configuration from file
-        :return: None
+    def settings(cls):
+        """Retrieve settings of current options. Settings are created only
+            when options change.
+        :return: Settings object
         """
-        if not os.path.exists(cls.CONFIG_FILE):
-            # If config file does not exist use default config
-            return
-
-        parser = ConfigParser()
-        parser.read(cls.CONFIG_FILE)
-
-        if parser.has_section(cls.SECTION):
-            cls.any_version = cls.get_option(
-                parser, cls.SECTION, 'any_version', cls.any_version
-            )
-            cls.checks = cls.get_list(
-                parser, cls.SECTION, 'checks', cls.checks
-            )
-            cls.ignore_list = cls.get_list(
-                parser, cls.SECTION, 'ignore_list', cls.ignore_list
-            )
-            allow_named_versions = cls.get_option(
-                parser,
-                cls.SECTION,
-                'allow_named_versions',
-                cls.allow_named_versions
-            )
-            cls.allow_named_versions = (
-                str(allow_named_versions).lower() == 'true'
-            )
-            cls.named_version_patterns = cls.get_list(
-                parser,
-                cls.SECTION,
-                'named_version_patterns',
-                cls.named_version_patterns
-            )
-            cls.lock_file_path = cls.get_option(
-                parser,
-                cls.SECTION,
-                'lock_file_path',
-                cls.lock_file_path
-            )
-            cls.requirements_files = [
-                cls.absolute_path(file_) for file_ in cls.get_list(
-                    parser,
-                    cls.SECTION,
-                    'requirements_files',
-                    cls.requirements_files
-                )
-            ]
-            cls.lock_files = [
-                cls.absolute_path(file_) for file_ in cls.get_list(
-                    parser,
-                    cls.SECTION,
-                    'lock_files',
-                    cls.lock_files
-                )
-            ]
-            cls.graph_name = cls.get_option(
-                parser, cls.SECTION, 'graph_name', cls.graph_name
-            )
-            cls.graph_filename = cls.get_option(
-                parser, cls.SECTION, 'graph_filename', cls.graph_filename
-            )
-            cls.graph_format = cls.get_option(
-                parser, cls.SECTION, 'graph_format', cls.graph_format
-            )
-            cls.graph_engine = cls.get_option(
-                parser, cls.SECTION, 'graph_engine', cls.graph_engine
-            )
-            graph_strict = cls.get_option(
-                parser, cls.SECTION, 'graph_strict', cls.graph_strict
-            )
-            cls.graph_strict = (
-                str(graph_strict).lower() == 'true'
+        if cls._settings is None:
+            cls._settings = Settings.create(
+                directory=cls.PARENT_DIR,
+                **{option: getattr(cls, option) for option in OPTIONS}
             )
+        return cls._settings
 
-        if parser.has_section(cls.GRAPH_ATTRIBUTE_SECTION):
-            items = cls.GRAPH_DEFAULT_ATTRIBUTES.copy()
-            items.update(dict(parser.items(
-                section=cls.GRAPH_ATTRIBUTE_SECTION
-            )))
-            cls.graph_attributes = items
+    @classmethod
+    def use(cls, settings):
+        """Set options from settings
+        :param settings: Settings object
+        :return: None
+        """
+        cls.PARENT_DIR = settings.directory
+        cls.CONFIG_FILE = os.path.join(cls.PARENT_DIR, cls.CONFIG_FILE_NAME)
+        for option in OPTIONS:
+            value = getattr(settings, option)
+            setattr(cls, option, (
+                dict(value) if option.endswith('attributes') else
+                list(value) if isinstance(value, tuple) else
+                value
+            ))
+        cls._settings = settings
 
-        if parser.has_section(cls.GRAPH_NODE_SECTION):
-            items = cls.GRAPH_DEFAULT_NODE_ATTRIBUTES.copy()
-            items.update(dict(parser.items(section=cls.GRAPH_NODE_SECTION)))
-            cls.graph_node_attributes = items
+    @classmethod
+    def reset(cls, directory=None):
+        """Reset configuration to defaults, e.g. before reading the
+            configuration of another project
+        :param directory: Project directory the configuration file is read
+            from, defaults to the current directory
+        :return: None
+        """
+        cls.use(Settings.defaults(directory=directory))
 
-        if parser.has_section(cls.GRAPH_EDGE_SECTION):
-            items = cls.GRAPH_DEFAULT_EDGE_ATTRIBUTES.copy()
-            items.update(dict(parser.items(section=cls.GRAPH_EDGE_SECTION)))
-            cls.graph_edge_attributes = items
+    @classmethod
+    def read_from_file(cls):
+        """Read and set configuration from file
+        :return: None
+        """
+        cls.use(Settings.from_file(
+            directory=cls.PARENT_DIR, defaults=cls.settings()
+        ))
 
     @staticmethod
     def get_option(parser, section, option, default):
@@ -202,8 +411,8 @@ class Config:
         try:
             if isinstance(result, str):
                 return [item for item in result.split('\n') if item]
-            if isinstance(result, list):
-                return result
+            if isinstance(result, (list, tuple)):
+                return list(result)
             return default
         except ValueError:
             return default
@@ -213,22 +422,4 @@ class Config:
         """Return options in json format
         :return: json string with options as keys
         """
-        return json.dumps(OrderedDict((
-            ('dante', OrderedDict((
-                ('any_version', cls.any_version),
-                ('checks', cls.checks),
-                ('ignore_list', cls.ignore_list),
-                ('allow_named_versions', cls.allow_named_versions),
-                ('named_version_patterns', cls.named_version_patterns),
-                ('lock_file_path', cls.lock_file_path),
-                ('requirements_files', cls.requirements_files),
-                ('lock_files', cls.lock_files),
-                ('graph_name', cls.graph_name),
-                ('graph_filename', cls.graph_filename),
-                ('graph_format', cls.graph_format),
-                ('graph_engine', cls.graph_engine),
-                ('graph_strict', cls.graph_strict)))),
-            ('graph_attributes', cls.graph_attributes),
-            ('graph_node_attributes', cls.graph_node_attributes),
-            ('graph_edge_attributes', cls.graph_edge_attributes),
-            )), indent=4)
+        return cls.settings().to_json()
@@ -0,0 +1,112 @@
+import os
+import json
+import hashlib
+
+from dante.version import __version__
+
+# Environment variable overriding the cache directory
+CACHE_DIR_VARIABLE = 'DANTE_CACHE_DIR'
+CACHE_FILE_FORMAT = '{key}.json'
+# Number of cached results kept, oldest are removed first
+MAX_ENTRIES = 64
+
+
+def cache_directory():
+    """Retrieve directory cached results are stored in
+    :return: Directory path
+    """
+    from dante.vendor.appdirs import user_cache_dir
+    return (
+        os.environ.get(CACHE_DIR_VARIABLE) or
+        user_cache_dir(appname='dante', appauthor=False)
+    )
+
+
+def file_hash(path):
+    """Hash file contents
+    :param path: File path
+    :return: Hex digest or None if the file can not be read
+    """
+    try:
+        with open(path, 'rb') as file_:
+            return hashlib.sha256(file_.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def path_fingerprint(paths):
+    """Create a fingerprint of path entries from their modification times,
+        which change whenever a package is installed or removed
+    :param paths: List of paths
+    :return: List of paths and modification times
+    """
+    fingerprint = []
+    for path in paths:
+        try:
+            fingerprint.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            fingerprint.append([path, None])
+    return fingerprint
+
+
+def cache_key(*parts):
+    """Create a cache key from json serializable parts, dante version is
+        always a part of the key
+    :param parts: Key parts
+    :return: Cache key
+    """
+    data = json.dumps([__version__] + list(parts), sort_keys=True)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def _cache_path(key, directory=None):
+    """Retrieve cache file path for a key
+    :param key: Cache key
+    :param directory: Cache directory
+    :return: Cache file path
+    """
+    return os.path.join(
+        directory or cache_directory(), CACHE_FILE_FORMAT.format(key=key)
+    )
+
+
+def load_result(key, directory=None):
+    """Load a cached result
+    :param key: Cache key
+    :param directory: Cache directory
+    :return: Cached result or None if there is no valid result for the key
+    """
+    try:
+        with open(_cache_path(key=key, directory=directory), 'r') as file_:
+            return json.load(file_)
+    except (OSError, ValueError):
+        return None
+
+
+def save_result(key, result, directory=None):
+    """Save a result to the cache, removing oldest results if there are too
+        many of them. Failing to write to the cache is not an error.
+    :param key: Cache key
+    :param result: Json serializable result
+    :param directory: Cache directory
+    :return: None
+    """
+    directory = directory or cache_directory()
+    path = _cache_path(key=key, directory=directory)
+    temporary_path = '{}.{}'.format(path, os.getpid())
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(temporary_path, 'w') as file_:
+            json.dump(result, file_)
+        # Concurrent runs never see partially written results
+        os.replace(temporary_path, path)
+
+        entries = sorted(
+            (entry for entry in os.scandir(directory)
+             if entry.name.endswith('.json')),
+            key=lambda entry: entry.stat().st_mtime
+        )
+        for entry in entries[:-MAX_ENTRIES]:
+            os.remove(entry.path)
+    except OSError:
+        pass
@@ -1,11 +1,39 @@
-from dante.vendor import colorama
+import os
+import re
+import sys
+import threading
+from contextlib import contextmanager
 
+# ANSI color codes, same as colorama.Fore ones. Colorama is imported only
+# when it's needed for translating them (see init).
+ANSI_FORMAT = '\033[{code}m'
 
-DEFAULT_ERROR = colorama.Fore.RED
-DEFAULT_PACKAGE = colorama.Fore.CYAN
-DEFAULT_SUCCESS = colorama.Fore.GREEN
-DEFAULT_WARNING = colorama.Fore.YELLOW
-DEFAULT_FOREGROUND = colorama.Fore.WHITE
+DEFAULT_ERROR = ANSI_FORMAT.format(code=31)
+DEFAULT_PACKAGE = ANSI_FORMAT.format(code=36)
+DEFAULT_SUCCESS = ANSI_FORMAT.format(code=32)
+DEFAULT_WARNING = ANSI_FORMAT.format(code=33)
+DEFAULT_FOREGROUND = ANSI_FORMAT.format(code=37)
+
+ANSI_PATTERN = re.compile(r'\033\[[0-9;]*m')
+
+# Stacks of colors used by each thread regardless of the output stream, e.g.
+# for output buffered by the daemon and written to a terminal by the client
+_local = threading.local()
+
+
+def init(stream=None):
+    """Initialize colorama when writing to a Windows console, which does not
+        support ANSI color codes
+    :param stream: Output stream, defaults to stdout
+    :return: Whether colorama was initialized
+    """
+    stream = stream or sys.stdout
+    if os.name != 'nt' or not stream.isatty():
+        return False
+
+    from dante.vendor import colorama
+    colorama.init()
+    return True
 
 
 def set_color(message, message_color, foreground_color):
@@ -20,3 +48,42 @@ def set_color(message, message_color, foreground_color):
         message=message,
         foreground_color=foreground_color
     )
+
+
+def strip(message):
+    """Remove color characters from a message
+    :param message: Message string
+    :return: Message without color characters
+    """
+    return ANSI_PATTERN.sub('', message)
+
+
+def enabled(stream=None):
+    """Check whether colors are used when writing to a stream
+    :param stream: Output stream, defaults to stdout
+    :return: Whether colors set with use_colors are used or the stream is a
+        terminal
+    """
+    stack = getattr(_local, 'colors', None)
+    colors = stack[-1] if stack else None
+    if colors is not None:
+        return colors
+
+    stream = stream or sys.stdout
+    isatty = getattr(stream, 'isatty', None)
+    return bool(isatty and isatty())
+
+
+@contextmanager
+def use_colors(colors=None):
+    """Use or disable colors regardless of output streams in the current
+        context
+    :param colors: Whether colors are used, streams decide if not provided
+    :return: None
+    """
+    stack = _local.__dict__.setdefault('colors', [])
+    stack.append(colors)
+    try:
+        yield
+    finally:
+        stack.pop()
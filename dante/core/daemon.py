@@ -0,0 +1,281 @@
+import os
+import sys
+import json
+import socket
+import hashlib
+
+from dante import messages
+from dante.core import color
+from dante.core.cache import cache_directory
+
+# Environment variable disabling forwarding of commands to the daemon
+NO_DAEMON_VARIABLE = 'DANTE_NO_DAEMON'
+SOCKET_FILE_FORMAT = 'daemon-{interpreter}.sock'
+# Seconds a client has to send it's request, connections are served one at a
+# time so a client that does not send it would block all other clients
+REQUEST_TIMEOUT = 5.0
+# Commands that keep running or stream their output are never forwarded
+LOCAL_COMMANDS = ['audit', 'daemon', 'watch']
+
+# Whether a command is being run by a daemon of this process, see Daemon.run
+_running_command = False
+
+
+def socket_path(directory=None):
+    """Retrieve path of the socket the daemon for the running interpreter
+        listens on. Daemons serve environments of their own interpreter, so
+        each interpreter has it's own daemon.
+    :param directory: Directory the socket is created in, defaults to the
+        cache directory
+    :return: Socket path
+    """
+    interpreter = hashlib.sha256(sys.executable.encode()).hexdigest()[:16]
+    return os.path.join(
+        directory or cache_directory(),
+        SOCKET_FILE_FORMAT.format(interpreter=interpreter)
+    )
+
+
+def _request(data, path=None):
+    """Send a request to the daemon
+    :param data: Json serializable request
+    :param path: Socket path
+    :return: Response or None if no daemon is running
+    """
+    path = path or socket_path()
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(path):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(path)
+            client.sendall(json.dumps(data).encode() + b'\n')
+            client.shutdown(socket.SHUT_WR)
+            with client.makefile('rb') as response:
+                return json.loads(response.read().decode())
+    except (OSError, ValueError):
+        # Daemon is not running anymore or was stopped mid request
+        return None
+
+
+def forward(argv, path=None):
+    """Run a command in the daemon if it's running, writing it's output
+    :param argv: Command line arguments
+    :param path: Socket path
+    :return: Exit code or None if the command was not run by the daemon
+    """
+    if os.environ.get(NO_DAEMON_VARIABLE):
+        return None
+
+    response = _request(path=path, data={
+        'argv': argv,
+        'prog': os.path.basename(sys.argv[0]),
+        'cwd': os.getcwd(),
+        'colors': color.enabled(),
+    })
+    if not response or response.get('local') or 'error' in response:
+        return None
+
+    sys.stdout.write(response['stdout'])
+    sys.stdout.flush()
+    sys.stderr.write(response['stderr'])
+    return response['code']
+
+
+def is_running(path=None):
+    """Check whether the daemon is running
+    :param path: Socket path
+    :return: Whether the daemon responded
+    """
+    return _request(data={'ping': True}, path=path) is not None
+
+
+def stop(path=None):
+    """Stop the daemon
+    :param path: Socket path
+    :return: Whether a daemon was running
+    """
+    return _request(data={'stop': True}, path=path) is not None
+
+
+def running_command():
+    """Check whether the running command is run by a daemon. Daemon keeps
+        it's socket and caches open, so commands do not fork processes.
+    :return: Whether a command is being run by a daemon
+    """
+    return _running_command
+
+
+def valid_request(request):
+    """Check whether a request can be served
+    :param request: Request data
+    :return: Whether the request is a ping, a stop or a command request with
+        command line arguments and a working directory
+    """
+    if not isinstance(request, dict):
+        return False
+    if request.get('ping') or request.get('stop'):
+        return True
+    return (
+        isinstance(request.get('argv'), list) and
+        all(isinstance(arg, str) for arg in request['argv']) and
+        isinstance(request.get('cwd'), str) and
+        isinstance(request.get('prog', ''), str)
+    )
+
+
+class Daemon:
+    """Server running commands in a single process, keeping environments,
+    parsed files and caches between commands
+    """
+
+    def __init__(self, path=None):
+        """Create daemon
+        :param path: Socket path
+        """
+        self.path = path or socket_path()
+        self.running = False
+        # Environments indexed by type and identity, with their fingerprints
+        self._environments = {}
+
+    def serve(self):
+        """Serve requests until the daemon is stopped
+        :return: None
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        if os.path.exists(self.path):
+            # Left by a daemon that did not stop cleanly
+            os.remove(self.path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o077)
+        try:
+            server.bind(self.path)
+        finally:
+            os.umask(umask)
+        server.listen(8)
+
+        self.running = True
+        try:
+            while self.running:
+                connection, _ = server.accept()
+                with connection:
+                    self._serve_connection(connection=connection)
+        finally:
+            server.close()
+            os.remove(self.path)
+
+    def _serve_connection(self, connection):
+        """Read a request from a connection and send the response
+        :param connection: Socket object
+        :return: None
+        """
+        connection.settimeout(REQUEST_TIMEOUT)
+        try:
+            with connection.makefile('rb') as request:
+                data = request.readline()
+            request = json.loads(data.decode())
+        except (OSError, ValueError):
+            # Timeouts are OSErrors as well
+            request = None
+
+        if not valid_request(request=request):
+            # Clients run commands locally when the daemon returns an error
+            response = {'error': messages.DAEMON_INVALID_REQUEST}
+        elif request.get('ping'):
+            response = {}
+        elif request.get('stop'):
+            self.running = False
+            response = {}
+        else:
+            response = self.run(
+                argv=request['argv'],
+                cwd=request['cwd'],
+                prog=request.get('prog', 'dante'),
+                colors=request.get('colors'),
+            )
+
+        try:
+            connection.sendall(json.dumps(response).encode())
+        except OSError:
+            # Client is gone, e.g. it was interrupted
+            pass
+
+    def use_environment(self):
+        """Replace the environment set by the command arguments with the one
+            kept from previous commands, reloaded if it changed since
+        :return: None
+        """
+        from dante.core import environment
+
+        created = environment.current_environment()
+        identity = created.identity()
+        if identity is None:
+            return
+
+        key = json.dumps([type(created).__name__, identity])
+        kept, fingerprint = self._environments.get(key, (created, None))
+        current_fingerprint = kept.fingerprint()
+        if fingerprint is not None and current_fingerprint != fingerprint:
+            kept = kept.reload()
+            current_fingerprint = kept.fingerprint()
+        self._environments[key] = (kept, current_fingerprint)
+        environment.use(kept)
+
+    def run(self, argv, cwd, prog='dante', colors=None):
+        """Run a command as it would run in the directory it was started in
+        :param argv: Command line arguments
+        :param cwd: Working directory of the command
+        :param prog: Program name shown in usage messages
+        :param colors: Whether output of the client is a terminal
+        :return: Command output, exit code or whether the command has to
+            be run locally
+        """
+        global _running_command
+        import io
+        import traceback
+        from contextlib import redirect_stdout, redirect_stderr
+
+        from dante.cli import cli
+        from dante.config import Settings, use_settings
+        from dante.commands.utils import set_environment
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        code = 0
+        # Commands change the working directory and arguments of the daemon,
+        # they are restored for the next command
+        previous_cwd, previous_argv = os.getcwd(), sys.argv
+        _running_command = True
+        try:
+            with redirect_stdout(stdout), redirect_stderr(stderr), \
+                    color.use_colors(colors):
+                try:
+                    os.chdir(cwd)
+                    sys.argv = [prog] + argv
+                    with use_settings(Settings.from_file(directory=cwd)):
+                        parser = cli()
+                        args = parser.parse_args(argv)
+                        if getattr(args, 'command', None) in LOCAL_COMMANDS:
+                            return {'local': True}
+
+                        set_environment(args)
+                        self.use_environment()
+                        (
+                            args.func(args) if hasattr(args, 'func')
+                            else parser.print_help()
+                        )
+                except SystemExit as e:
+                    code = 0 if e.code is None else e.code
+                except Exception:
+                    traceback.print_exc()
+                    code = 1
+        finally:
+            os.chdir(previous_cwd)
+            sys.argv = previous_argv
+            _running_command = False
+
+        return {
+            'stdout': stdout.getvalue(),
+            'stderr': stderr.getvalue(),
+            'code': code,
+        }
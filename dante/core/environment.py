@@ -0,0 +1,655 @@
+import os
+import sys
+import glob
+import time
+from functools import lru_cache
+from collections import OrderedDict
+
+from dante.core.cache import file_hash, path_fingerprint
+from dante.core.snapshot import (
+    SnapshotDistribution,
+    SnapshotWorkingSet,
+    load_snapshot,
+)
+
+# Locations of site-packages directories relative to a virtualenv root
+SITE_PACKAGES_PATTERNS = [
+    os.path.join('lib', 'python*', 'site-packages'),
+    os.path.join('lib64', 'python*', 'site-packages'),
+    os.path.join('Lib', 'site-packages'),
+]
+# Names of directories packages are installed in, e.g. in image filesystems
+SITE_PACKAGES_NAMES = ['site-packages', 'dist-packages']
+
+# Files of metadata directories packages and their requirements are read
+# from, which can be edited in place (e.g. by develop installs)
+METADATA_FILES = ['METADATA', 'PKG-INFO', 'requires.txt']
+
+# Environment used by default
+_environment = None
+
+
+def venv_site_packages(venv):
+    """Retrieve site-packages directories of a virtualenv
+    :param venv: Virtualenv root path
+    :return: List of site-packages paths
+    """
+    venv = os.path.abspath(venv)
+    paths = []
+    real_paths = set()
+    for pattern in SITE_PACKAGES_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(venv, pattern))):
+            # lib64 is usually a symlink to lib
+            if os.path.isdir(path) and real_path(path) not in real_paths:
+                real_paths.add(real_path(path))
+                paths.append(path)
+    return paths
+
+
+@lru_cache(maxsize=None)
+def real_path(path):
+    """Resolve and cache the real path of a path entry
+    :param path: Path
+    :return: Real path
+    """
+    return os.path.normcase(os.path.realpath(path))
+
+
+def _read_lines(path):
+    """Read non-empty lines that are not comments from a file
+    :param path: File path
+    :return: List of lines
+    """
+    try:
+        with open(path, 'r') as file_:
+            return [
+                line.strip() for line in file_
+                if line.strip() and not line.startswith('#')
+            ]
+    except (OSError, UnicodeDecodeError):
+        return []
+
+
+def _scan_directory(path, site=False):
+    """Find distributions in a directory with a single listing, including
+        editable installs referenced by .egg-link files
+    :param path: Directory path
+    :param site: Whether the directory is a site directory, in which case
+        path entries from .pth files are resolved as well
+    :return: List of distributions and path entries added by .pth files
+    """
+    from dante.vendor import pkg_resources
+
+    distributions = []
+    metadata_entries = []
+    site_paths = []
+
+    for entry in pkg_resources.safe_listdir(path):
+        lower = entry.lower()
+        fullpath = os.path.join(path, entry)
+        if lower.endswith(('.dist-info', '.egg-info')):
+            metadata_entries.append(entry)
+        elif lower.endswith('.egg-link'):
+            # Editable install, referencing a project directory
+            for link in _read_lines(fullpath)[:1]:
+                distributions.extend(pkg_resources.find_distributions(
+                    os.path.join(path, link), True
+                ))
+        elif site and lower.endswith('.pth'):
+            # Lines starting with import are executed, e.g. finders of
+            # editable installs, which have their metadata on the path
+            site_paths.extend(
+                os.path.normpath(os.path.join(path, line))
+                for line in _read_lines(fullpath)
+                if not line.startswith(('import ', 'import\t'))
+            )
+
+    # noinspection PyProtectedMember
+    for entry in pkg_resources._by_version_descending(metadata_entries):
+        distributions.extend(pkg_resources.distributions_from_metadata(
+            os.path.join(path, entry)
+        ))
+
+    return distributions, sorted(site_paths)
+
+
+def metadata_path(distribution):
+    """Retrieve the path of distribution's metadata
+    :param distribution: Distribution object
+    :return: Real path of metadata directory or distribution location
+    """
+    return real_path(
+        getattr(distribution, 'egg_info', None) or distribution.location
+    )
+
+
+def metadata_fingerprint(paths, sites=False):
+    """Create a fingerprint of distribution metadata on path entries,
+        including editable installs referenced by .egg-link and .pth files.
+        Unlike fingerprints of path entries, it changes when metadata files
+        are edited in place.
+    :param paths: List of path entries
+    :param sites: Whether the path entries are site directories, whose .pth
+        files add path entries
+    :return: List of metadata paths and their modification times
+    """
+    metadata_paths = []
+    scanned = set()
+    pending = [(path, sites) for path in reversed(paths)]
+    while pending:
+        path, site = pending.pop()
+        if real_path(path) in scanned or not os.path.isdir(path):
+            continue
+        scanned.add(real_path(path))
+
+        try:
+            entries = sorted(os.listdir(path))
+        except OSError:
+            continue
+
+        linked_paths = []
+        for entry in entries:
+            lower = entry.lower()
+            fullpath = os.path.join(path, entry)
+            if lower.endswith(('.dist-info', '.egg-info')):
+                metadata_paths.append(fullpath)
+                metadata_paths.extend(
+                    os.path.join(fullpath, name) for name in METADATA_FILES
+                )
+            elif lower.endswith('.egg-link'):
+                metadata_paths.append(fullpath)
+                linked_paths.extend(
+                    os.path.join(path, link)
+                    for link in _read_lines(fullpath)[:1]
+                )
+            elif site and lower.endswith('.pth'):
+                linked_paths.extend(
+                    os.path.normpath(os.path.join(path, line))
+                    for line in _read_lines(fullpath)
+                    if not line.startswith(('import ', 'import\t'))
+                )
+        pending.extend(
+            (linked_path, False) for linked_path in reversed(linked_paths)
+        )
+
+    return path_fingerprint(paths=metadata_paths)
+
+
+def _modified_since(path, since):
+    """Check whether distribution metadata was modified since a point in
+        time, including metadata files edited in place
+    :param path: Metadata path
+    :param since: Time in nanoseconds
+    :return: Whether the metadata was modified or can not be read
+    """
+    try:
+        if os.stat(path).st_mtime_ns >= since:
+            return True
+    except OSError:
+        return True
+
+    for name in METADATA_FILES:
+        try:
+            if os.stat(os.path.join(path, name)).st_mtime_ns >= since:
+                return True
+        except OSError:
+            # Metadata directories have only some of the files
+            continue
+    return False
+
+
+def scan(paths, sites=False, previous=None):
+    """Scan distribution metadata on all path entries in a single pass,
+        without importing anything from them. Only the first distribution
+        found for a key is active, as with sys.path.
+    :param paths: List of path entries (e.g. site-packages directories)
+    :param sites: Whether the path entries are site directories, whose .pth
+        files add path entries
+    :param previous: Distributions found by a previous scan indexed by key
+        and the time the scan started in nanoseconds. Distributions whose
+        metadata did not change since are reused, with requirements they
+        already parsed.
+    :return: Working set object and all found distributions indexed by key
+    """
+    from dante.vendor import pkg_resources
+
+    working_set = pkg_resources.WorkingSet(entries=[])
+    index = OrderedDict()
+    scanned = set()
+    found = set()
+    previous_index, previous_time = previous or ({}, None)
+    reusable = {
+        metadata_path(distribution): distribution
+        for distributions in previous_index.values()
+        for distribution in distributions
+    }
+
+    # Path entries added by .pth files follow their site directory
+    pending = [(path, sites) for path in reversed(paths)]
+    while pending:
+        path, site = pending.pop()
+        working_set.entry_keys.setdefault(path, [])
+        working_set.entries.append(path)
+
+        # The same directory can be on the path multiple times
+        if real_path(path) in scanned:
+            continue
+        scanned.add(real_path(path))
+
+        # noinspection PyProtectedMember
+        if os.path.isdir(path) and not pkg_resources._is_unpacked_egg(path):
+            distributions, site_paths = _scan_directory(path, site=site)
+            pending.extend(
+                (site_path, False) for site_path in reversed(site_paths)
+            )
+        else:
+            distributions = pkg_resources.find_distributions(path, True)
+
+        for distribution in distributions:
+            # Editable installs can be found both through .egg-link and
+            # .pth files
+            path_found = metadata_path(distribution)
+            if path_found in found:
+                continue
+            found.add(path_found)
+
+            if path_found in reusable and not _modified_since(
+                    path=path_found, since=previous_time):
+                distribution = reusable[path_found]
+
+            working_set.add(distribution, path, False)
+            index.setdefault(distribution.key, []).append(distribution)
+
+    return working_set, index
+
+
+class Environment:
+    """Base environment class providing installed distributions. Add new
+    environments by inheriting this class.
+    """
+    _working_set = None
+    _index = None
+
+    @property
+    def working_set(self):
+        """Retrieve working set with active distributions, which can be
+            iterated and has distributions mapped by their keys
+        :return: Working set object
+        """
+        return self._working_set
+
+    @property
+    def index(self):
+        """Retrieve all distributions found in the environment, including the
+            ones shadowed by other distributions with the same key
+        :return: Distributions indexed by key, active distribution first
+        """
+        if self._index is None:
+            self._index = OrderedDict(
+                (distribution.key, [distribution])
+                for distribution in self.working_set
+            )
+        return self._index
+
+    def distributions(self):
+        """Retrieve active distributions
+        :return: Distribution iterator
+        """
+        return iter(self.working_set)
+
+    def get(self, key):
+        """Retrieve active distribution with the provided key
+        :param key: Distribution key
+        :return: Distribution object or None if it is not installed
+        """
+        return self.working_set.by_key.get(key)
+
+    def fingerprint(self):
+        """Retrieve a fingerprint that changes when distributions in the
+            environment change, without inspecting the distributions
+        :return: Json serializable fingerprint or None if the environment
+            can not be fingerprinted
+        """
+        return None
+
+    def identity(self):
+        """Retrieve an identity of the environment, which stays the same when
+            distributions in the environment change
+        :return: Json serializable identity or None if the environment can
+            not be identified
+        """
+        return None
+
+    def locations(self):
+        """Retrieve paths distributions of the environment are found on,
+            which change when the distributions change
+        :return: List of directory and file paths
+        """
+        return []
+
+    def reload(self):
+        """Retrieve the environment with distributions as they are now
+        :return: Environment object
+        """
+        return self
+
+
+class LiveEnvironment(Environment):
+    """Environment of the running interpreter"""
+
+    def __init__(self):
+        """Create environment of the running interpreter"""
+        # Time the working set was built in nanoseconds, distributions
+        # modified since are scanned again when the environment is reloaded
+        self._scan_time = None
+
+    @property
+    def working_set(self):
+        """Retrieve working set of the running interpreter, which is built
+            when pkg_resources is first imported, or when the environment is
+            reloaded
+        :return: Working set object
+        """
+        if self._working_set is None:
+            if self._scan_time is None:
+                # The working set is built when pkg_resources is imported,
+                # which could have been done by anything before. Nothing is
+                # reused on reload in that case, since the time is unknown.
+                self._scan_time = (
+                    0 if 'dante.vendor.pkg_resources' in sys.modules
+                    else int(time.time() * 1e9)
+                )
+            from dante.vendor import pkg_resources
+            return pkg_resources.working_set
+        return self._working_set
+
+    @property
+    def index(self):
+        """Retrieve all distributions found on the interpreter's path
+        :return: Distributions indexed by key, active distribution first
+        """
+        if self._index is None:
+            _, self._index = scan(paths=self.working_set.entries)
+        return self._index
+
+    def fingerprint(self):
+        """Retrieve fingerprint of the interpreter's path entries, which the
+            working set is built from, and distribution metadata on them
+        :return: Fingerprint
+        """
+        return [
+            sys.executable,
+            path_fingerprint(paths=sys.path),
+            metadata_fingerprint(paths=sys.path),
+        ]
+
+    def identity(self):
+        """Retrieve identity of the interpreter and it's path entries
+        :return: Identity
+        """
+        return [sys.executable, sys.path]
+
+    def locations(self):
+        """Retrieve the interpreter's path entries
+        :return: List of directory paths
+        """
+        return [path for path in sys.path if os.path.isdir(path)]
+
+    def reload(self):
+        """Scan the interpreter's path entries again, reusing distributions
+            that did not change
+        :return: Environment object
+        """
+        previous = self._index or OrderedDict(
+            (distribution.key, [distribution])
+            for distribution in self.working_set
+        )
+        environment = LiveEnvironment()
+        environment._scan_time = int(time.time() * 1e9)
+        environment._working_set, environment._index = scan(
+            paths=self.working_set.entries,
+            previous=(previous, self._scan_time),
+        )
+        return environment
+
+
+class PathEnvironment(Environment):
+    """Environment scanned from path entries, without importing anything"""
+
+    def __init__(self, paths, sites=True):
+        """Create environment from path entries
+        :param paths: List of path entries (e.g. site-packages directories)
+        :param sites: Whether the path entries are site directories
+        """
+        self.paths = [os.path.abspath(path) for path in paths]
+        self.sites = sites
+        self._previous = None
+        self._scan_time = None
+
+    def _scan(self):
+        """Scan path entries on first use
+        :return: None
+        """
+        if self._working_set is None:
+            self._scan_time = int(time.time() * 1e9)
+            self._working_set, self._index = scan(
+                paths=self.paths, sites=self.sites, previous=self._previous
+            )
+            self._previous = None
+
+    @property
+    def working_set(self):
+        """Retrieve working set with active distributions
+        :return: Working set object
+        """
+        self._scan()
+        return self._working_set
+
+    @property
+    def index(self):
+        """Retrieve all distributions found on path entries
+        :return: Distributions indexed by key, active distribution first
+        """
+        self._scan()
+        return self._index
+
+    def fingerprint(self):
+        """Retrieve fingerprint of path entries and distribution metadata on
+            them
+        :return: Fingerprint
+        """
+        return [
+            path_fingerprint(paths=self.paths),
+            metadata_fingerprint(paths=self.paths, sites=self.sites),
+        ]
+
+    def identity(self):
+        """Retrieve identity of path entries
+        :return: Identity
+        """
+        return self.paths
+
+    def locations(self):
+        """Retrieve path entries
+        :return: List of directory paths
+        """
+        return self.paths
+
+    def reload(self):
+        """Create the environment again, reusing distributions that did not
+            change
+        :return: Environment object
+        """
+        environment = PathEnvironment(paths=self.paths, sites=self.sites)
+        if self._working_set is not None:
+            environment._previous = (self._index, self._scan_time)
+        return environment
+
+
+class SnapshotEnvironment(Environment):
+    """Environment loaded from a snapshot file"""
+
+    def __init__(self, filepath):
+        """Create environment from a snapshot file
+        :param filepath: Snapshot file path
+        """
+        self.filepath = filepath
+        self._working_set = load_snapshot(filepath=filepath)
+
+    def fingerprint(self):
+        """Retrieve fingerprint of the snapshot file
+        :return: Fingerprint
+        """
+        return [os.path.abspath(self.filepath), file_hash(self.filepath)]
+
+    def identity(self):
+        """Retrieve identity of the snapshot file, snapshots are not changed
+            in place so their contents are a part of it
+        :return: Identity
+        """
+        return self.fingerprint()
+
+    def locations(self):
+        """Retrieve the snapshot file path
+        :return: List with the file path
+        """
+        return [os.path.abspath(self.filepath)]
+
+    def reload(self):
+        """Load the snapshot file again
+        :return: Environment object
+        """
+        return SnapshotEnvironment(filepath=self.filepath)
+
+
+class FakeEnvironment(Environment):
+    """In-memory environment, e.g. for experiments and tests"""
+
+    def __init__(self, packages=None):
+        """Create environment from a dict of package names mapped to their
+            versions or to tuples of versions and requirement strings, e.g.
+            {'package1': ('1.0.0', ['package2>=2.0']), 'package2': '2.1'}
+        :param packages: Package dict
+        """
+        distributions = []
+        for name, data in (packages or {}).items():
+            version, requires = (
+                data if isinstance(data, tuple) else (data, [])
+            )
+            distributions.append(SnapshotDistribution(
+                name=name, version=version, requires=requires
+            ))
+        self._working_set = SnapshotWorkingSet(distributions)
+
+
+def environment_paths(site_packages=None, venv=None):
+    """Retrieve path entries for a target environment
+    :param site_packages: List of site-packages paths
+    :param venv: Virtualenv root path
+    :return: List of path entries
+    """
+    paths = venv_site_packages(venv=venv) if venv else []
+    paths.extend(site_packages or [])
+    return paths
+
+
+def create(site_packages=None, venv=None, snapshot=None):
+    """Create an environment from paths or a snapshot file. Running
+        interpreter's environment is used if no paths or snapshot are
+        provided.
+    :param site_packages: List of site-packages paths
+    :param venv: Virtualenv root path
+    :param snapshot: Snapshot file path
+    :return: Environment object
+    """
+    if snapshot:
+        return SnapshotEnvironment(filepath=snapshot)
+
+    paths = environment_paths(site_packages=site_packages, venv=venv)
+    return PathEnvironment(paths=paths) if paths else LiveEnvironment()
+
+
+def load(path):
+    """Create an environment for an environment path, which can be a snapshot
+        file, a virtualenv or a site-packages directory
+    :param path: Environment path
+    :return: Environment object
+    """
+    if os.path.isfile(path):
+        return SnapshotEnvironment(filepath=path)
+    return PathEnvironment(paths=venv_site_packages(venv=path) or [path])
+
+
+def _has_distributions(directory):
+    """Check whether a directory contains distribution metadata
+    :param directory: Directory path
+    :return: Whether distributions are installed in the directory
+    """
+    try:
+        entries = os.listdir(directory)
+    except OSError:
+        return False
+    return any(
+        entry.lower().endswith(('.dist-info', '.egg-info', '.egg-link'))
+        for entry in entries
+    )
+
+
+def discover(roots):
+    """Find environments under root paths: virtualenvs and site-packages
+        directories that are not a part of a virtualenv. Roots that are files
+        are used as snapshots and root directories with distributions are
+        used as site-packages directories if no environments are found
+        under them.
+    :param roots: List of root paths
+    :return: List of environment paths, which can be loaded with load
+    """
+    paths = []
+    real_paths = set()
+
+    def add(path):
+        if real_path(path) not in real_paths:
+            real_paths.add(real_path(path))
+            paths.append(os.path.abspath(path))
+
+    for root in roots:
+        if os.path.isfile(root):
+            add(root)
+            continue
+
+        found = len(paths)
+        for directory, subdirectories, _ in os.walk(root):
+            if (os.path.isfile(os.path.join(directory, 'pyvenv.cfg')) and
+                    venv_site_packages(venv=directory)):
+                add(directory)
+            elif os.path.basename(directory) in SITE_PACKAGES_NAMES:
+                add(directory)
+            else:
+                subdirectories.sort()
+                continue
+            # Environments are not searched for other environments
+            subdirectories.clear()
+
+        if len(paths) == found and _has_distributions(directory=root):
+            add(root)
+    return paths
+
+
+def use(environment=None):
+    """Set the environment used by default for retrieving installed packages
+    :param environment: Environment object, running interpreter's
+        environment is used if not provided
+    :return: None
+    """
+    global _environment
+    _environment = environment
+
+
+def current_environment():
+    """Retrieve the environment used by default
+    :return: Environment object
+    """
+    global _environment
+    if _environment is None:
+        _environment = LiveEnvironment()
+    return _environment
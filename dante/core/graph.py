@@ -1,5 +1,4 @@
-from dante.config import Config
-from dante.vendor import graphviz
+from dante.config import current_settings
 
 NODE_FORMAT = (
     '<<table border="0">'
@@ -25,19 +24,21 @@ def create_dependency_graph(packages=None, name=None, filename=None,
     :param edge_attr: Edge attributes
     :return: Graph filepath
     """
-    name = name or Config.graph_name
-    filename = filename or Config.graph_filename
-    file_format = file_format or Config.graph_format
-    engine = engine or Config.graph_engine
-    strict = strict or Config.graph_strict
-    graph_attr = graph_attr or Config.graph_attributes
-    node_attr = node_attr or Config.graph_node_attributes
-    edge_attr = edge_attr or Config.graph_edge_attributes
+    settings = current_settings()
+    name = name or settings.graph_name
+    filename = filename or settings.graph_filename
+    file_format = file_format or settings.graph_format
+    engine = engine or settings.graph_engine
+    strict = strict or settings.graph_strict
+    graph_attr = graph_attr or dict(settings.graph_attributes)
+    node_attr = node_attr or dict(settings.graph_node_attributes)
+    edge_attr = edge_attr or dict(settings.graph_edge_attributes)
 
     # Use current directory if filename is not provided
     if not filename:
         filename = name
 
+    from dante.vendor import graphviz
     graph = graphviz.Digraph(
         name=name,
         filename=filename,
@@ -0,0 +1,241 @@
+import os
+from collections import OrderedDict, namedtuple
+
+from dante.config import current_settings
+from dante.core.cache import path_fingerprint
+from dante.core.models import RequiredVersion, RequirementCollection
+from dante.core.environment import METADATA_FILES, current_environment
+from dante.core.operations import conflict_options, missing_requirements
+
+# Version of the stored state format, states of other versions are not used
+STATE_VERSION = 2
+
+IncrementalResult = namedtuple('IncrementalResult', [
+    'conflicts',
+    'missing',
+    'lock_version_mismatch',
+    'affected_packages',
+])
+
+
+def package_state(package):
+    """Retrieve state of a package, which changes when the package is
+        upgraded, downgraded or reinstalled or it's metadata files are
+        edited in place, without parsing it's requirements
+    :param package: Package object
+    :return: Package version and modification times of it's metadata
+    """
+    metadata_path = getattr(package.obj, 'egg_info', None)
+    return [
+        package.version_id,
+        [
+            mtime for _, mtime in path_fingerprint(paths=[metadata_path] + [
+                os.path.join(metadata_path, name) for name in METADATA_FILES
+            ])
+        ] if metadata_path else None,
+    ]
+
+
+def requirement_edges(package):
+    """Retrieve all requirements of a package, including ignored ones
+    :param package: Package object
+    :return: List of requirement keys and required versions, sorted by key
+    """
+    return sorted(
+        (
+            [
+                requirement.key.lower(),
+                RequiredVersion(obj=requirement.specifier).specifier,
+            ]
+            for requirement in package.obj.requires()
+        ),
+        key=lambda edge: edge[0]
+    )
+
+
+def changed_packages(states, previous_states):
+    """Find packages that were added, removed or changed between two states
+    :param states: Package states indexed by package key
+    :param previous_states: Previous package states indexed by package key
+    :return: Set of package keys
+    """
+    return {
+        key for key in set(states) | set(previous_states)
+        if states.get(key) != previous_states.get(key)
+    }
+
+
+def reverse_index(edges):
+    """Index packages by keys of their requirements
+    :param edges: Requirement edges indexed by package key
+    :return: Sets of package keys indexed by requirement key
+    """
+    index = {}
+    for key, requirements in edges.items():
+        for requirement_key, _ in requirements:
+            index.setdefault(requirement_key, set()).add(key)
+    return index
+
+
+def reverse_closure(keys, index):
+    """Find packages that require any of the provided packages, directly or
+        through other packages
+    :param keys: Package keys
+    :param index: Reverse index of requirements
+    :return: Set of provided package keys and keys of packages requiring them
+    """
+    closure = set()
+    pending = list(keys)
+    while pending:
+        key = pending.pop()
+        if key not in closure:
+            closure.add(key)
+            pending.extend(index.get(key, ()))
+    return closure
+
+
+def _requirements_installed(requirements, edges, ignore_list, environment):
+    """Check whether all requirements and their requirements are installed by
+        going through requirement edges, without parsing package requirements
+    :param requirements: Collection of requirements
+    :param edges: Requirement edges indexed by package key
+    :param ignore_list: List of package keys to ignore
+    :param environment: Environment the packages are installed in
+    :return: Whether requirements can be reported as installed without
+        looking them up
+    """
+    configured_ignore_list = current_settings().ignore_list
+    visited = set()
+    pending = [requirement.key for requirement in requirements]
+    while pending:
+        key = pending.pop()
+        if key in visited:
+            continue
+        visited.add(key)
+        if key in edges:
+            pending.extend(
+                requirement_key for requirement_key, _ in edges[key]
+                if requirement_key not in configured_ignore_list
+            )
+        elif key not in ignore_list or environment.get(key) is not None:
+            # Missing, or installed but not checked
+            return False
+    return True
+
+
+def check_packages(packages=None, requirements=None, locked=None,
+                   ignore_list=None, state=None, environment=None):
+    """Find conflicts, missing requirements and lock version mismatches,
+        evaluating only packages affected by changes since the state was
+        saved and reusing saved results of all other packages. Results are
+        the same as the ones of conflicting_dependencies, missing_requirements
+        and lock_version_mismatch.
+    :param packages: Collection of packages
+    :param requirements: Collection of requirements
+    :param locked: Collection of locked requirements
+    :param ignore_list: List of package keys to ignore
+    :param state: State saved by the previous run
+    :param environment: Environment the packages are installed in, defaults
+        to the environment in use
+    :return: IncrementalResult and state to save for the next run
+    """
+    packages = packages or []
+    requirements = requirements or RequirementCollection()
+    ignore_list = ignore_list or []
+    environment = environment or current_environment()
+    state = (
+        state if state and state.get('version') == STATE_VERSION else {}
+    )
+
+    index = OrderedDict((package.key, package) for package in packages)
+    states = OrderedDict(
+        (key, package_state(package)) for key, package in index.items()
+    )
+    changed = changed_packages(
+        states=states, previous_states=state.get('packages', {})
+    )
+
+    # Requirements of changed packages are the only ones parsed
+    edges = OrderedDict(
+        (key, requirement_edges(package) if key in changed
+         else state['requirements'][key])
+        for key, package in index.items()
+    )
+    affected = reverse_closure(
+        keys=changed, index=reverse_index(edges=edges)
+    ).intersection(index)
+
+    options = conflict_options()
+    conflicting_edges = OrderedDict(
+        (key, [
+            [requirement.key, requirement.specified_version]
+            for requirement in package.requirements
+            if requirement.conflicting(**options)
+        ] if key in affected else state['conflicts'][key])
+        for key, package in index.items()
+    )
+
+    # noinspection PyProtectedMember
+    requirers = OrderedDict()
+    for key, package in index.items():
+        for requirement_key, required_version in edges[key]:
+            if requirement_key not in package._ignore_list:
+                requirers.setdefault(requirement_key, []).append(
+                    (package, required_version)
+                )
+    conflicts = [
+        (index[requirement_key], requirers[requirement_key])
+        for key in index
+        for requirement_key, _ in conflicting_edges[key]
+    ]
+
+    missing = (
+        [] if _requirements_installed(
+            requirements=requirements,
+            edges=edges,
+            ignore_list=ignore_list,
+            environment=environment
+        ) else
+        missing_requirements(
+            packages=packages,
+            requirements=requirements,
+            ignore_list=ignore_list
+        )
+    )
+
+    locks = (
+        [[lock.key, str(lock.specified_version)] for lock in locked]
+        if locked is not None else None
+    )
+    unchanged_locks = locks is not None and locks == state.get('locks')
+    locked_versions = {}
+    for key, locked_version in locks or []:
+        locked_versions.setdefault(key, []).append(locked_version)
+    lock_mismatch = OrderedDict(
+        (key, state['lock_version_mismatch'][key]
+         if unchanged_locks and key not in changed else [
+             locked_version
+             for locked_version in locked_versions.get(key, [])
+             if package.specified_version != locked_version
+         ])
+        for key, package in index.items()
+    )
+
+    result = IncrementalResult(
+        conflicts=conflicts,
+        missing=missing,
+        lock_version_mismatch=[
+            (index[key], locked_version)
+            for key, versions in lock_mismatch.items()
+            for locked_version in versions
+        ],
+        affected_packages=affected,
+    )
+    return result, {
+        'version': STATE_VERSION,
+        'packages': states,
+        'requirements': edges,
+        'conflicts': conflicting_edges,
+        'locks': locks,
+        'lock_version_mismatch': lock_mismatch,
+    }
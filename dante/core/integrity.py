@@ -0,0 +1,231 @@
+import os
+import csv
+import base64
+import random
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+RECORD_FILE = 'RECORD'
+DIST_INFO_EXTENSION = '.dist-info'
+
+# Size of the buffer files are read into when hashing
+BUFFER_SIZE = 1024 * 1024
+# Number of bytes hashed by a single worker task
+BATCH_SIZE = 64 * 1024 * 1024
+# Directories with files that are generated after installation
+IGNORED_DIRECTORIES = ['__pycache__']
+
+
+def record_path(distribution):
+    """Retrieve RECORD file path for an installed distribution
+    :param distribution: Distribution object
+    :return: RECORD file path or None if the distribution does not have one
+    """
+    egg_info = getattr(distribution, 'egg_info', None) or ''
+    path = os.path.join(egg_info, RECORD_FILE)
+    return (
+        path if egg_info.endswith(DIST_INFO_EXTENSION) and
+        os.path.isfile(path) else None
+    )
+
+
+def read_record(distribution):
+    """Stream RECORD file entries of an installed distribution
+    :param distribution: Distribution object
+    :return: Generator of file paths, hash algorithms, digests and sizes
+    """
+    with open(record_path(distribution), 'r', newline='') as record_file:
+        for row in csv.reader(record_file):
+            if not row:
+                continue
+            path, file_hash, size = (row + ['', ''])[:3]
+            algorithm, _, digest = file_hash.partition('=')
+            yield (
+                os.path.normpath(os.path.join(distribution.location, path)),
+                algorithm or None,
+                digest or None,
+                int(size) if size else None,
+            )
+
+
+def file_digest(path, algorithm):
+    """Hash a file by reading it in large chunks into a reused buffer
+    :param path: File path
+    :param algorithm: Hash algorithm name
+    :return: Digest encoded the same way as in RECORD files
+    """
+    file_hash = hashlib.new(algorithm)
+    buffer = bytearray(BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as file_:
+        for size in iter(lambda: file_.readinto(buffer), 0):
+            file_hash.update(view[:size])
+    return base64.urlsafe_b64encode(file_hash.digest()).rstrip(b'=').decode()
+
+
+def _file_digests(files):
+    """Hash a batch of files, used by worker processes
+    :param files: List of file paths and hash algorithms
+    :return: List of digests, None for files that could not be read
+    """
+    digests = []
+    for path, algorithm in files:
+        try:
+            digests.append(file_digest(path=path, algorithm=algorithm))
+        except (OSError, ValueError):
+            digests.append(None)
+    return digests
+
+
+def _batches(files):
+    """Split files into batches of similar size for worker processes
+    :param files: List of file entries, sizes are the last item
+    :return: Generator of file entry lists
+    """
+    batch, batch_size = [], 0
+    for file_ in files:
+        batch.append(file_)
+        batch_size += file_[-1]
+        if batch_size >= BATCH_SIZE:
+            yield batch
+            batch, batch_size = [], 0
+    if batch:
+        yield batch
+
+
+def owned_files(environments):
+    """Retrieve files tracked by RECORD files of all distributions in
+        environments, including distributions shadowed by others
+    :param environments: List of environment objects
+    :return: Set of file paths
+    """
+    owned = set()
+    for environment in environments:
+        for distributions in environment.index.values():
+            for distribution in distributions:
+                if record_path(distribution):
+                    owned.update(
+                        path for path, _, _, _ in read_record(distribution)
+                    )
+    return owned
+
+
+def _untracked_files(location, tracked):
+    """Find files in directories of tracked files that are not tracked. Files
+        in shared directories (e.g. namespace packages) can be tracked by
+        other distributions, see owned_files.
+    :param location: Distribution location (e.g. site-packages)
+    :param tracked: Set of tracked file paths
+    :return: Sorted list of untracked file paths
+    """
+    location = os.path.normpath(location)
+    directories = {
+        os.path.dirname(path) for path in tracked
+        # Skip files installed outside the package directory (e.g. scripts)
+        # and the shared location directory itself
+        if os.path.dirname(path).startswith(location + os.sep) and
+        os.path.basename(os.path.dirname(path)) not in IGNORED_DIRECTORIES
+    }
+
+    untracked = []
+    for directory in directories:
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        untracked.extend(
+            os.path.normpath(entry.path) for entry in entries
+            if entry.is_file() and
+            os.path.normpath(entry.path) not in tracked
+        )
+    return sorted(untracked)
+
+
+def verify_packages(packages, jobs=None, sample=None, seed=None):
+    """Verify installed package files against their RECORD files
+    :param packages: Collection of packages
+    :param jobs: Number of worker processes (defaults to number of CPUs)
+    :param sample: Number of randomly chosen packages to verify
+    :param seed: Random seed used for choosing packages
+    :return: List of packages with their missing, modified and untracked
+        files and list of packages that could not be verified
+    """
+    if sample is not None and sample < 0:
+        raise ValueError('Sample size can not be negative')
+
+    verifiable = [
+        package for package in packages if record_path(package.obj)
+    ]
+    unverifiable = [
+        package for package in packages if not record_path(package.obj)
+    ]
+    if sample is not None:
+        verifiable = sorted(random.Random(seed).sample(
+            verifiable, min(sample, len(verifiable))
+        ))
+
+    results = []
+    files_to_hash = []
+    for index, package in enumerate(verifiable):
+        missing, modified, tracked = [], [], set()
+        for path, algorithm, digest, size in read_record(package.obj):
+            tracked.add(path)
+            try:
+                file_size = os.stat(path).st_size
+            except OSError:
+                missing.append(path)
+                continue
+
+            # Hash only files whose size matches
+            if size is not None and size != file_size:
+                modified.append(path)
+            elif algorithm and digest:
+                files_to_hash.append(
+                    (index, path, algorithm, digest, file_size)
+                )
+
+        results.append((
+            package,
+            missing,
+            modified,
+            _untracked_files(location=package.obj.location, tracked=tracked)
+        ))
+
+    # Hash largest files first to balance work between processes
+    files_to_hash.sort(key=lambda f: f[-1], reverse=True)
+    batches = [
+        [(path, algorithm) for _, path, algorithm, _, _ in batch]
+        for batch in _batches(files_to_hash)
+    ]
+    if jobs == 1 or len(batches) < 2:
+        digests = map(_file_digests, batches)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            digests = list(executor.map(_file_digests, batches))
+
+    file_digests = (digest for batch in digests for digest in batch)
+    for (index, path, _, digest, _), file_digest_ in zip(
+            files_to_hash, file_digests):
+        if file_digest_ != digest:
+            results[index][2].append(path)
+
+    # Files of other distributions are read only if there are files that
+    # are not tracked by their own distributions
+    owned = set()
+    if any(untracked for _, _, _, untracked in results):
+        environments = OrderedDict(
+            (id(package.environment), package.environment)
+            for package in verifiable
+        )
+        owned = owned_files(environments=environments.values())
+
+    return [
+        (
+            package,
+            sorted(missing),
+            sorted(modified),
+            [path for path in untracked if path not in owned],
+        )
+        for package, missing, modified, untracked in results
+    ], unverifiable
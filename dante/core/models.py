@@ -1,20 +1,40 @@
 import re
 import abc
 import copy
-from functools import reduce
+from functools import lru_cache, reduce
 from collections import OrderedDict
 
-from dante.vendor import pkg_resources
 from dante.vendor.packaging.specifiers import (
     Version,
     SpecifierSet,
 )
-# noinspection PyProtectedMember
-from dante.vendor.pkg_resources import RequirementParseError
-from dante.vendor.packaging.requirements import InvalidRequirement
 
 from dante import messages
-from dante.config import Config
+from dante.config import current_settings
+from dante.core.environment import FakeEnvironment, current_environment
+
+# Number of parsed requirement strings kept, shared by all requirements and
+# projects. Long running processes (e.g. the daemon) keep only recent ones.
+PARSED_REQUIREMENTS_SIZE = 4096
+
+
+@lru_cache(maxsize=PARSED_REQUIREMENTS_SIZE)
+def _parse_requirement(version_string):
+    """Parse requirement from a version string, see Requirement.parse
+    :param version_string: Version string
+    :return: Parsed requirement
+    """
+    # Imported on first use since importing pkg_resources scans the
+    # environment and builds the requirement grammar
+    from dante.vendor import pkg_resources
+    from dante.vendor.packaging.requirements import InvalidRequirement
+
+    try:
+        return pkg_resources.Requirement.parse(version_string)
+    except (InvalidRequirement, pkg_resources.RequirementParseError):
+        raise Exception('{}: "{}"'.format(
+            messages.INVALID_REQUIREMENT, version_string
+        ))
 
 
 class VersionData:
@@ -28,19 +48,30 @@ class VersionData:
         ('greater_than', '>'),
     ])
 
-    def __init__(self, obj):
+    def __init__(self, obj, any_version=None):
         """Create version from object
         :param obj: Any object
+        :param any_version: Version id of unspecified versions, defaults to
+            the configured one
         """
         self.obj = obj
+        # Settings are read once, versions are compared many times
+        self.any_version = (
+            any_version or getattr(obj, 'any_version', None) or
+            current_settings().any_version
+        )
         if isinstance(obj, VersionData):
             self.id = obj.id
         elif isinstance(obj, str):
             self.id = self.from_string(obj)
         elif isinstance(obj, Version):
-            self.id = self.from_packaging_version(version=obj)
+            self.id = self.from_packaging_version(
+                version=obj, any_version=self.any_version
+            )
         elif isinstance(obj, SpecifierSet):
-            self.id = self.from_specifier_set(version=obj)
+            self.id = self.from_specifier_set(
+                version=obj, any_version=self.any_version
+            )
         else:
             self.id = str(obj)
 
@@ -50,7 +81,8 @@ class VersionData:
         :return: Whether a match is found
         """
         named_version_patterns = (
-            named_version_patterns or Config.named_version_patterns or []
+            named_version_patterns or
+            current_settings().named_version_patterns or []
         )
         for pattern in named_version_patterns:
             if re.match(pattern=pattern, string=self.id):
@@ -76,18 +108,20 @@ class VersionData:
 
     @staticmethod
     @abc.abstractmethod
-    def from_specifier_set(version):
+    def from_specifier_set(version, any_version=None):
         """Create version from specifier set
         :param version: Version specifier set
+        :param any_version: Version id of unspecified versions
         :return: VersionData
         """
         pass
 
     @staticmethod
     @abc.abstractmethod
-    def from_packaging_version(version):
+    def from_packaging_version(version, any_version=None):
         """Create version from packaging version
         :param version: Packaging version
+        :param any_version: Version id of unspecified versions
         :return: VersionData
         """
         pass
@@ -118,8 +152,8 @@ class InstalledVersion(VersionData):
         """
         return (
             self.operators['equal'] + self.id
-            if self.id != Config.any_version
-            else Config.any_version
+            if self.id != self.any_version
+            else self.any_version
         )
 
     # noinspection PyBroadException
@@ -136,24 +170,28 @@ class InstalledVersion(VersionData):
             return cleaned_version
 
     @staticmethod
-    def from_specifier_set(version):
+    def from_specifier_set(version, any_version=None):
         """Get installed version from specifier set
         :param version: version specifier
+        :param any_version: Version id of unspecified versions, defaults to
+            the configured one
         :return: Installed version object
         """
         if len(version) > 1:
-            return Config.any_version
+            return any_version or current_settings().any_version
         return InstalledVersion.strip_operators(str(version))
 
     @staticmethod
-    def from_packaging_version(version):
+    def from_packaging_version(version, any_version=None):
         """Get installed version from packaging version format
         :param version: version in packaging format
+        :param any_version: Version id of unspecified versions, defaults to
+            the configured one
         :return: Installed version object
         """
         return (
             InstalledVersion.strip_operators(str(version))
-            if version else Config.any_version
+            if version else any_version or current_settings().any_version
         )
 
     def __eq__(self, other):
@@ -173,8 +211,8 @@ class InstalledVersion(VersionData):
 
         return (
             self.id == other_id and
-            self.id != Config.any_version and
-            other_id != Config.any_version
+            self.id != self.any_version and
+            other_id != self.any_version
         )
 
 
@@ -191,7 +229,7 @@ class RequiredVersion(VersionData):
         """Retrieve version specifier
         :return: Version specifier
         """
-        return self.id if self.id != Config.any_version else Config.any_version
+        return self.id
 
     # noinspection PyBroadException
     @staticmethod
@@ -217,17 +255,23 @@ class RequiredVersion(VersionData):
             return version
 
     @staticmethod
-    def from_specifier_set(version):
+    def from_specifier_set(version, any_version=None):
         """Create version from specifier set
         :param version: Version specifier set
+        :param any_version: Version id of unspecified versions, defaults to
+            the configured one
         :return: Version string
         """
-        return str(version) if version else Config.any_version
+        return (
+            str(version) if version
+            else any_version or current_settings().any_version
+        )
 
     @staticmethod
-    def from_packaging_version(version):
+    def from_packaging_version(version, any_version=None):
         """Create version from packaging version
         :param version: Packaging version
+        :param any_version: Version id of unspecified versions
         :return: Version string
         """
         return RequiredVersion.operators['equal'] + str(version)
@@ -249,25 +293,28 @@ class RequiredVersion(VersionData):
 
         return (
             self.id == other_id and
-            self.id != Config.any_version and
-            other_id != Config.any_version
+            self.id != self.any_version and
+            other_id != self.any_version
         )
 
 
 class Dependency:
-    def __init__(self, key, name, obj, version, _ignore_list=None):
+    def __init__(self, key, name, obj, version, _ignore_list=None,
+                 environment=None):
         """Create dependency object
         :param key: Dependency key
         :param name: Dependency name
         :param obj: Object the dependency was created from
         :param version: Dependency version
         :param _ignore_list: Ignore list (used for retrieving requirements)
+        :param environment: Environment the dependency is looked up in
         """
         self.key = key
         self.name = name
         self.obj = obj
         self.version = VersionData(obj=version)
-        self._ignore_list = _ignore_list or Config.ignore_list
+        self._ignore_list = _ignore_list or current_settings().ignore_list
+        self._environment = environment
 
     def __lt__(self, other):
         """Override lesser than operator for easier comparisons
@@ -308,6 +355,14 @@ class Dependency:
             key=self.key
         )
 
+    @property
+    def environment(self):
+        """Retrieve environment the dependency is looked up in, defaults to
+            the environment in use
+        :return: Environment object
+        """
+        return self._environment or current_environment()
+
     @property
     def package(self):
         """Retrieve dependency package
@@ -317,26 +372,47 @@ class Dependency:
 
 
 class Package(Dependency):
-    def __init__(self, key, name, obj, version, _ignore_list=None):
+    def __init__(self, key, name, obj, version, _ignore_list=None,
+                 environment=None):
         """Create package object
         :param key: Package key
         :param name: Package name
         :param obj: Object the package is created from
         :param version: Package version
         :param _ignore_list: Ignore list (used for retrieving requirements)
+        :param environment: Environment the package is installed in
         """
         super().__init__(
             key=key,
             name=name,
             obj=obj,
             version=version,
-            _ignore_list=_ignore_list
+            _ignore_list=_ignore_list,
+            environment=environment
         )
         self.key = key
         self.name = name
         self.obj = obj
         self.version = InstalledVersion(obj=version)
-        self._ignore_list = _ignore_list or Config.ignore_list
+        self._ignore_list = _ignore_list or current_settings().ignore_list
+
+    @classmethod
+    def from_distribution(cls, distribution, _ignore_list=None,
+                          environment=None):
+        """Create package from distribution object
+        :param distribution: Distribution object
+        :param _ignore_list: Ignore list (used for retrieving requirements)
+        :param environment: Environment the package is installed in
+        :return: Package object
+        """
+        return cls(
+            key=distribution.key.lower(),
+            name=distribution.project_name,
+            obj=distribution,
+            version=InstalledVersion(obj=distribution.parsed_version),
+            _ignore_list=_ignore_list,
+            environment=environment
+        )
 
     @property
     def version_id(self):
@@ -371,7 +447,8 @@ class Package(Dependency):
                 name=requirement.name,
                 obj=requirement,
                 version=RequiredVersion(obj=requirement.specifier),
-                _ignore_list=self._ignore_list
+                _ignore_list=self._ignore_list,
+                environment=self._environment
             )
             for requirement in self.obj.requires()
             if requirement.key.lower() not in self._ignore_list
@@ -393,35 +470,37 @@ class PackageCollection(list):
         return next(package for package in self if package.key == key)
 
     @staticmethod
-    def from_distributions(packages, ignore_list=None):
+    def from_distributions(packages, ignore_list=None, environment=None):
         """Create package collection from package distribution object
         :param packages: Source packages
         :param ignore_list: List of ignored package keys
+        :param environment: Environment the packages are installed in
         :return: PackageCollection object
         """
         ignore_list = ignore_list or []
 
         return PackageCollection(sorted([
-            Package(
-                key=package.key.lower(),
-                name=package.project_name,
-                obj=package,
-                version=InstalledVersion(obj=package.parsed_version),
-                _ignore_list=ignore_list
+            Package.from_distribution(
+                distribution=package,
+                _ignore_list=ignore_list,
+                environment=environment
             )
             for package in packages
             if package.key.lower() not in ignore_list
         ], key=lambda p: p.key))
 
     @staticmethod
-    def installed_packages(packages=None, ignore_list=None):
+    def installed_packages(packages=None, ignore_list=None, environment=None):
         """Retrieve installed packages
         :param packages: Source packages
         :param ignore_list: List of ignored package keys
+        :param environment: Environment the packages are installed in,
+            defaults to the environment in use
         :return: PackageCollection object
         """
         ignore_list = ignore_list or []
-        packages = packages or pkg_resources.working_set
+        environment = environment or current_environment()
+        packages = packages or environment.distributions()
 
         packages = [
             package for package in packages
@@ -429,7 +508,7 @@ class PackageCollection(list):
         ]
 
         return PackageCollection.from_distributions(
-            packages=packages, ignore_list=ignore_list
+            packages=packages, ignore_list=ignore_list, environment=environment
         )
 
     def keys(self):
@@ -523,26 +602,31 @@ class PackageCollection(list):
 
 class Requirement(Dependency):
 
-    def __init__(self, key, name, obj, version=None, _ignore_list=None):
+    def __init__(self, key, name, obj, version=None, _ignore_list=None,
+                 environment=None):
         """Create requirement object
         :param key: Requirement key
         :param name: Requirement name
         :param obj: The object requirement is made from
         :param version: Requirement version
         :param _ignore_list: Ignore list (used for retrieving requirements)
+        :param environment: Environment the requirement is looked up in
         """
         super().__init__(
             key=key,
             name=name,
             obj=obj,
             version=version,
-            _ignore_list=_ignore_list
+            _ignore_list=_ignore_list,
+            environment=environment
         )
         self.key = key
         self.name = name
         self.obj = obj
-        self.version = RequiredVersion(obj=version) or Config.any_version
-        self._ignore_list = _ignore_list or Config.ignore_list
+        self.version = (
+            RequiredVersion(obj=version) or current_settings().any_version
+        )
+        self._ignore_list = _ignore_list or current_settings().ignore_list
 
     @property
     def specified_version(self):
@@ -552,9 +636,10 @@ class Requirement(Dependency):
         return self.version.specifier
 
     @classmethod
-    def from_setuptools_requirement(cls, requirement):
+    def from_setuptools_requirement(cls, requirement, environment=None):
         """Create requirement from setuptools requirement object
         :param requirement: Setuptools requirement object
+        :param environment: Environment the requirement is looked up in
         :return: Requirement object
         """
         return cls(
@@ -562,16 +647,34 @@ class Requirement(Dependency):
             name=requirement.name,
             obj=requirement,
             version=RequiredVersion(obj=requirement.specifier),
+            environment=environment,
         )
 
     @classmethod
-    def from_requirement_string(cls, requirement_string):
+    def from_requirement_string(cls, requirement_string, environment=None,
+                                standalone=False):
         """Create requirement from requirement string
         :param requirement_string: Requirement string
+        :param environment: Environment the requirement is looked up in
+        :param standalone: Parse the requirement without pkg_resources, see
+            parse_standalone
         :return: Requirement object
         """
+        if standalone:
+            requirement = Requirement.parse_standalone(
+                version_string=requirement_string
+            )
+            return cls(
+                key=Requirement.safe_key(name=requirement.name),
+                name=requirement.name,
+                obj=requirement,
+                version=RequiredVersion(obj=requirement.specifier),
+                environment=environment,
+            )
+
         return cls.from_setuptools_requirement(
-            requirement=Requirement.parse(version_string=requirement_string)
+            requirement=Requirement.parse(version_string=requirement_string),
+            environment=environment,
         )
 
     @classmethod
@@ -587,6 +690,7 @@ class Requirement(Dependency):
             obj=package,
             version=RequiredVersion(package.version.specifier),
             _ignore_list=package._ignore_list,
+            environment=package._environment,
         )
 
     @property
@@ -594,16 +698,14 @@ class Requirement(Dependency):
         """Get installed package for requirement
         :return: Package object
         """
-        distribution = pkg_resources.working_set.by_key.get(self.key)
+        distribution = self.environment.get(self.key)
         if distribution is None:
             return None
 
-        return Package(
-            key=distribution.key.lower(),
-            name=distribution.project_name,
-            obj=distribution,
-            version=InstalledVersion(obj=distribution.parsed_version),
-            _ignore_list=self._ignore_list
+        return Package.from_distribution(
+            distribution=distribution,
+            _ignore_list=self._ignore_list,
+            environment=self._environment
         )
 
     @property
@@ -622,8 +724,8 @@ class Requirement(Dependency):
         """Retrieve version id
         :return: Version id string
         """
-        version = getattr(self.package, 'version', Config.any_version)
-        return getattr(version, 'id', Config.any_version)
+        version = getattr(self.package, 'version', None)
+        return getattr(version, 'id', self.version.any_version)
 
     @version_id.setter
     def version_id(self, version_id):
@@ -633,22 +735,26 @@ class Requirement(Dependency):
         """
         self.version_id = version_id
 
-    def conflicting(self, allow_named_versions=False,
+    def conflicting(self, allow_named_versions=None,
                     named_version_patterns=None):
         """Find if requirement conflicts with other requirements or packages.
 
         Named versions will not be detected as conflicts if enabled.
 
-        :param allow_named_versions: Whether named versions are allowed
-        :param named_version_patterns: Patterns for matching named versions
+        :param allow_named_versions: Whether named versions are allowed,
+            defaults to the configured value
+        :param named_version_patterns: Patterns for matching named versions,
+            defaults to configured patterns
         :return: Whether there is a conflict
         """
-        allow_named_versions = (
-            allow_named_versions or Config.allow_named_versions or False
-        )
-        named_version_patterns = (
-            named_version_patterns or Config.named_version_patterns or []
-        )
+        # Operations pass options read once, settings are read only for
+        # requirements checked on their own
+        if allow_named_versions is None:
+            allow_named_versions = current_settings().allow_named_versions
+        if allow_named_versions and not named_version_patterns:
+            named_version_patterns = (
+                current_settings().named_version_patterns or []
+            )
 
         version_string = (
             '{}{}'.format(self.key, self.specified_version)
@@ -663,7 +769,7 @@ class Requirement(Dependency):
         ) if self.package else False
 
         return (
-            installed_version != Config.any_version and
+            installed_version != self.version.any_version and
             installed_version not in required_versions and
             not allowed_named_version_package
         )
@@ -671,17 +777,42 @@ class Requirement(Dependency):
     @staticmethod
     def parse(version_string):
         """Parse requirement from a version string. Can cause an exception
-            when a version string is invalid.
+            when a version string is invalid. Recently used version strings
+            are parsed only once.
         :param version_string: Version string
         :return: Parsed requirement string
         """
+        return _parse_requirement(version_string)
+
+    @staticmethod
+    def parse_standalone(version_string):
+        """Parse requirement from a version string with packaging only.
+            Unlike parse, it does not import pkg_resources, so the installed
+            environment is never scanned.
+        :param version_string: Version string
+        :return: Parsed packaging requirement
+        """
+        from dante.vendor.packaging.requirements import (
+            Requirement as PackagingRequirement,
+            InvalidRequirement,
+        )
+
         try:
-            return pkg_resources.Requirement.parse(version_string)
-        except (InvalidRequirement, RequirementParseError):
+            return PackagingRequirement(version_string)
+        except InvalidRequirement:
             raise Exception('{}: "{}"'.format(
                 messages.INVALID_REQUIREMENT, version_string
             ))
 
+    @staticmethod
+    def safe_key(name):
+        """Create a requirement key from a project name the way
+            pkg_resources does
+        :param name: Project name
+        :return: Requirement key
+        """
+        return re.sub('[^A-Za-z0-9.]+', '-', name).lower()
+
 
 class RequirementCollection(list):
     def __repr__(self):
@@ -726,25 +857,40 @@ class RequirementCollection(list):
         return result
 
     @staticmethod
-    def from_file(filepath):
+    def from_file(filepath, environment=None, standalone=False):
         """Create a requirement collection from a file
         :param filepath: Requirement file path
+        :param environment: Environment the requirements are looked up in
+        :param standalone: Parse requirements without pkg_resources. Unless
+            an environment is provided, requirements are looked up in an
+            empty environment instead of the environment in use.
         :return: Requirements collection
         """
         from dante.parsers import Parser
-        return Parser.parse_requirements_file(filepath=filepath)
+        requirements = Parser.parse_requirements_file(
+            filepath=filepath, standalone=standalone
+        )
+        if standalone and environment is None:
+            environment = FakeEnvironment()
+        for requirement in requirements:
+            requirement._environment = environment
+        return requirements
 
     @staticmethod
-    def from_files(filepaths):
+    def from_files(filepaths, environment=None, standalone=False):
         """Create a requirement collection from multiple files
         :param filepaths: Requirement file paths
+        :param environment: Environment the requirements are looked up in
+        :param standalone: Parse requirements without pkg_resources
         :return: Requirements collection
         """
         requirements = RequirementCollection()
         for requirements_file in filepaths:
-            requirements.extend(
-                RequirementCollection.from_file(filepath=requirements_file)
-            )
+            requirements.extend(RequirementCollection.from_file(
+                filepath=requirements_file,
+                environment=environment,
+                standalone=standalone,
+            ))
         return requirements
 
     def save_lock_file(self, filepath):
@@ -1,24 +1,52 @@
-from collections import OrderedDict
+import re
+from collections import OrderedDict, namedtuple
 
-from dante.config import Config
+from dante.vendor.packaging.version import parse as parse_version
+
+from dante.config import current_settings
+from dante.core.environment import current_environment
 from dante.core.models import (
+    Package,
     Requirement,
     PackageCollection,
     RequirementCollection,
 )
 from dante.core.graph import create_dependency_graph, render_dependency_graph
 
-
-def dependency_list(ignore_list=None, requirements=None):
+# Package changes detected between environments
+ADDED = 'added'
+REMOVED = 'removed'
+UPGRADED = 'upgraded'
+DOWNGRADED = 'downgraded'
+CHANGED = 'changed'
+
+# Marks of dependencies in dependency trees which are not expanded
+TREE_REPEATED = 'repeated'
+TREE_CYCLIC = 'cyclic'
+
+# Results of all requirement validations, see validate_requirements
+ValidationResult = namedtuple('ValidationResult', [
+    'unlocked_requirements',
+    'unset_locks',
+    'lock_version_mismatch',
+    'required_version_mismatch',
+    'unnecessary_packages',
+    'unnecessary_locks',
+])
+
+
+def dependency_list(ignore_list=None, requirements=None, environment=None):
     """Returns all installed packages
     :param ignore_list: List of package keys to ignore
     :param requirements: Collection of requirements
+    :param environment: Environment to retrieve packages from, defaults to
+        the environment in use
     :return: List of packages
     """
-    ignore_list = ignore_list or Config.ignore_list
+    ignore_list = ignore_list or current_settings().ignore_list
 
     installed_packages = PackageCollection.installed_packages(
-        ignore_list=ignore_list
+        ignore_list=ignore_list, environment=environment
     )
 
     # If requirements files are specified filter out other packages
@@ -48,6 +76,49 @@ def required_by(requirement, packages=None):
     ]
 
 
+def conflict_options(allow_named_versions=None, named_version_patterns=None):
+    """Resolve options of conflict detection once for an operation, so
+        settings are not read for every requirement
+    :param allow_named_versions: Allow named versions to circumvent conflicts,
+        defaults to the configured value
+    :param named_version_patterns: List of patterns that determine named
+        versions, defaults to configured patterns
+    :return: Keyword arguments of Requirement.conflicting
+    """
+    settings = current_settings()
+    return dict(
+        allow_named_versions=bool(
+            allow_named_versions or settings.allow_named_versions
+        ),
+        named_version_patterns=list(
+            named_version_patterns or settings.named_version_patterns or []
+        ),
+    )
+
+
+def iter_conflicting_dependencies(packages=None, allow_named_versions=False,
+                                  named_version_patterns=None):
+    """Finds dependencies with conflicting versions one at a time, so finding
+        the first one does not go through all packages
+    :param packages: Collection of packages
+    :param allow_named_versions: Allow named versions to circumvent conflicts
+    :param named_version_patterns: List of patterns that determine named
+        versions
+    :return: Generator of requirements and packages that require them with
+        the required version
+    """
+    packages = packages or PackageCollection()
+    options = conflict_options(
+        allow_named_versions=allow_named_versions,
+        named_version_patterns=named_version_patterns,
+    )
+
+    for package in packages:
+        for requirement in package.requirements:
+            if requirement.conflicting(**options):
+                yield requirement, required_by(requirement, packages)
+
+
 def conflicting_dependencies(packages=None, allow_named_versions=False,
                              named_version_patterns=None):
     """Returns all dependencies with conflicting versions
@@ -58,16 +129,11 @@ def conflicting_dependencies(packages=None, allow_named_versions=False,
     :return: List of requirements and packages that require them with
         the required version
     """
-    packages = packages or PackageCollection()
-
-    return [
-        (requirement, required_by(requirement, packages))
-        for requirement in packages.requirements
-        if requirement.conflicting(
-            allow_named_versions=allow_named_versions,
-            named_version_patterns=named_version_patterns
-        )
-    ]
+    return list(iter_conflicting_dependencies(
+        packages=packages,
+        allow_named_versions=allow_named_versions,
+        named_version_patterns=named_version_patterns
+    ))
 
 
 def cyclic_dependencies(packages=None):
@@ -79,6 +145,56 @@ def cyclic_dependencies(packages=None):
     return packages.cyclic_dependencies
 
 
+def find_cyclic_dependency(packages=None):
+    """Finds a single cyclic dependency, visiting every package only once
+    :param packages: Collection of packages
+    :return: Cyclic path or None if there are no cyclic dependencies
+    """
+    packages = packages or PackageCollection()
+
+    visited = set()
+    for package in packages:
+        if package.key in visited:
+            continue
+        visited.add(package.key)
+        path = [package]
+        pending = [iter(package.requirements)]
+        while pending:
+            requirement = next(pending[-1], None)
+            if requirement is None:
+                pending.pop()
+                path.pop()
+                continue
+
+            path_keys = [dependency.key for dependency in path]
+            if requirement.key in path_keys:
+                return path[path_keys.index(requirement.key):]
+            if requirement.key not in visited and requirement.package:
+                visited.add(requirement.key)
+                path.append(requirement.package)
+                pending.append(iter(requirement.requirements))
+    return None
+
+
+def iter_missing_requirements(packages=None, requirements=None,
+                              ignore_list=None):
+    """Finds requirements that are not installed one at a time
+    :param packages: Collection of packages
+    :param requirements: Collection of requirements
+    :param ignore_list: List of package keys to ignore
+    :return: Generator of requirements that are not found in packages and
+        packages that require them
+    """
+    packages = packages or PackageCollection()
+    requirements = requirements or RequirementCollection()
+    ignore_list = ignore_list or []
+
+    found = set(ignore_list).union(packages.keys())
+    for requirement in requirements.flatten():
+        if requirement.key not in found:
+            yield requirement, required_by(requirement, packages)
+
+
 def missing_requirements(packages=None, requirements=None, ignore_list=None):
     """Returns all requirements that are not installed
     :param packages: Collection of packages
@@ -86,15 +202,43 @@ def missing_requirements(packages=None, requirements=None, ignore_list=None):
     :param ignore_list: List of package keys to ignore
     :return: All requirements that are not found in packages
     """
-    packages = packages or PackageCollection()
-    requirements = requirements or RequirementCollection()
+    return list(iter_missing_requirements(
+        packages=packages, requirements=requirements, ignore_list=ignore_list
+    ))
+
+
+def iter_duplicate_packages(environment=None, ignore_list=None):
+    """Finds packages that are installed multiple times one at a time
+    :param environment: Environment to retrieve packages from, defaults to
+        the environment in use
+    :param ignore_list: List of package keys to ignore
+    :return: Generator of active packages and packages shadowed by them
+    """
+    environment = environment or current_environment()
     ignore_list = ignore_list or []
 
-    return [
-        (requirement, required_by(requirement, packages))
-        for requirement in requirements.flatten()
-        if requirement.key not in ignore_list + packages.keys()
-    ]
+    for key, distributions in sorted(environment.index.items()):
+        if len(distributions) < 2 or key in ignore_list:
+            continue
+        active, *shadowed = [
+            Package.from_distribution(
+                distribution=distribution, environment=environment
+            )
+            for distribution in distributions
+        ]
+        yield active, PackageCollection(shadowed)
+
+
+def duplicate_packages(environment=None, ignore_list=None):
+    """Returns packages that are installed multiple times
+    :param environment: Environment to retrieve packages from, defaults to
+        the environment in use
+    :param ignore_list: List of package keys to ignore
+    :return: List of active packages and packages shadowed by them
+    """
+    return list(iter_duplicate_packages(
+        environment=environment, ignore_list=ignore_list
+    ))
 
 
 def unset_requirements(packages=None, requirements=None):
@@ -118,10 +262,11 @@ def unlocked_requirements(requirements=None):
     :return: Requirements whose versions are not set
     """
     requirements = requirements or RequirementCollection()
+    any_version = current_settings().any_version
 
     return RequirementCollection(sorted((
         requirement for requirement in requirements
-        if str(requirement.specified_version) == Config.any_version
+        if str(requirement.specified_version) == any_version
     )))
 
 
@@ -140,37 +285,196 @@ def unset_locks(requirements=None, locked=None):
     ]))
 
 
+def _dependency_subtree(dependency, subtrees, path):
+    """Build a dependency tree of a dependency, reusing trees of packages
+        already built for other dependencies
+    :param dependency: Requirement or Package
+    :param subtrees: Trees built so far indexed by package key
+    :param path: Keys of dependencies on the path to the dependency
+    :return: Dependency tree of the dependency and whether it was cut at a
+        cyclic requirement
+    """
+    if dependency.key in subtrees:
+        return subtrees[dependency.key], False
+
+    path.add(dependency.key)
+    tree = OrderedDict()
+    cyclic = False
+    for requirement in dependency.requirements:
+        if requirement.key in path:
+            # Cyclic requirements are not expanded again
+            tree[requirement] = OrderedDict()
+            cyclic = True
+        else:
+            tree[requirement], requirement_cyclic = _dependency_subtree(
+                dependency=requirement, subtrees=subtrees, path=path
+            )
+            cyclic = cyclic or requirement_cyclic
+    path.discard(dependency.key)
+
+    # Trees cut at a cycle depend on the path they were reached through, so
+    # only trees without cycles are reused
+    if not cyclic:
+        subtrees[dependency.key] = tree
+    return tree, cyclic
+
+
 def package_dependency_tree(dependency):
-    """Returns a dependency tree for a single package
+    """Returns a dependency tree for a single package. Trees of packages
+        required multiple times are built once and shared.
     :param dependency: Requirement or Package
     :return: Dependency tree for the specified package or requirement
     """
-    return OrderedDict(sorted({
-        requirement: package_dependency_tree(dependency=requirement)
-        for requirement in dependency.requirements
-    }.items()))
+    tree, _ = _dependency_subtree(
+        dependency=dependency, subtrees={}, path=set()
+    )
+    return tree
+
+
+def tree_roots(packages=None, requirements=None):
+    """Returns packages that are not required by other packages, which are
+        roots of the dependency tree
+    :param packages: Collection of packages
+    :param requirements: Collection of requirements, only packages in
+        requirements are returned if provided
+    :return: Sorted list of packages
+    """
+    packages = packages or PackageCollection()
+    independent = set(packages.independent_packages.keys())
+    return sorted(
+        package for package in packages
+        if package.key in independent and (
+            # Include only the branches from provided requirements
+            # if they were provided
+            requirements is None or package.key in requirements.keys()
+        )
+    )
 
 
 def dependency_tree(packages=None, requirements=None):
-    """Returns a dependency tree for all packages
+    """Returns a dependency tree for all packages. Trees of packages required
+        multiple times are built once and shared.
     :param packages: Collection of packages
     :param requirements: Collection of requirements
     :return: Dependency tree for all packages
     """
-    packages = packages or PackageCollection()
-
-    tree = OrderedDict(sorted({
-        package: package_dependency_tree(dependency=package)
-        for package in packages
-        if package.key in packages.independent_packages.keys() and (
-            # Include only the branches from provided requirements
-            # if they were provided
-            requirements is None or
-            (requirements is not None and package.key in requirements.keys())
+    subtrees = {}
+    return OrderedDict(
+        (
+            package,
+            _dependency_subtree(
+                dependency=package, subtrees=subtrees, path=set()
+            )[0]
         )
-    }.items()))
+        for package in tree_roots(packages=packages, requirements=requirements)
+    )
 
-    return tree
+
+def _walk_tree(roots, children, max_depth=None):
+    """Walk trees depth-first, expanding every node only once. Nodes shown
+        before and nodes already on the path are marked instead of being
+        expanded again.
+    :param roots: List of root nodes
+    :param children: Function retrieving a list of child nodes and data of
+        the edges leading to them for a node, called only for nodes that
+        are expanded
+    :param max_depth: Depth of the deepest nodes walked, all nodes are
+        walked if not provided
+    :return: Generator of depths, nodes, edge data and marks, which are
+        None, TREE_REPEATED or TREE_CYCLIC
+    """
+    expanded = {}
+    for root in roots:
+        yield 0, root, None, None
+        if max_depth is not None and max_depth < 1:
+            continue
+
+        expanded[root.key] = children(root)
+        path = [root.key]
+        stack = [iter(expanded[root.key])]
+        while stack:
+            node, data = next(stack[-1], (None, None))
+            if node is None:
+                stack.pop()
+                path.pop()
+                continue
+
+            depth = len(stack)
+            if node.key in path:
+                yield depth, node, data, TREE_CYCLIC
+            elif node.key in expanded:
+                # Nodes without children are shown again without a mark
+                yield depth, node, data, (
+                    TREE_REPEATED if expanded[node.key] else None
+                )
+            else:
+                yield depth, node, data, None
+                if max_depth is None or depth < max_depth:
+                    expanded[node.key] = children(node)
+                    path.append(node.key)
+                    stack.append(iter(expanded[node.key]))
+
+
+def iter_dependency_tree(dependencies, max_depth=None):
+    """Walks dependency trees of dependencies depth-first without building
+        them. Requirements of every package are retrieved and expanded only
+        once, packages shown before and cyclic requirements are marked
+        instead of being expanded again.
+    :param dependencies: List of root dependencies
+    :param max_depth: Number of requirement levels walked below roots, all
+        levels are walked if not provided
+    :return: Generator of depths, dependencies and their marks, which are
+        None, TREE_REPEATED or TREE_CYCLIC
+    """
+    for depth, dependency, _, mark in _walk_tree(
+            roots=dependencies,
+            children=lambda dependency: [
+                (requirement, None) for requirement in dependency.requirements
+            ],
+            max_depth=max_depth):
+        yield depth, dependency, mark
+
+
+def reverse_dependency_index(packages=None):
+    """Index packages by keys of their requirements. Requirement metadata of
+        every package is read once, without creating requirement objects.
+    :param packages: Collection of packages
+    :return: Lists of packages and versions they require, sorted by package
+        key and indexed by requirement key
+    """
+    from dante.core.incremental import requirement_edges
+
+    packages = packages or PackageCollection()
+    index = {}
+    for package in sorted(packages):
+        for key, version in requirement_edges(package=package):
+            index.setdefault(key, []).append((package, version))
+    return index
+
+
+def iter_reverse_dependency_tree(dependency, packages=None, index=None,
+                                 max_depth=None):
+    """Walks the tree of packages requiring a package, directly or through
+        other packages, depth-first. Packages are looked up in a reverse
+        index, so only packages that are walked are visited.
+    :param dependency: Package or Requirement at the root of the tree
+    :param packages: Collection of packages, used to create the index
+    :param index: Reverse index of requirements, see
+        reverse_dependency_index, created from packages if not provided
+    :param max_depth: Number of levels walked below the root, all levels
+        are walked if not provided
+    :return: Generator of depths, packages, versions they require of their
+        parents and marks, which are None, TREE_REPEATED or TREE_CYCLIC
+    """
+    index = (
+        index if index is not None
+        else reverse_dependency_index(packages=packages)
+    )
+    return _walk_tree(
+        roots=[dependency],
+        children=lambda package: index.get(package.key, []),
+        max_depth=max_depth,
+    )
 
 
 def locked_requirements(packages=None, requirements=None, ignore_list=None):
@@ -235,11 +539,12 @@ def required_version_mismatch(requirements=None, locked=None):
     """
     requirements = requirements or RequirementCollection()
     locked = locked or RequirementCollection()
+    options = conflict_options()
 
     return [
         (requirement, str(lock.specified_version))
         for requirement in requirements for lock in locked
-        if requirement.key == lock.key and requirement.conflicting()
+        if requirement.key == lock.key and requirement.conflicting(**options)
     ]
 
 
@@ -281,6 +586,345 @@ def unnecessary_locks(requirements=None, locked=None, ignore_list=None):
     ]))
 
 
+def iter_required_requirements(requirements=None):
+    """Finds requirements and all requirements of their installed packages
+        one at a time, visiting every package only once
+    :param requirements: Collection of requirements
+    :return: Generator of requirement keys and requirements, in depth-first
+        order
+    """
+    requirements = requirements or RequirementCollection()
+
+    visited = set()
+    pending = [iter(requirements)]
+    while pending:
+        requirement = next(pending[-1], None)
+        if requirement is None:
+            pending.pop()
+        elif requirement.key not in visited:
+            visited.add(requirement.key)
+            yield requirement.key, requirement
+            pending.append(iter(requirement.requirements))
+
+
+def required_requirements(requirements=None):
+    """Returns requirements and all requirements of their installed packages,
+        visiting every package only once
+    :param requirements: Collection of requirements
+    :return: Requirements indexed by key, in depth-first order
+    """
+    return OrderedDict(iter_required_requirements(requirements=requirements))
+
+
+def validate_requirements(packages=None, requirements=None, locked=None,
+                          ignore_list=None, lock_version_mismatch=None):
+    """Run all requirement validations on indexes shared between them,
+        going through packages, requirements and locks only once
+    :param packages: Collection of packages
+    :param requirements: Collection of requirements
+    :param locked: Collection of locked requirements
+    :param ignore_list: List of package keys to ignore
+    :param lock_version_mismatch: Lock version mismatches, detected if not
+        provided
+    :return: ValidationResult with the same results as unlocked_requirements,
+        unset_locks, lock_version_mismatch, required_version_mismatch,
+        unnecessary_packages and unnecessary_locks
+    """
+    packages = packages or PackageCollection()
+    requirements = requirements or RequirementCollection()
+    locked = locked or RequirementCollection()
+    ignore_list = ignore_list or []
+
+    locks = OrderedDict()
+    for lock in locked:
+        locks.setdefault(lock.key, []).append(lock)
+    required = required_requirements(requirements=requirements)
+    any_version = current_settings().any_version
+    options = conflict_options()
+
+    unlocked, required_mismatch = [], []
+    for requirement in requirements:
+        if str(requirement.specified_version) == any_version:
+            unlocked.append(requirement)
+        requirement_locks = locks.get(requirement.key, [])
+        if requirement_locks and requirement.conflicting(**options):
+            required_mismatch.extend(
+                (requirement, str(lock.specified_version))
+                for lock in requirement_locks
+            )
+
+    lock_mismatch, not_required = [], []
+    for package in packages:
+        if lock_version_mismatch is None:
+            lock_mismatch.extend(
+                (package, str(lock.specified_version))
+                for lock in locks.get(package.key, [])
+                if package.specified_version != lock.specified_version
+            )
+        if package.key not in locks and package.key not in required:
+            not_required.append(package)
+
+    return ValidationResult(
+        unlocked_requirements=RequirementCollection(sorted(unlocked)),
+        unset_locks=RequirementCollection(sorted(
+            requirement for key, requirement in required.items()
+            if key not in locks
+        )),
+        lock_version_mismatch=(
+            lock_mismatch if lock_version_mismatch is None
+            else lock_version_mismatch
+        ),
+        required_version_mismatch=required_mismatch,
+        unnecessary_packages=PackageCollection(sorted(not_required)),
+        unnecessary_locks=RequirementCollection(sorted(
+            lock for lock in locked
+            if lock.key not in required and lock.key not in ignore_list
+        )),
+    )
+
+
+def locked_version(lock):
+    """Retrieve the version a requirement is locked to
+    :param lock: Locked requirement
+    :return: Version string or None if the requirement is not locked to a
+        single version
+    """
+    specifiers = list(lock.obj.specifier)
+    if len(specifiers) != 1 or specifiers[0].operator not in ('==', '==='):
+        return None
+    return specifiers[0].version
+
+
+def validate_requirement_files(requirements=None, locked=None,
+                               ignore_list=None, allow_named_versions=False,
+                               named_version_patterns=None):
+    """Run validations of requirements against locked requirements using only
+        parsed files, without looking up installed packages. Locked versions
+        are matched against required specifiers in memory. Dependencies of
+        requirements are not known without installed packages, so only
+        requirements from the files are expected to be locked.
+    :param requirements: Collection of requirements
+    :param locked: Collection of locked requirements
+    :param ignore_list: List of package keys to ignore
+    :param allow_named_versions: Whether named versions are allowed
+    :param named_version_patterns: Patterns for matching named versions
+    :return: ValidationResult without results of validations of installed
+        packages
+    """
+    requirements = requirements or RequirementCollection()
+    locked = locked or RequirementCollection()
+    ignore_list = ignore_list or []
+    settings = current_settings()
+    allow_named_versions = (
+        allow_named_versions or settings.allow_named_versions
+    )
+    named_version_patterns = (
+        named_version_patterns or settings.named_version_patterns
+    )
+
+    locks = OrderedDict()
+    for lock in locked:
+        locks.setdefault(lock.key, []).append(lock)
+    required = OrderedDict(
+        (requirement.key, requirement) for requirement in requirements
+    )
+
+    unlocked, required_mismatch = [], []
+    for requirement in requirements:
+        if str(requirement.specified_version) == settings.any_version:
+            unlocked.append(requirement)
+        for lock in locks.get(requirement.key, []):
+            version = locked_version(lock)
+            if version is None or requirement.obj.specifier.contains(
+                    version, prereleases=True):
+                continue
+            if allow_named_versions and any(
+                    re.match(pattern=pattern, string=version)
+                    for pattern in named_version_patterns):
+                continue
+            required_mismatch.append(
+                (requirement, str(lock.specified_version))
+            )
+
+    return ValidationResult(
+        unlocked_requirements=RequirementCollection(sorted(unlocked)),
+        unset_locks=RequirementCollection(sorted(
+            requirement for key, requirement in required.items()
+            if key not in locks
+        )),
+        lock_version_mismatch=[],
+        required_version_mismatch=required_mismatch,
+        unnecessary_packages=PackageCollection(),
+        unnecessary_locks=RequirementCollection(sorted(
+            lock for lock in locked
+            if lock.key not in required and lock.key not in ignore_list
+        )),
+    )
+
+
+def validation_failures(packages=None, requirements=None, locked=None,
+                        ignore_list=None, strict=False,
+                        lock_version_mismatch=None):
+    """Finds failures of requirement validations one at a time, in the order
+        validations are reported, so finding the first one does not run the
+        remaining validations
+    :param packages: Collection of packages
+    :param requirements: Collection of requirements
+    :param locked: Collection of locked requirements
+    :param ignore_list: List of package keys to ignore
+    :param strict: Include validations of unnecessary packages and locks
+    :param lock_version_mismatch: Lock version mismatches, detected if not
+        provided
+    :return: Generator of ValidationResult field names and items that failed
+        the validation
+    """
+    packages = packages or PackageCollection()
+    requirements = requirements or RequirementCollection()
+    locked = locked or RequirementCollection()
+    ignore_list = ignore_list or []
+
+    locks = OrderedDict()
+    for lock in locked:
+        locks.setdefault(lock.key, []).append(lock)
+
+    any_version = current_settings().any_version
+    for requirement in requirements:
+        if str(requirement.specified_version) == any_version:
+            yield 'unlocked_requirements', requirement
+
+    required = OrderedDict()
+    for key, requirement in iter_required_requirements(
+            requirements=requirements):
+        required[key] = requirement
+        if key not in locks:
+            yield 'unset_locks', requirement
+
+    if lock_version_mismatch is None:
+        for package in packages:
+            for lock in locks.get(package.key, []):
+                if package.specified_version != lock.specified_version:
+                    yield 'lock_version_mismatch', (
+                        package, str(lock.specified_version)
+                    )
+    else:
+        for mismatch in lock_version_mismatch:
+            yield 'lock_version_mismatch', mismatch
+
+    options = conflict_options()
+    for requirement in requirements:
+        requirement_locks = locks.get(requirement.key, [])
+        if requirement_locks and requirement.conflicting(**options):
+            for lock in requirement_locks:
+                yield 'required_version_mismatch', (
+                    requirement, str(lock.specified_version)
+                )
+
+    if not strict:
+        return
+
+    for package in packages:
+        if package.key not in locks and package.key not in required:
+            yield 'unnecessary_packages', package
+
+    for lock in locked:
+        if lock.key not in required and lock.key not in ignore_list:
+            yield 'unnecessary_locks', lock
+
+
+def first_validation_failure(packages=None, requirements=None, locked=None,
+                             ignore_list=None, strict=False,
+                             lock_version_mismatch=None):
+    """Run requirement validations until the first failure
+    :param packages: Collection of packages
+    :param requirements: Collection of requirements
+    :param locked: Collection of locked requirements
+    :param ignore_list: List of package keys to ignore
+    :param strict: Include validations of unnecessary packages and locks
+    :param lock_version_mismatch: Lock version mismatches, detected if not
+        provided
+    :return: ValidationResult with only the first failure found
+    """
+    results = OrderedDict((field, []) for field in ValidationResult._fields)
+    for field, item in validation_failures(
+            packages=packages,
+            requirements=requirements,
+            locked=locked,
+            ignore_list=ignore_list,
+            strict=strict,
+            lock_version_mismatch=lock_version_mismatch):
+        results[field].append(item)
+        break
+    return ValidationResult(**results)
+
+
+def environment_diff(packages=None, other_packages=None):
+    """Returns differences between two collections of packages by merging
+        them in key order
+    :param packages: Collection of packages
+    :param other_packages: Collection of packages compared to
+    :return: List of changes, packages from both collections and removed and
+        added requirements for packages found in both collections
+    """
+    packages = sorted(packages or PackageCollection())
+    other_packages = sorted(other_packages or PackageCollection())
+
+    def requirement_edges(package):
+        return OrderedDict(
+            ((requirement.key, str(requirement.specified_version)),
+             requirement)
+            for requirement in package.requirements
+        )
+
+    diff = []
+    index, other_index = 0, 0
+    while index < len(packages) or other_index < len(other_packages):
+        package = (
+            packages[index] if index < len(packages) else None
+        )
+        other_package = (
+            other_packages[other_index]
+            if other_index < len(other_packages) else None
+        )
+
+        if other_package is None or (
+                package is not None and package.key < other_package.key):
+            diff.append((REMOVED, package, None, [], []))
+            index += 1
+            continue
+
+        if package is None or other_package.key < package.key:
+            diff.append((ADDED, None, other_package, [], []))
+            other_index += 1
+            continue
+
+        index += 1
+        other_index += 1
+
+        version = parse_version(package.version_id)
+        other_version = parse_version(other_package.version_id)
+        edges = requirement_edges(package)
+        other_edges = requirement_edges(other_package)
+        removed = [
+            requirement for edge, requirement in edges.items()
+            if edge not in other_edges
+        ]
+        added = [
+            requirement for edge, requirement in other_edges.items()
+            if edge not in edges
+        ]
+
+        change = (
+            UPGRADED if other_version > version else
+            DOWNGRADED if other_version < version else
+            CHANGED if removed or added else
+            None
+        )
+        if change:
+            diff.append((change, package, other_package, removed, added))
+
+    return diff
+
+
 def get_graph(packages=None, name=None, filename=None, file_format=None,
               engine=None, strict=True, graph_attr=None, node_attr=None,
               edge_attr=None):
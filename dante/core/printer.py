@@ -1,11 +1,17 @@
+import sys
+from itertools import islice
+
 from dante.core import color
 
+# Number of table rows written to the output stream at once
+TABLE_CHUNK_SIZE = 1000
+
 
 class Printer:
     def __init__(
         self, foreground_color=None, color_info=None,
         color_success=None, color_error=None, color_warning=None,
-        color_package=None
+        color_package=None, stream=None, colors=None
     ):
         self.color_error = color_error or color.DEFAULT_ERROR
         self.color_info = color_info or color.DEFAULT_FOREGROUND
@@ -13,8 +19,30 @@ class Printer:
         self.color_package = color_package or color.DEFAULT_PACKAGE
         self.color_warning = color_warning or color.DEFAULT_WARNING
         self.color_foreground = foreground_color or color.DEFAULT_FOREGROUND
+        # Output stream, stdout is used if not provided
+        self.stream = stream
+        # Whether output is colored, decided by the stream if not provided
+        self.colors = colors
+        self._colors_stream = self._stream_colors = None
+
+    @property
+    def use_colors(self):
+        """Check whether output is colored. Unless set, colors are used only
+            when writing to a terminal, which is checked once per stream.
+        :return: Whether output is colored
+        """
+        if self.colors is not None:
+            return self.colors
+
+        stream = self.stream or sys.stdout
+        if stream is not self._colors_stream:
+            self._colors_stream = stream
+            self._stream_colors = color.enabled(stream=stream)
+        return self._stream_colors
 
     def colored_message(self, message, message_color):
+        if not self.use_colors:
+            return str(message)
         return color.set_color(
             message=message,
             message_color=message_color,
@@ -27,7 +55,8 @@ class Printer:
             self.colored_message(
                 message=message,
                 message_color=message_color
-            )
+            ),
+            file=self.stream
         )
 
     def info(self, message):
@@ -60,6 +89,70 @@ class Printer:
             message_color=self.color_package
         )
 
+    def lines(self, messages, message_color=None):
+        """Prints messages one at a time as they are generated
+        :param messages: Iterable of messages
+        :param message_color: Color of messages
+        :return: None
+        """
+        for message in messages:
+            self.print_message(message=message, message_color=message_color)
+
+    def _table_cells(self, items, colors=True):
+        """Convert table items to cells, measuring each item only once.
+            Only items that contain color characters are stripped.
+        :param items: Row items
+        :param colors: Keep color characters of items
+        :return: List of cell texts and their visible widths
+        """
+        cells = []
+        for item in items:
+            text = str(item)
+            if '\033' in text:
+                visible = color.strip(text)
+                cells.append((text if colors else visible, len(visible)))
+            else:
+                cells.append((text, len(text)))
+        return cells
+
+    def _table_rows(
+        self, headers, tabular_data, column_spacing=2, divider='-',
+        colors=True
+    ):
+        """Generate table rows, column widths are computed in a single pass
+            over the data
+        :param headers: table headers
+        :param tabular_data: list of rows of table data
+        :param column_spacing: spacing between two columns
+        :param divider: symbol used between headers and data
+        :param colors: Keep color characters of table data
+        :return: Generator of table rows
+        """
+        header_cells = self._table_cells(items=headers, colors=colors)
+        data_cells = [
+            self._table_cells(items=data_row, colors=colors)
+            for data_row in tabular_data
+        ]
+
+        widths = [width for _, width in header_cells]
+        for cells in data_cells:
+            for column_index, (_, width) in enumerate(cells):
+                if width > widths[column_index]:
+                    widths[column_index] = width
+
+        def tabulate_row(cells):
+            return ''.join([
+                text + ' ' * (widths[i] + column_spacing - width)
+                for i, (text, width) in enumerate(cells)
+            ]).strip()
+
+        yield tabulate_row(cells=header_cells)
+        yield tabulate_row(
+            cells=[(divider * width, width) for width in widths]
+        )
+        for cells in data_cells:
+            yield tabulate_row(cells=cells)
+
     def _tabulate_data(
         self, headers, tabular_data, column_spacing=2, divider='-'
     ):
@@ -69,51 +162,28 @@ class Printer:
         :param column_spacing: spacing between two columns
         :param divider: symbol used between headers and data
         """
-        max_lengths = [len(str(header)) for header in headers]
-        for data_row in tabular_data:
-            for column_index, item in enumerate(data_row):
-                item = str(item).replace(self.color_package, '')
-                item = str(item).replace(self.color_foreground, '')
-                if len(str(item)) > max_lengths[column_index]:
-                    max_lengths[column_index] = len(str(item))
-
-        dividers = [divider * length for length in max_lengths]
-
-        def tabulate_row(items):
-            row = ''
-            item_template = '{item}{spacing}'
-            for i, row_item in enumerate(items):
-
-                # clear colors before calculating
-                colorless_item = (
-                    str(row_item).replace(self.color_package, '')
-                )
-                colorless_item = colorless_item.replace(
-                    self.color_foreground, '')
-
-                item_spacing = ' ' * (
-                    max_lengths[i] +
-                    column_spacing -
-                    len(str(colorless_item))
-                )
-                row += item_template.format(
-                    item=row_item, spacing=item_spacing)
-            return row.strip() + '\n'
-
-        result = tabulate_row(items=headers)
-        result += tabulate_row(items=dividers)
-        for data_row in tabular_data:
-            result += tabulate_row(items=data_row)
-
-        return result.rstrip()
+        return '\n'.join(self._table_rows(
+            headers=headers,
+            tabular_data=tabular_data,
+            column_spacing=column_spacing,
+            divider=divider
+        )).rstrip()
 
     def table(self, headers, tabular_data):
-        """Prints table data
+        """Prints table data, rows are written to the stream in chunks.
+            Color characters are removed if colors are not used.
         :param headers: table headers
         :param tabular_data: data to fill the table with
         :return: None
         """
-        table = self._tabulate_data(
+        stream = self.stream or sys.stdout
+        rows = self._table_rows(
+            headers=headers,
             tabular_data=tabular_data,
-            headers=headers)
-        print(table)
+            colors=self.use_colors
+        )
+        while True:
+            chunk = list(islice(rows, TABLE_CHUNK_SIZE))
+            if not chunk:
+                break
+            stream.write('\n'.join(chunk) + '\n')
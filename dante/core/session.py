@@ -0,0 +1,366 @@
+from functools import wraps
+
+from dante.config import current_settings, use_settings
+from dante.core import operations
+from dante.core.environment import current_environment
+from dante.core.models import RequirementCollection
+
+# Inputs of operations, invalidating any of them invalidates all results
+INPUTS = ['packages', 'requirements', 'locked']
+
+
+def _freeze(value):
+    """Convert a value to a hashable one, so it can be a part of a key
+    :param value: Argument value
+    :return: Hashable value
+    """
+    if isinstance(value, dict):
+        return tuple(sorted(
+            (key, _freeze(item)) for key, item in value.items()
+        ))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def with_settings(method):
+    """Run a session method with settings of the session
+    :param method: Session method
+    :return: Method using settings of the session
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with use_settings(self.settings):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def cached(method):
+    """Cache results of a session method by it's arguments, until they are
+        invalidated. Methods are run with settings of the session.
+    :param method: Session method
+    :return: Method caching it's results
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            key = (
+                method.__name__,
+                _freeze(args),
+                _freeze(sorted(kwargs.items()))
+            )
+            hash(key)
+        except TypeError:
+            # Results for arguments that can not be compared are not cached
+            key = None
+
+        if key in self._results:
+            return self._results[key]
+        with use_settings(self.settings):
+            result = method(self, *args, **kwargs)
+        if key is not None:
+            self._results[key] = result
+        return result
+
+    return wrapper
+
+
+class Session:
+    """Analysis of a single environment and requirement files. Packages and
+    requirements are read once, operations are run when their results are
+    first used and the results are kept until they are invalidated.
+    Results are shared between calls, so they should not be modified.
+    """
+
+    def __init__(self, environment=None, requirements_files=None,
+                 lock_files=None, ignore_list=None, settings=None):
+        """Create session
+        :param environment: Environment to analyse, defaults to the
+            environment in use
+        :param requirements_files: List of requirement file paths, defaults
+            to configured requirement files
+        :param lock_files: List of lock file paths, defaults to configured
+            lock files
+        :param ignore_list: List of package keys to ignore, defaults to the
+            configured ignore list
+        :param settings: Settings used by operations, defaults to settings
+            in use
+        """
+        self.settings = settings or current_settings()
+        self.environment = environment or current_environment()
+        self.requirements_files = list(
+            requirements_files or self.settings.requirements_files
+        )
+        self.lock_files = list(lock_files or self.settings.lock_files)
+        self.ignore_list = list(ignore_list or self.settings.ignore_list)
+        self._results = {}
+
+    def invalidate(self, *names):
+        """Discard cached results, so they are computed again when used.
+            Invalidating packages, requirements or locked requirements
+            discards results of all operations as well.
+        :param names: Names of inputs or operations to invalidate, all
+            results are invalidated if not provided
+        :return: None
+        """
+        if not names:
+            self._results.clear()
+            return
+
+        inputs_changed = any(name in INPUTS for name in names)
+        for key in list(self._results):
+            name = key[0]
+            if name in names or inputs_changed and name not in INPUTS:
+                del self._results[key]
+
+    def refresh(self):
+        """Reload the environment and discard all cached results, e.g. after
+            packages are installed or requirement files are changed
+        :return: None
+        """
+        self.environment = self.environment.reload()
+        self.invalidate()
+
+    @property
+    @cached
+    def packages(self):
+        """Retrieve installed packages
+        :return: Collection of packages
+        """
+        return operations.dependency_list(
+            ignore_list=self.ignore_list, environment=self.environment
+        )
+
+    @property
+    @cached
+    def requirements(self):
+        """Retrieve requirements read from requirement files
+        :return: Collection of requirements
+        """
+        return RequirementCollection.from_files(
+            filepaths=self.requirements_files, environment=self.environment
+        )
+
+    @property
+    @cached
+    def locked(self):
+        """Retrieve locked requirements read from lock files
+        :return: Collection of locked requirements
+        """
+        return RequirementCollection.from_files(
+            filepaths=self.lock_files, environment=self.environment
+        )
+
+    @cached
+    def dependency_list(self, requirements=False):
+        """Returns installed packages
+        :param requirements: Return only packages in requirements
+        :return: List of packages
+        """
+        if not requirements:
+            return self.packages
+        return operations.dependency_list(
+            ignore_list=self.ignore_list,
+            requirements=self.requirements,
+            environment=self.environment,
+        )
+
+    @with_settings
+    def required_by(self, requirement):
+        """Returns all packages that require the provided requirement
+        :param requirement: Requirement object
+        :return: List of packages with their requirements
+        """
+        return operations.required_by(
+            requirement=requirement, packages=self.packages
+        )
+
+    @cached
+    def conflicting_dependencies(self, allow_named_versions=None,
+                                 named_version_patterns=None):
+        """Returns conflicting dependencies
+        :param allow_named_versions: Whether named versions are allowed,
+            defaults to the configured value
+        :param named_version_patterns: Patterns for matching named versions,
+            defaults to configured patterns
+        :return: List of conflicting dependencies
+        """
+        return operations.conflicting_dependencies(
+            packages=self.packages,
+            allow_named_versions=(
+                self.settings.allow_named_versions
+                if allow_named_versions is None else allow_named_versions
+            ),
+            named_version_patterns=(
+                named_version_patterns or self.settings.named_version_patterns
+            ),
+        )
+
+    @cached
+    def cyclic_dependencies(self):
+        """Returns all cyclic dependencies
+        :return: List of found cyclic paths
+        """
+        return operations.cyclic_dependencies(packages=self.packages)
+
+    @cached
+    def missing_requirements(self):
+        """Returns all requirements that are not installed
+        :return: List of missing requirements with packages requiring them
+        """
+        return operations.missing_requirements(
+            packages=self.packages,
+            requirements=self.requirements,
+            ignore_list=self.ignore_list,
+        )
+
+    @cached
+    def duplicate_packages(self):
+        """Returns packages that are installed multiple times
+        :return: List of active packages and packages shadowed by them
+        """
+        return operations.duplicate_packages(
+            environment=self.environment, ignore_list=self.ignore_list
+        )
+
+    @cached
+    def unset_requirements(self):
+        """Returns package requirements that are not in requirement files
+        :return: Requirements collection
+        """
+        return operations.unset_requirements(
+            packages=self.packages, requirements=self.requirements
+        )
+
+    @cached
+    def unlocked_requirements(self):
+        """Returns requirements that do not have a set version
+        :return: Requirements collection
+        """
+        return operations.unlocked_requirements(
+            requirements=self.requirements
+        )
+
+    @cached
+    def unset_locks(self):
+        """Returns requirements that are not version locked
+        :return: Requirements collection
+        """
+        return operations.unset_locks(
+            requirements=self.requirements, locked=self.locked
+        )
+
+    @with_settings
+    def package_dependency_tree(self, dependency):
+        """Returns a dependency tree for a single package
+        :param dependency: Requirement or Package
+        :return: Dependency tree for the specified package or requirement
+        """
+        return operations.package_dependency_tree(dependency=dependency)
+
+    @cached
+    def dependency_tree(self, requirements=False):
+        """Returns a dependency tree for all packages
+        :param requirements: Include only branches of requirements
+        :return: Dependency tree
+        """
+        return operations.dependency_tree(
+            packages=self.packages,
+            requirements=self.requirements if requirements else None,
+        )
+
+    @cached
+    def locked_requirements(self):
+        """Returns requirements locked to their installed versions
+        :return: Requirements collection
+        """
+        return operations.locked_requirements(
+            packages=self.packages,
+            requirements=self.requirements,
+            ignore_list=self.ignore_list,
+        )
+
+    @cached
+    def lock_version_mismatch(self):
+        """Returns packages with versions different from locked versions
+        :return: List of packages with locked versions
+        """
+        return operations.lock_version_mismatch(
+            packages=self.packages, locked=self.locked
+        )
+
+    @cached
+    def required_version_mismatch(self):
+        """Returns requirements with versions different from locked versions
+        :return: List of requirements with locked versions
+        """
+        return operations.required_version_mismatch(
+            requirements=self.requirements, locked=self.locked
+        )
+
+    @cached
+    def unnecessary_packages(self):
+        """Returns installed packages that are not required or locked
+        :return: Packages collection
+        """
+        return operations.unnecessary_packages(
+            packages=self.packages,
+            requirements=self.requirements,
+            locked=self.locked,
+        )
+
+    @cached
+    def unnecessary_locks(self):
+        """Returns locks of packages that are not required
+        :return: Requirements collection
+        """
+        return operations.unnecessary_locks(
+            requirements=self.requirements,
+            locked=self.locked,
+            ignore_list=self.ignore_list,
+        )
+
+    @cached
+    def validate_requirements(self):
+        """Run all requirement validations on shared indexes
+        :return: ValidationResult object
+        """
+        return operations.validate_requirements(
+            packages=self.packages,
+            requirements=self.requirements,
+            locked=self.locked,
+            ignore_list=self.ignore_list,
+        )
+
+    @with_settings
+    def environment_diff(self, other):
+        """Compare installed packages with packages of another session
+        :param other: Session object
+        :return: List of differences, see operations.environment_diff
+        """
+        return operations.environment_diff(
+            packages=self.packages, other_packages=other.packages
+        )
+
+    @cached
+    def get_graph(self, **kwargs):
+        """Returns a graph of installed packages
+        :param kwargs: Graph options, see operations.get_graph
+        :return: Graph object
+        """
+        return operations.get_graph(packages=self.packages, **kwargs)
+
+    @with_settings
+    def render_graph(self, graph=None, view=False):
+        """Render a graph of installed packages
+        :param graph: Graph to render, created with default options if not
+            provided
+        :param view: Display created graph
+        :return: Saved render filepath
+        """
+        return operations.render_graph(
+            packages=self.packages,
+            graph=graph or self.get_graph(),
+            view=view,
+        )
@@ -0,0 +1,111 @@
+import json
+
+from dante.vendor.packaging.version import parse as parse_version
+
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotDistribution:
+    def __init__(self, name, version, requires=None):
+        """Create distribution from snapshot data
+        :param name: Distribution name
+        :param version: Distribution version string
+        :param requires: List of requirement strings
+        """
+        self.project_name = name
+        self.key = name.lower()
+        self.version = version
+        self.parsed_version = parse_version(version)
+        self._requires = requires or []
+        self._parsed_requires = None
+
+    def __repr__(self):
+        """Represent distribution with it's name and version
+        :return: Distribution representation
+        """
+        return '{} {}'.format(self.project_name, self.version)
+
+    def requires(self):
+        """Retrieve distribution requirements
+        :return: List of setuptools requirement objects
+        """
+        if self._parsed_requires is None:
+            from dante.vendor import pkg_resources
+            self._parsed_requires = [
+                pkg_resources.Requirement.parse(requirement)
+                for requirement in self._requires
+            ]
+        return self._parsed_requires
+
+
+class SnapshotWorkingSet:
+    def __init__(self, distributions=None):
+        """Create working set from snapshot distributions
+        :param distributions: List of snapshot distributions
+        """
+        self.by_key = {
+            distribution.key: distribution
+            for distribution in distributions or []
+        }
+
+    def __iter__(self):
+        """Iterate over distributions in the working set
+        :return: Distribution iterator
+        """
+        return iter(self.by_key.values())
+
+
+def to_json(distributions):
+    """Serialize distributions to a snapshot json string
+    :param distributions: Distributions (e.g. working set)
+    :return: Snapshot json string
+    """
+    return json.dumps({
+        'version': SNAPSHOT_VERSION,
+        'packages': [
+            [
+                distribution.project_name,
+                str(distribution.version),
+                sorted(str(requirement)
+                       for requirement in distribution.requires()),
+            ]
+            for distribution in sorted(distributions, key=lambda d: d.key)
+        ]
+    }, separators=(',', ':'))
+
+
+def from_json(data):
+    """Create a working set from a snapshot json string
+    :param data: Snapshot json string
+    :return: SnapshotWorkingSet object
+    """
+    snapshot = json.loads(data)
+    version = snapshot.get('version')
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(
+            'Unsupported snapshot version: {}'.format(version)
+        )
+
+    return SnapshotWorkingSet([
+        SnapshotDistribution(name=name, version=version, requires=requires)
+        for name, version, requires in snapshot['packages']
+    ])
+
+
+def save_snapshot(distributions, filepath):
+    """Save distributions to a snapshot file
+    :param distributions: Distributions (e.g. working set)
+    :param filepath: Snapshot file path
+    :return: None
+    """
+    with open(str(filepath), 'w') as snapshot_file:
+        snapshot_file.write(to_json(distributions=distributions))
+
+
+def load_snapshot(filepath):
+    """Load a working set from a snapshot file
+    :param filepath: Snapshot file path
+    :return: SnapshotWorkingSet object
+    """
+    with open(str(filepath), 'r') as snapshot_file:
+        return from_json(data=snapshot_file.read())
@@ -0,0 +1,258 @@
+import os
+import abc
+import time
+import select
+import struct
+
+from dante.core.cache import path_fingerprint
+
+# Inotify event masks, see inotify(7)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+    IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+# Events that mean watches are no longer reliable
+RESET_MASK = IN_Q_OVERFLOW | IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF
+EVENT_FORMAT = 'iIII'
+EVENT_SIZE = struct.calcsize(EVENT_FORMAT)
+
+# Entries of environment directories which change with installed packages
+METADATA_SUFFIXES = ('.dist-info', '.egg-info', '.egg-link', '.pth', '.egg')
+
+
+class Watcher(abc.ABC):
+    """Base watcher of files and environment directories. Add new watchers
+    by inheriting this class.
+    """
+
+    def __init__(self, files=None, directories=None):
+        """Create watcher
+        :param files: List of file paths (e.g. requirement files)
+        :param directories: List of directory paths (e.g. site-packages)
+        """
+        self.files = [os.path.abspath(path) for path in files or []]
+        self.directories = [
+            os.path.abspath(path) for path in directories or []
+        ]
+
+    @abc.abstractmethod
+    def changed(self, timeout=None):
+        """Wait for a change of watched paths
+        :param timeout: Maximum time to wait in seconds, waits until a
+            change if not provided
+        :return: Whether anything changed
+        """
+        pass
+
+    def wait(self, debounce=0.5):
+        """Wait for a change and until watched paths stop changing, e.g.
+            while packages are being installed
+        :param debounce: Time without changes in seconds
+        :return: None
+        """
+        while not self.changed():
+            pass
+        while self.changed(timeout=debounce):
+            pass
+
+    def close(self):
+        """Stop watching
+        :return: None
+        """
+
+    def __enter__(self):
+        """Use watcher as a context manager
+        :return: Watcher object
+        """
+        return self
+
+    def __exit__(self, *args):
+        """Stop watching when leaving the context
+        :param args: Exception information
+        :return: None
+        """
+        self.close()
+
+
+class PollingWatcher(Watcher):
+    """Watcher comparing modification times of watched paths"""
+
+    def __init__(self, files=None, directories=None, interval=1.0):
+        """Create polling watcher
+        :param files: List of file paths
+        :param directories: List of directory paths
+        :param interval: Time between checks in seconds
+        """
+        super().__init__(files=files, directories=directories)
+        self.interval = interval
+        self._fingerprint = self.fingerprint()
+
+    def fingerprint(self):
+        """Retrieve modification times of watched paths, directories are
+            modified whenever an entry in them is added or removed
+        :return: Fingerprint
+        """
+        return path_fingerprint(paths=self.files + self.directories)
+
+    def changed(self, timeout=None):
+        """Check watched paths for a change every interval
+        :param timeout: Maximum time to wait in seconds
+        :return: Whether anything changed
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            fingerprint = self.fingerprint()
+            if fingerprint != self._fingerprint:
+                self._fingerprint = fingerprint
+                return True
+
+            remaining = (
+                self.interval if deadline is None
+                else min(self.interval, deadline - time.monotonic())
+            )
+            if remaining <= 0:
+                return False
+            time.sleep(remaining)
+
+
+class InotifyWatcher(Watcher):
+    """Watcher receiving changes from the kernel through inotify, only
+    available on Linux
+    """
+
+    def __init__(self, files=None, directories=None):
+        """Create inotify watcher
+        :param files: List of file paths
+        :param directories: List of directory paths
+        :raises OSError: If inotify is not available
+        """
+        super().__init__(files=files, directories=directories)
+        import ctypes
+        import ctypes.util
+
+        try:
+            libc = ctypes.CDLL(
+                ctypes.util.find_library('c') or 'libc.so.6', use_errno=True
+            )
+            self._add_watch = libc.inotify_add_watch
+            self._add_watch.argtypes = [
+                ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32
+            ]
+            self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except AttributeError:
+            raise OSError('inotify is not available')
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+        self._watches = {}
+        self._add_watches()
+
+    def _add_watches(self):
+        """Watch environment directories and directories of watched files,
+            since files are often replaced instead of modified
+        :return: None
+        """
+        directories = self.directories + [
+            os.path.dirname(path) for path in self.files
+        ]
+        for directory in directories:
+            if directory in self._watches.values():
+                continue
+            descriptor = self._add_watch(
+                self.fd, os.fsencode(directory), WATCH_MASK
+            )
+            if descriptor >= 0:
+                self._watches[descriptor] = directory
+
+    def _relevant(self, directory, name):
+        """Check whether a change of a directory entry is relevant
+        :param directory: Directory path
+        :param name: Entry name
+        :return: Whether the change is relevant
+        """
+        return (
+            os.path.join(directory, name) in self.files or
+            directory in self.directories and
+            name.lower().endswith(METADATA_SUFFIXES)
+        )
+
+    def changed(self, timeout=None):
+        """Wait for relevant inotify events
+        :param timeout: Maximum time to wait in seconds
+        :return: Whether anything changed
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = (
+                None if deadline is None
+                else max(deadline - time.monotonic(), 0)
+            )
+            readable, _, _ = select.select([self.fd], [], [], remaining)
+            if not readable:
+                return False
+
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+
+            changed = False
+            offset = 0
+            while offset + EVENT_SIZE <= len(data):
+                descriptor, mask, _, length = struct.unpack_from(
+                    EVENT_FORMAT, data, offset
+                )
+                name = os.fsdecode(
+                    data[offset + EVENT_SIZE:offset + EVENT_SIZE + length]
+                    .rstrip(b'\0')
+                )
+                offset += EVENT_SIZE + length
+
+                if mask & RESET_MASK:
+                    # Watched directory was removed or events were lost
+                    self._watches.pop(descriptor, None)
+                    changed = True
+                elif self._relevant(
+                        directory=self._watches.get(descriptor, ''),
+                        name=name):
+                    changed = True
+
+            if changed:
+                self._add_watches()
+                return True
+
+    def close(self):
+        """Stop watching and release the inotify instance
+        :return: None
+        """
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_watcher(files=None, directories=None, interval=1.0):
+    """Create the most efficient watcher available
+    :param files: List of file paths
+    :param directories: List of directory paths
+    :param interval: Time between checks in seconds, if paths are polled
+    :return: Watcher object
+    """
+    try:
+        return InotifyWatcher(files=files, directories=directories)
+    except OSError:
+        return PollingWatcher(
+            files=files, directories=directories, interval=interval
+        )
@@ -1,10 +1,32 @@
 PACKAGE = 'Package'
 REQUIRED = 'Required'
+REQUIRES = 'Requires'
 LOCKED = 'Locked'
 REQUIRED_BY = 'Required by'
 INSTALLED = 'Installed'
+REQUIREMENT = 'Requirement'
+CHANGE = 'Change'
+OLD = 'Old'
+NEW = 'New'
+STATUS = 'Status'
+LOCATION = 'Location'
+FILE = 'File'
+ACTIVE = 'active'
+SHADOWED = 'shadowed'
+MISSING = 'missing'
+MODIFIED = 'modified'
+UNTRACKED = 'untracked'
+PROJECT = 'Project'
+PASSED = 'passed'
+FAILED = 'failed'
+ERROR = 'error'
 PACKAGES_NOT_FOUND = 'No packages found'
 PACKAGE_NOT_FOUND = 'Package "{package}" not found'
+ENVIRONMENT_NOT_FOUND = 'Environment "{path}" not found'
+
+TREE_REPEATED = 'dependencies shown above'
+TREE_CYCLIC = 'cyclic'
+TREE_REVERSE_PACKAGE = 'Reverse tree requires a package'
 
 CONFLICTS_OK = 'No conflicts found'
 CONFLICTS_FOUND = 'Conflicting packages found'
@@ -15,11 +37,44 @@ CYCLIC_FOUND = 'Cyclic dependencies found'
 MISSING_OK = 'No missing dependencies found'
 MISSING_FOUND = 'Missing dependencies found'
 
+DUPLICATES_OK = 'No duplicate packages found'
+DUPLICATES_FOUND = 'Duplicate packages found'
+
+VERIFY_OK = 'Files of {count} packages verified'
+VERIFY_FOUND = 'Package file mismatches found'
+VERIFY_SKIPPED = 'Packages without a record skipped: {packages}'
+
+DAEMON_STARTED = 'Daemon listening on "{path}"'
+DAEMON_STOPPED = 'Daemon stopped'
+DAEMON_RUNNING = 'Daemon is already running'
+DAEMON_NOT_RUNNING = 'Daemon is not running'
+DAEMON_NOT_SUPPORTED = 'Daemon requires unix sockets'
+DAEMON_INVALID_REQUEST = 'Invalid request'
+
+AUDIT_RESULT = '{status:<6}  {duration:6.2f}s  {path}'
+AUDIT_TOTALS = (
+    'Audited {count} environments in {duration:.2f}s: '
+    '{passed} passed, {failed} failed, {errors} errors'
+)
+AUDIT_NOT_FOUND = 'No environments found'
+AUDIT_PATH_NOT_FOUND = 'No environments found in "{path}"'
+
+PROJECT_CHECKS = 'Checking project "{project}"'
+PROJECTS_NOT_FOUND = 'No project directories found'
+
+WATCHING = 'Watching for changes, press Ctrl+C to stop'
+
+DIFF_OK = 'No environment differences found'
+DIFF_FOUND = 'Environment differences found'
+
 GRAPH_EXPORTED = 'Graph exported to "{file_path}"'
 GRAPH_FAILED_TO_RENDER = 'Graph failed to render: {error}'
 
 LOCK_EXPORTED = 'Lock file exported to "{file_path}"'
 
+SNAPSHOT_EXPORTED = 'Snapshot exported to "{file_path}"'
+SNAPSHOT_INVALID = 'Invalid snapshot "{file_path}": {error}'
+
 PACKAGE_VERSION_MISMATCH_FOUND = 'Package version mismatch found'
 PACKAGE_VERSION_MISMATCH_OK = 'All package versions matching'
 
@@ -1,4 +1,4 @@
-from dante.config import Config
+from dante.config import current_settings
 from dante.parsers.pip import PipParser
 
 
@@ -12,7 +12,7 @@ class Parser:
     def parse_requirements_file(*args, **kwargs):
         """Run set parser's requirements file parse method"""
         return (
-            Parser.parser_map.get(Config.parser, PipParser)
+            Parser.parser_map.get(current_settings().parser, PipParser)
             .parse_requirements_file(*args, **kwargs)
         )
 
@@ -20,6 +20,6 @@ class Parser:
     def save_lock_file(*args, **kwargs):
         """Run set parser's lock file save method"""
         return (
-            Parser.parser_map.get(Config.parser, PipParser)
+            Parser.parser_map.get(current_settings().parser, PipParser)
             .save_lock_file(*args, **kwargs)
         )
@@ -1,4 +1,4 @@
-from dante.config import Config
+from dante.config import current_settings
 from dante.core.models import RequirementCollection, Requirement
 from dante.parsers.base import BaseParser
 
@@ -7,9 +7,10 @@ class PipParser(BaseParser):
     """Parser for pip's standard requirements files"""
 
     @staticmethod
-    def parse_requirements_file(filepath):
+    def parse_requirements_file(filepath, standalone=False):
         """Parse requirements file and return a collection of requirements
         :param filepath: Filepath of requirements file
+        :param standalone: Parse requirements without pkg_resources
         :return: Collection of requirements
         """
         with open(str(filepath), 'r') as requirements_file:
@@ -28,7 +29,7 @@ class PipParser(BaseParser):
             ]
 
         requirements = RequirementCollection([
-            Requirement.from_requirement_string(row)
+            Requirement.from_requirement_string(row, standalone=standalone)
             for row in data
         ])
         return requirements
@@ -39,7 +40,7 @@ class PipParser(BaseParser):
         :param requirements: Collection of requirements
         :param filepath: Filepath for lock file
         """
-        filepath = str(filepath or Config.lock_file_path)
+        filepath = str(filepath or current_settings().lock_file_path)
         with open(filepath, 'w') as lock_file:
             data = [
                 '{package_key}=={version}\n'.format(
@@ -0,0 +1,87 @@
+from argparse import Namespace
+
+import pytest
+
+from dante import messages
+from dante.config import Config
+from dante.commands.audit import audit_command, audit_environment
+
+from tests.conftest import create_distribution
+
+pytestmark = pytest.mark.audit
+
+
+def test_audit_environment(venv_path):
+    # action
+    result = audit_environment(
+        path=str(venv_path), checks=['conflicts', 'duplicates']
+    )
+
+    # verification
+    assert result['status'] == messages.PASSED
+    assert result['failed'] == []
+    assert result['error'] is None
+
+
+def test_audit_command(capsys, monkeypatch, tmp_path):
+    # preconditions
+    create_distribution(
+        tmp_path / 'env1' / 'site-packages',
+        'audit-package1', '1.0.0', ['audit-package2>=2.0.0']
+    )
+    create_distribution(
+        tmp_path / 'env1' / 'site-packages', 'audit-package2', '1.0.0'
+    )
+    create_distribution(
+        tmp_path / 'env2' / 'site-packages', 'audit-package1', '1.0.0'
+    )
+    create_distribution(
+        tmp_path / 'env3' / 'site-packages',
+        'audit-package1', '1.0.0', ['audit-package2 >>> 1.0.0']
+    )
+    monkeypatch.setattr(Config, 'checks', ['conflicts', 'missing'])
+    args = Namespace(ignore=None, paths=[str(tmp_path)], jobs=2)
+
+    # action
+    with pytest.raises(SystemExit):
+        audit_command(args)
+
+    # verification
+    lines = capsys.readouterr().out.splitlines()
+    statuses = {
+        environment: status
+        for line in lines[:-1]
+        for environment, status in [
+            ('env1', messages.FAILED),
+            ('env2', messages.PASSED),
+            ('env3', messages.ERROR),
+        ]
+        if environment in line and status in line
+    }
+    assert len(lines) == 4
+    assert sorted(statuses) == ['env1', 'env2', 'env3']
+    assert '1 passed, 1 failed, 1 errors' in lines[-1]
+
+
+def test_audit_command_paths_not_found(capsys, monkeypatch, tmp_path):
+    # preconditions
+    site_directory = tmp_path / 'sp'
+    create_distribution(site_directory, 'audit-package1', '1.0.0')
+    (tmp_path / 'empty').mkdir()
+    monkeypatch.setattr(Config, 'checks', ['conflicts'])
+    args = Namespace(
+        ignore=None,
+        paths=[str(site_directory), str(tmp_path / 'empty')],
+        jobs=1,
+    )
+
+    # action
+    audit_command(args)
+
+    # verification
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == messages.AUDIT_PATH_NOT_FOUND.format(
+        path=tmp_path / 'empty'
+    )
+    assert messages.PASSED in lines[1] and str(site_directory) in lines[1]
+    assert '1 passed' in lines[-1]
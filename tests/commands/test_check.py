@@ -0,0 +1,225 @@
+import os
+import shutil
+from argparse import Namespace
+
+import pytest
+
+from dante import messages
+from dante.config import Config
+from dante.commands import check
+from dante.core import color, daemon, environment, operations
+
+from tests.conftest import create_distribution
+
+pytestmark = pytest.mark.check
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_check_all(capsys, monkeypatch, tmp_path, jobs):
+    # preconditions
+    requirements_file = tmp_path / 'requirements.txt'
+    requirements_file.write_text('check-package1\n')
+    lock_file = tmp_path / 'requirements.lock'
+    lock_file.write_text('check-package1==1.0.0\ncheck-package2==2.0.0\n')
+    environment.use(environment.FakeEnvironment({
+        'check-package1': ('1.0.0', ['check-package2>=3.0.0']),
+        'check-package2': '2.0.0',
+    }))
+    monkeypatch.setattr(Config, 'checks', ['conflicts', 'validate'])
+    args = Namespace(
+        ignore=None,
+        requirements=[str(requirements_file)],
+        lock=[str(lock_file)],
+        strict=False,
+        jobs=jobs,
+    )
+
+    # action
+    with pytest.raises(SystemExit):
+        check.check_all(args)
+
+    # verification
+    output = capsys.readouterr().out
+    assert (
+        output.index(messages.UNLOCKED_REQUIREMENTS_FOUND) <
+        output.index(messages.UNSET_LOCKS_OK) <
+        output.index(messages.CONFLICTS_FOUND)
+    )
+    assert '\033' not in output
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_check_all_fail_fast(capsys, monkeypatch, tmp_path, jobs):
+    # preconditions
+    environment.use(environment.FakeEnvironment({
+        'check-package1': ('1.0.0', [
+            'check-package2>=3.0.0', 'check-package3>=3.0.0'
+        ]),
+        'check-package2': '2.0.0',
+        'check-package3': '2.0.0',
+    }))
+    monkeypatch.setattr(Config, 'checks', ['conflicts', 'duplicates'])
+    args = Namespace(
+        ignore=None,
+        requirements=[],
+        lock=[],
+        strict=False,
+        jobs=jobs,
+        fail_fast=True,
+    )
+
+    # action
+    with pytest.raises(SystemExit):
+        check.check_all(args)
+
+    # verification
+    output = capsys.readouterr().out
+    assert messages.CONFLICTS_FOUND in output
+    assert 'check-package2' in output
+    assert 'check-package3' not in output
+    assert messages.DUPLICATES_OK not in output
+
+
+def test_check_all_cached(capsys, monkeypatch, tmp_path):
+    # preconditions
+    site_packages = tmp_path / 'site-packages'
+    create_distribution(site_packages, 'check-package1', '1.0.0')
+    requirements_file = tmp_path / 'requirements.txt'
+    requirements_file.write_text('check-package1==1.0.0\n')
+    environment.use(environment.PathEnvironment(paths=[str(site_packages)]))
+    monkeypatch.setenv('DANTE_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(Config, 'checks', ['conflicts', 'missing'])
+    args = Namespace(
+        ignore=None,
+        requirements=[str(requirements_file)],
+        lock=[],
+        strict=False,
+        jobs=1,
+    )
+    check.check_all(args)
+    output = capsys.readouterr().out
+
+    # action
+    monkeypatch.setattr(operations, 'dependency_list', None)
+    check.check_all(args)
+
+    # verification
+    assert capsys.readouterr().out == output
+    with color.use_colors(colors=True), pytest.raises(TypeError):
+        check.check_all(args)
+    requirements_file.write_text('check-package1==2.0.0\n')
+    with pytest.raises(TypeError):
+        check.check_all(args)
+
+
+def test_check_all_incremental(capsys, monkeypatch, tmp_path):
+    # preconditions
+    site_packages = tmp_path / 'site-packages'
+    create_distribution(
+        site_packages, 'check-package1', '1.0.0', ['check-package2>=2.0.0']
+    )
+    package2 = create_distribution(site_packages, 'check-package2', '2.0.0')
+    create_distribution(site_packages, 'check-package3', '1.0.0')
+    requirements_file = tmp_path / 'requirements.txt'
+    requirements_file.write_text('check-package1\ncheck-package3\n')
+    environment.use(environment.PathEnvironment(paths=[str(site_packages)]))
+    monkeypatch.setenv('DANTE_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(Config, 'checks', ['conflicts', 'missing'])
+    args = Namespace(
+        ignore=None,
+        requirements=[str(requirements_file)],
+        lock=[],
+        strict=False,
+        jobs=1,
+        no_cache=False,
+    )
+    check.check_all(args)
+    capsys.readouterr()
+    shutil.rmtree(str(package2))
+    create_distribution(site_packages, 'check-package2', '1.0.0')
+    environment.use(environment.PathEnvironment(paths=[str(site_packages)]))
+
+    # action
+    with pytest.raises(SystemExit):
+        check.check_all(args)
+    output = capsys.readouterr().out
+
+    # verification
+    args.no_cache = True
+    with pytest.raises(SystemExit):
+        check.check_all(args)
+    assert capsys.readouterr().out == output
+    assert 'check-package2' in output
+
+
+def test_check_projects(capsys, monkeypatch, mocker, tmp_path):
+    # preconditions
+    cwd = os.getcwd()
+    for project, requirement in [
+            ('project1', 'check-package1'), ('project2', 'check-package2')]:
+        (tmp_path / project).mkdir()
+        (tmp_path / project / 'setup.cfg').write_text(
+            '[dante]\nchecks = missing\n'
+        )
+        (tmp_path / project / 'requirements.txt').write_text(requirement)
+    environment.use(environment.FakeEnvironment({
+        'check-package1': '1.0.0',
+    }))
+    monkeypatch.chdir(tmp_path)
+    chdir = mocker.spy(os, 'chdir')
+    args = Namespace(
+        ignore=None,
+        requirements=None,
+        lock=None,
+        strict=False,
+        jobs=1,
+        no_cache=True,
+        projects=['project*'],
+    )
+
+    # action
+    with pytest.raises(SystemExit):
+        check.check_all(args)
+    Config.reset(directory=cwd)
+
+    # verification
+    output = capsys.readouterr().out
+    assert (
+        output.index(str(tmp_path / 'project1')) <
+        output.index(messages.MISSING_OK) <
+        output.index(str(tmp_path / 'project2')) <
+        output.index(messages.MISSING_FOUND)
+    )
+    assert output.rstrip().endswith(
+        'project1  passed\nproject2  failed'
+    )
+    assert chdir.call_count == 0
+
+
+def test_check_all_in_daemon(capsys, monkeypatch, mocker):
+    # preconditions
+    environment.use(environment.FakeEnvironment({
+        'check-package1': ('1.0.0', ['check-package2>=3.0.0']),
+        'check-package2': '2.0.0',
+    }))
+    monkeypatch.setattr(Config, 'checks', ['conflicts', 'duplicates'])
+    monkeypatch.setattr(daemon, '_running_command', True)
+    get_context = mocker.patch('multiprocessing.get_context')
+    args = Namespace(
+        ignore=None,
+        requirements=[],
+        lock=[],
+        strict=False,
+        jobs=2,
+        fail_fast=True,
+    )
+
+    # action
+    with pytest.raises(SystemExit):
+        check.check_all(args)
+
+    # verification
+    output = capsys.readouterr().out
+    assert messages.CONFLICTS_FOUND in output
+    assert messages.DUPLICATES_OK not in output
+    assert get_context.call_count == 0
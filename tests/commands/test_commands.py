@@ -0,0 +1,31 @@
+import sys
+import subprocess
+
+import pytest
+
+from dante import commands
+from dante.commands.config import config_command
+
+pytestmark = pytest.mark.commands
+
+
+def test_load_command():
+    # action
+    command = commands.load_command(name='config_command')
+
+    # verification
+    assert command is config_command
+
+
+def test_cli_imports_only_dispatched_command():
+    # action
+    output = subprocess.check_output([
+        sys.executable, '-c',
+        'import sys; from dante.cli import cli; '
+        'args = cli().parse_args(["config"]); '
+        'print(sorted(name for name in sys.modules '
+        'if name.startswith("dante.commands.")))'
+    ])
+
+    # verification
+    assert output.decode().strip() == '[]'
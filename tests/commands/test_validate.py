@@ -226,3 +226,39 @@ def test_check_unnecessary_requirements(capsys, test_data):
         for package in package_list:
             if package not in required:
                 assert package in captured.out
+
+
+def test_validate_files_only(capsys, mocker, tmp_path):
+    # preconditions
+    requirements_file = tmp_path / 'requirements.txt'
+    requirements_file.write_text('package1>=1.0\npackage2\npackage3<2\n')
+    lock_file = tmp_path / 'requirements.lock'
+    lock_file.write_text('package1==1.2.0\npackage3==2.1\npackage4==1.0\n')
+    # Neither pkg_resources nor installed packages are used
+    mocker.patch.object(Requirement, 'parse', side_effect=AssertionError)
+    mocker.patch(
+        'dante.commands.validate.dependency_list', side_effect=AssertionError
+    )
+    args = Namespace(
+        strict=True,
+        ignore=None,
+        requirements=[str(requirements_file)],
+        lock=[str(lock_file)],
+        files_only=True,
+    )
+
+    # action
+    success = validate.validate_command(args, exit_on_failure=False)
+
+    # verification
+    output = capsys.readouterr().out
+    assert not success
+    assert messages.UNLOCKED_REQUIREMENTS_FOUND in output
+    assert messages.UNSET_LOCKS_FOUND in output
+    assert messages.REQUIREMENT_VERSION_MISMATCH_FOUND in output
+    assert messages.LOCK_NOT_REQUIRED_FOUND in output
+    assert messages.PACKAGE_VERSION_MISMATCH_FOUND not in output
+    assert messages.PACKAGE_VERSION_MISMATCH_OK not in output
+    assert messages.PACKAGE_NOT_REQUIRED_OK not in output
+    mismatch = output.split(messages.REQUIREMENT_VERSION_MISMATCH_FOUND)[1]
+    assert 'package3' in mismatch and 'package1' not in mismatch
@@ -0,0 +1,55 @@
+from argparse import Namespace
+
+import pytest
+
+from dante import messages
+from dante.config import Config
+from dante.core import environment, watcher
+from dante.commands.watch import watch_command
+
+from tests.conftest import create_distribution
+
+pytestmark = pytest.mark.watch
+
+
+def test_watch_command(capsys, monkeypatch, tmp_path):
+    # preconditions
+    site_packages = tmp_path / 'site-packages'
+    create_distribution(
+        site_packages, 'watch-package1', '1.0.0', ['watch-package2>=2.0.0']
+    )
+    create_distribution(site_packages, 'watch-package2', '2.0.0')
+    requirements_file = tmp_path / 'requirements.txt'
+    requirements_file.write_text('watch-package1\n')
+    environment.use(environment.PathEnvironment(paths=[str(site_packages)]))
+    monkeypatch.setenv('DANTE_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(Config, 'checks', ['conflicts', 'missing'])
+    changes = [
+        lambda: create_distribution(site_packages, 'watch-package3', '1.0.0'),
+        lambda: requirements_file.write_text('watch-package3\n'),
+    ]
+
+    def wait(self, debounce):
+        if not changes:
+            raise KeyboardInterrupt
+        changes.pop(0)()
+
+    monkeypatch.setattr(watcher.Watcher, 'wait', wait)
+    args = Namespace(
+        ignore=None,
+        requirements=[str(requirements_file)],
+        lock=[],
+        strict=False,
+        jobs=1,
+        interval=0.1,
+        debounce=0.1,
+    )
+
+    # action
+    watch_command(args)
+
+    # verification
+    output = capsys.readouterr().out
+    assert output.count(messages.WATCHING) == 3
+    assert output.count(messages.MISSING_OK) == 3
+    assert environment.current_environment().get(key='watch-package3')
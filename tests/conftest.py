@@ -0,0 +1,42 @@
+import pytest
+
+from dante.core import environment
+
+METADATA = (
+    'Metadata-Version: 2.1\n'
+    'Name: {name}\n'
+    'Version: {version}\n'
+    '{requires}'
+)
+
+
+def create_distribution(site_packages, name, version, requires=None):
+    dist_info = site_packages / '{}-{}.dist-info'.format(
+        name.replace('-', '_'), version
+    )
+    dist_info.mkdir(parents=True)
+    (dist_info / 'METADATA').write_text(METADATA.format(
+        name=name,
+        version=version,
+        requires=''.join(
+            'Requires-Dist: {}\n'.format(requirement)
+            for requirement in requires or []
+        )
+    ))
+    return dist_info
+
+
+@pytest.fixture
+def venv_path(tmp_path):
+    site_packages = tmp_path / 'lib' / 'python3.7' / 'site-packages'
+    create_distribution(
+        site_packages, 'env-package1', '1.0.0', ['env-package2>=2.0.0']
+    )
+    create_distribution(site_packages, 'env-package2', '2.1.0')
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def reset_environment():
+    yield
+    environment.use()
@@ -0,0 +1,49 @@
+import pytest
+
+from dante.core import cache
+
+pytestmark = pytest.mark.cache
+
+
+def test_cache_key():
+    # action/verification
+    assert cache.cache_key('a', [1, 2]) == cache.cache_key('a', [1, 2])
+    assert cache.cache_key('a', [1, 2]) != cache.cache_key('a', [2, 1])
+
+
+def test_save_result(tmp_path):
+    # preconditions
+    result = {'success': False, 'output': 'output\n'}
+
+    # action
+    cache.save_result(key='key', result=result, directory=str(tmp_path))
+
+    # verification
+    assert cache.load_result(key='key', directory=str(tmp_path)) == result
+    assert cache.load_result(key='other', directory=str(tmp_path)) is None
+
+
+def test_save_result_removes_oldest(tmp_path, monkeypatch):
+    # preconditions
+    monkeypatch.setattr(cache, 'MAX_ENTRIES', 2)
+
+    # action
+    for key in ('key1', 'key2', 'key3'):
+        cache.save_result(key=key, result=key, directory=str(tmp_path))
+
+    # verification
+    assert len(list(tmp_path.iterdir())) == 2
+    assert cache.load_result(key='key3', directory=str(tmp_path)) == 'key3'
+
+
+def test_path_fingerprint(tmp_path):
+    # preconditions
+    site_packages = tmp_path / 'site-packages'
+    site_packages.mkdir()
+    fingerprint = cache.path_fingerprint(paths=[str(site_packages)])
+
+    # action
+    (site_packages / 'package.dist-info').mkdir()
+
+    # verification
+    assert cache.path_fingerprint(paths=[str(site_packages)]) != fingerprint
@@ -21,3 +21,25 @@ def test_set_color():
         foreground_color=foreground_color
     )
     assert result == expected_result
+
+
+def test_init_not_a_tty(tmp_path):
+    with open(str(tmp_path / 'output.txt'), 'w') as stream:
+        assert not color.init(stream=stream)
+
+
+def test_strip():
+    message = color.set_color(
+        message="message",
+        message_color=color.DEFAULT_PACKAGE,
+        foreground_color=color.DEFAULT_FOREGROUND
+    )
+    assert color.strip(message) == "message"
+
+
+def test_use_colors(tmp_path):
+    with open(str(tmp_path / 'output.txt'), 'w') as stream:
+        assert not color.enabled(stream=stream)
+        with color.use_colors(True):
+            assert color.enabled(stream=stream)
+        assert not color.enabled(stream=stream)
@@ -0,0 +1,122 @@
+import os
+import sys
+import json
+import shutil
+import socket
+import threading
+
+import pytest
+
+from dante import messages
+from dante.config import Config
+from dante.core import daemon
+
+from tests.conftest import create_distribution
+
+pytestmark = pytest.mark.daemon
+
+
+@pytest.mark.skipif(
+    not hasattr(__import__('socket'), 'AF_UNIX'),
+    reason='unix sockets are not available'
+)
+def test_daemon(capsys, monkeypatch, tmp_path):
+    # preconditions
+    cwd = os.getcwd()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, 'argv', ['dante'])
+    monkeypatch.delenv(daemon.NO_DAEMON_VARIABLE, raising=False)
+    site_packages = tmp_path / 'site-packages'
+    create_distribution(site_packages, 'daemon-package1', '1.0.0')
+    (tmp_path / 'requirements.txt').write_text('daemon-package1\n')
+    path = str(tmp_path / 'daemon.sock')
+    argv = ['--site-packages', str(site_packages), 'list']
+    assert daemon.forward(argv=argv, path=path) is None
+
+    server = daemon.Daemon(path=path)
+    thread = threading.Thread(target=server.serve)
+    thread.start()
+    while not daemon.is_running(path=path):
+        pass
+
+    # action
+    listed = daemon.forward(argv=argv, path=path)
+    output = capsys.readouterr().out
+    shutil.rmtree(str(site_packages / 'daemon_package1-1.0.0.dist-info'))
+    create_distribution(site_packages, 'daemon-package1', '2.0.0')
+    listed_again = daemon.forward(argv=argv, path=path)
+    output_again = capsys.readouterr().out
+    watched = daemon.forward(argv=['watch'], path=path)
+    stopped = daemon.stop(path=path)
+    thread.join()
+    Config.reset(directory=cwd)
+
+    # verification
+    assert (listed, listed_again, watched, stopped) == (0, 0, None, True)
+    assert '1.0.0' in output
+    assert '2.0.0' in output_again
+    assert not os.path.exists(path)
+
+
+@pytest.mark.skipif(
+    not hasattr(__import__('socket'), 'AF_UNIX'),
+    reason='unix sockets are not available'
+)
+def test_daemon_invalid_requests(tmp_path):
+    # preconditions
+    cwd = os.getcwd()
+    argv = list(sys.argv)
+    path = str(tmp_path / 'daemon.sock')
+    server = daemon.Daemon(path=path)
+    thread = threading.Thread(target=server.serve)
+    thread.start()
+    while not daemon.is_running(path=path):
+        pass
+
+    # action
+    # noinspection PyProtectedMember
+    responses = [
+        daemon._request(data=data, path=path)
+        for data in [['list'], {'cwd': str(tmp_path)}, {'argv': ['list']}]
+    ]
+    missing_cwd = server.run(
+        argv=['config'], cwd=str(tmp_path / 'missing')
+    )
+    running = daemon.is_running(path=path)
+    daemon.stop(path=path)
+    thread.join()
+
+    # verification
+    assert responses == [{'error': messages.DAEMON_INVALID_REQUEST}] * 3
+    assert missing_cwd['code'] == 1
+    assert running
+    assert (os.getcwd(), sys.argv) == (cwd, argv)
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, 'AF_UNIX'),
+    reason='unix sockets are not available'
+)
+def test_daemon_request_timeout(monkeypatch, tmp_path):
+    # preconditions
+    monkeypatch.setattr(daemon, 'REQUEST_TIMEOUT', 0.1)
+    path = str(tmp_path / 'daemon.sock')
+    server = daemon.Daemon(path=path)
+    thread = threading.Thread(target=server.serve)
+    thread.start()
+    while not daemon.is_running(path=path):
+        pass
+
+    # action
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(path)
+        # Request is never sent
+        with client.makefile('rb') as response:
+            timed_out = json.loads(response.read().decode())
+    running = daemon.is_running(path=path)
+    daemon.stop(path=path)
+    thread.join()
+
+    # verification
+    assert timed_out == {'error': messages.DAEMON_INVALID_REQUEST}
+    assert running
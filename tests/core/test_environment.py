@@ -0,0 +1,252 @@
+import os
+import sys
+import subprocess
+
+import pytest
+
+from dante.core import environment
+from dante.core.models import PackageCollection
+from dante.core.operations import conflicting_dependencies
+
+from tests.conftest import create_distribution
+
+pytestmark = pytest.mark.environment
+
+
+def test_venv_site_packages(venv_path):
+    # action
+    paths = environment.venv_site_packages(venv=str(venv_path))
+
+    # verification
+    assert paths == [
+        str(venv_path / 'lib' / 'python3.7' / 'site-packages')
+    ]
+
+
+def test_venv_site_packages_missing(tmp_path):
+    # action
+    paths = environment.venv_site_packages(venv=str(tmp_path))
+
+    # verification
+    assert paths == []
+
+
+def test_use_venv(venv_path):
+    # action
+    environment.use(environment.create(venv=str(venv_path)))
+    packages = PackageCollection.installed_packages()
+    package1 = packages.get(key='env-package1')
+    requirement = package1.requirements.get(key='env-package2')
+
+    # verification
+    assert packages.keys() == ['env-package1', 'env-package2']
+    assert package1.version_id == '1.0.0'
+    assert requirement.specified_version == '>=2.0.0'
+    assert requirement.version_id == '2.1.0'
+
+
+def test_use_site_packages(venv_path):
+    # preconditions
+    site_packages = environment.venv_site_packages(venv=str(venv_path))
+
+    # action
+    environment.use(environment.create(site_packages=site_packages))
+
+    # verification
+    assert (
+        PackageCollection.installed_packages().keys() ==
+        ['env-package1', 'env-package2']
+    )
+
+
+def test_distribution_index(venv_path, tmp_path):
+    # preconditions
+    site_packages = environment.venv_site_packages(venv=str(venv_path))
+    user_site = tmp_path / 'user-site'
+    create_distribution(user_site, 'env-package2', '2.0.0')
+
+    # action
+    environment.use(environment.create(
+        site_packages=site_packages + [str(user_site), str(user_site)]
+    ))
+    index = environment.current_environment().index
+
+    # verification
+    assert sorted(index.keys()) == ['env-package1', 'env-package2']
+    assert [
+        str(distribution.parsed_version)
+        for distribution in index['env-package2']
+    ] == ['2.1.0', '2.0.0']
+    assert (
+        environment.current_environment().get(key='env-package2') is
+        index['env-package2'][0]
+    )
+
+
+def test_use_editable_installs(tmp_path):
+    # preconditions
+    site_packages = tmp_path / 'site-packages'
+    project = tmp_path / 'project'
+    egg_info = project / 'editable_package.egg-info'
+    egg_info.mkdir(parents=True)
+    (egg_info / 'PKG-INFO').write_text(
+        'Metadata-Version: 1.1\nName: editable-package\nVersion: 0.3.1\n'
+    )
+    (egg_info / 'requires.txt').write_text('pth-package>=1.0\n')
+    create_distribution(tmp_path / 'pth', 'pth-package', '1.1.0')
+    site_packages.mkdir()
+    (site_packages / 'editable-package.egg-link').write_text(
+        '{}\n.\n'.format(project)
+    )
+    (site_packages / 'easy-install.pth').write_text(
+        '{}\n'.format(project)
+    )
+    (site_packages / 'paths.pth').write_text(
+        '# comment\nimport sys\n../pth\n'
+    )
+
+    # action
+    environment.use(environment.create(site_packages=[str(site_packages)]))
+    packages = PackageCollection.installed_packages()
+    requirement = packages.get(key='editable-package').requirements.get(
+        key='pth-package'
+    )
+
+    # verification
+    assert packages.keys() == ['editable-package', 'pth-package']
+    assert packages.get(key='editable-package').version_id == '0.3.1'
+    assert requirement.version_id == '1.1.0'
+    assert [
+        len(distributions)
+        for distributions in (
+            environment.current_environment().index.values()
+        )
+    ] == [1, 1]
+
+
+def test_fake_environment():
+    # preconditions
+    fake_environment = environment.FakeEnvironment({
+        'fake-package1': ('1.0.0', ['fake-package2>=2.0.0']),
+        'fake-package2': '1.5.0',
+    })
+
+    # action
+    packages = PackageCollection.installed_packages(
+        environment=fake_environment
+    )
+    conflicts = conflicting_dependencies(packages=packages)
+
+    # verification
+    assert packages.keys() == ['fake-package1', 'fake-package2']
+    assert [
+        (requirement.key, requirement.version_id)
+        for requirement, _ in conflicts
+    ] == [('fake-package2', '1.5.0')]
+    assert environment.current_environment() is not fake_environment
+
+
+def test_import_does_not_scan_environment():
+    # action
+    output = subprocess.check_output([
+        sys.executable, '-c',
+        'import sys, dante.api; '
+        'print("dante.vendor.pkg_resources" in sys.modules)'
+    ])
+
+    # verification
+    assert output.decode().strip() == 'False'
+
+
+def test_reload_path_environment(venv_path):
+    # preconditions
+    site_packages = environment.venv_site_packages(venv=str(venv_path))
+    path_environment = environment.create(site_packages=site_packages)
+    package1 = path_environment.get(key='env-package1')
+    package2 = path_environment.get(key='env-package2')
+    create_distribution(
+        venv_path / 'lib' / 'python3.7' / 'site-packages',
+        'env-package3',
+        '3.0.0'
+    )
+    os.utime(package2.egg_info)
+
+    # action
+    reloaded = path_environment.reload()
+
+    # verification
+    assert reloaded.get(key='env-package1') is package1
+    assert reloaded.get(key='env-package2') is not package2
+    assert reloaded.get(key='env-package3').version == '3.0.0'
+    assert path_environment.get(key='env-package3') is None
+
+
+def test_fingerprint_editable_metadata(tmp_path):
+    # preconditions
+    site_packages = tmp_path / 'site-packages'
+    project = tmp_path / 'project'
+    egg_info = project / 'editable_package.egg-info'
+    egg_info.mkdir(parents=True)
+    (egg_info / 'PKG-INFO').write_text(
+        'Metadata-Version: 1.1\nName: editable-package\nVersion: 0.3.1\n'
+    )
+    requires = egg_info / 'requires.txt'
+    requires.write_text('pth-package>=1.0\n')
+    site_packages.mkdir()
+    (site_packages / 'editable-package.egg-link').write_text(
+        '{}\n.\n'.format(project)
+    )
+    path_environment = environment.PathEnvironment(
+        paths=[str(site_packages)]
+    )
+    fingerprint = path_environment.fingerprint()
+    mtime = os.stat(str(requires)).st_mtime_ns
+
+    # action
+    requires.write_text('pth-package>=2.0\n')
+    os.utime(str(requires), ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+
+    # verification
+    assert path_environment.fingerprint() != fingerprint
+
+
+def test_discover(venv_path, tmp_path_factory):
+    # preconditions
+    (venv_path / 'pyvenv.cfg').write_text('home = /usr/bin\n')
+    root = tmp_path_factory.mktemp('root')
+    dist_packages = (
+        root / 'image' / 'usr' / 'lib' / 'python3' / 'dist-packages'
+    )
+    create_distribution(dist_packages, 'env-package3', '3.0.0')
+    (root / 'venv').symlink_to(venv_path)
+    snapshot = root / 'snapshot.json'
+    snapshot.write_text('{}')
+
+    # action
+    paths = environment.discover(roots=[
+        str(snapshot), str(venv_path), str(root)
+    ])
+
+    # verification
+    assert paths == [str(snapshot), str(venv_path), str(dist_packages)]
+
+
+def test_discover_site_directories(tmp_path):
+    # preconditions
+    site_directory = tmp_path / 'sp'
+    create_distribution(site_directory, 'env-package3', '3.0.0')
+    project = tmp_path / 'project'
+    (project / 'project.egg-info').mkdir(parents=True)
+    create_distribution(
+        project / 'venv' / 'lib' / 'python3.7' / 'site-packages',
+        'env-package1', '1.0.0'
+    )
+    (project / 'venv' / 'pyvenv.cfg').write_text('home = /usr/bin\n')
+
+    # action
+    paths = environment.discover(roots=[
+        str(site_directory), str(project), str(tmp_path / 'empty')
+    ])
+
+    # verification
+    assert paths == [str(site_directory), str(project / 'venv')]
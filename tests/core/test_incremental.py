@@ -0,0 +1,165 @@
+import os
+
+import pytest
+
+from dante.core import environment
+from dante.core.incremental import check_packages, reverse_closure
+from dante.core.models import (
+    PackageCollection,
+    Requirement,
+    RequirementCollection,
+)
+from dante.core.operations import (
+    conflicting_dependencies,
+    missing_requirements,
+    lock_version_mismatch,
+)
+
+from tests.conftest import create_distribution
+
+pytestmark = pytest.mark.incremental
+
+
+def check_environment(packages, state=None):
+    fake_environment = environment.FakeEnvironment(packages)
+    installed = PackageCollection.installed_packages(
+        environment=fake_environment
+    )
+    requirements = RequirementCollection([
+        Requirement.from_requirement_string(
+            requirement_string=requirement_string,
+            environment=fake_environment
+        )
+        for requirement_string in ['inc-package1', 'inc-package4']
+    ])
+    locked = RequirementCollection([
+        Requirement.from_requirement_string(
+            requirement_string=requirement_string,
+            environment=fake_environment
+        )
+        for requirement_string in ['inc-package3==1.0.0']
+    ])
+    result, state = check_packages(
+        packages=installed,
+        requirements=requirements,
+        locked=locked,
+        state=state,
+        environment=fake_environment,
+    )
+    return installed, requirements, locked, result, state
+
+
+def results(items):
+    return [
+        (
+            item.key,
+            [(package.key, version) for package, version in requirers]
+            if isinstance(requirers, list) else requirers
+        )
+        for item, requirers in items
+    ]
+
+
+def test_reverse_closure():
+    # action
+    closure = reverse_closure(keys=['c'], index={'c': {'b'}, 'b': {'a'}})
+
+    # verification
+    assert closure == {'a', 'b', 'c'}
+
+
+def test_check_packages():
+    # preconditions
+    packages = {
+        'inc-package1': ('1.0.0', ['inc-package2>=2.0.0']),
+        'inc-package2': ('2.0.0', ['inc-package3>=1.0.0']),
+        'inc-package3': '1.0.0',
+        'inc-package4': ('1.0.0', ['inc-package5>=1.0.0']),
+        'inc-package5': '0.5.0',
+    }
+    *_, state = check_environment(packages=packages)
+    packages['inc-package3'] = '0.9.0'
+
+    # action
+    installed, requirements, locked, result, _ = check_environment(
+        packages=packages, state=state
+    )
+
+    # verification
+    assert result.affected_packages == {
+        'inc-package1', 'inc-package2', 'inc-package3'
+    }
+    assert results(result.conflicts) == results(
+        conflicting_dependencies(packages=installed)
+    ) == [
+        ('inc-package3', [('inc-package2', '>=1.0.0')]),
+        ('inc-package5', [('inc-package4', '>=1.0.0')]),
+    ]
+    assert result.missing == missing_requirements(
+        packages=installed, requirements=requirements
+    ) == []
+    assert results(result.lock_version_mismatch) == results(
+        lock_version_mismatch(packages=installed, locked=locked)
+    ) == [('inc-package3', '==1.0.0')]
+
+
+def test_check_packages_missing():
+    # preconditions
+    packages = {
+        'inc-package1': ('1.0.0', ['inc-package2>=2.0.0']),
+        'inc-package2': '2.0.0',
+        'inc-package4': '1.0.0',
+    }
+    *_, state = check_environment(packages=packages)
+    del packages['inc-package2']
+
+    # action
+    installed, requirements, _, result, _ = check_environment(
+        packages=packages, state=state
+    )
+
+    # verification
+    assert result.affected_packages == {'inc-package1'}
+    assert results(result.missing) == results(missing_requirements(
+        packages=installed, requirements=requirements
+    )) == [('inc-package2', [('inc-package1', '>=2.0.0')])]
+
+
+def test_check_packages_edited_metadata(tmp_path):
+    # preconditions
+    site_packages = tmp_path / 'site-packages'
+    dist_info = create_distribution(
+        site_packages, 'inc-package1', '1.0.0', ['inc-package2==1.0.0']
+    )
+    create_distribution(site_packages, 'inc-package2', '2.0.0')
+
+    def check(state=None):
+        path_environment = environment.PathEnvironment(
+            paths=[str(site_packages)]
+        )
+        return check_packages(
+            packages=PackageCollection.installed_packages(
+                environment=path_environment
+            ),
+            state=state,
+            environment=path_environment,
+        )
+
+    result, state = check()
+    metadata = dist_info / 'METADATA'
+    mtime = os.stat(str(dist_info)).st_mtime_ns
+
+    # action
+    metadata.write_text(
+        metadata.read_text().replace('==1.0.0', '>=1.0.0')
+    )
+    os.utime(str(metadata), ns=(mtime + 10 ** 9, mtime + 10 ** 9))
+    os.utime(str(dist_info), ns=(mtime, mtime))
+    edited_result, _ = check(state=state)
+
+    # verification
+    assert results(result.conflicts) == [
+        ('inc-package2', [('inc-package1', '==1.0.0')])
+    ]
+    assert edited_result.affected_packages == {'inc-package1'}
+    assert edited_result.conflicts == []
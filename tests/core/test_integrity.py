@@ -0,0 +1,94 @@
+import base64
+import hashlib
+
+import pytest
+
+from dante.core import environment, integrity
+from dante.core.models import PackageCollection
+
+from tests.conftest import create_distribution
+
+pytestmark = pytest.mark.integrity
+
+
+def record_row(site_packages, path):
+    data = (site_packages / path).read_bytes()
+    digest = base64.urlsafe_b64encode(
+        hashlib.sha256(data).digest()
+    ).rstrip(b'=').decode()
+    return '{},sha256={},{}\n'.format(path, digest, len(data))
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_verify_packages(tmp_path, mocker, jobs):
+    # preconditions
+    mocker.patch('dante.core.integrity.BATCH_SIZE', 1)
+    site_packages = tmp_path / 'site-packages'
+    dist_info = create_distribution(site_packages, 'verify-package', '1.0.0')
+    create_distribution(site_packages, 'unverifiable-package', '1.0.0')
+    package_dir = site_packages / 'verify_package'
+    package_dir.mkdir()
+    for filename in ('__init__.py', 'modified.py', 'missing.py'):
+        (package_dir / filename).write_text(filename)
+    (dist_info / 'RECORD').write_text(''.join([
+        record_row(site_packages, 'verify_package/__init__.py'),
+        record_row(site_packages, 'verify_package/modified.py'),
+        record_row(site_packages, 'verify_package/missing.py'),
+        record_row(site_packages, 'verify_package-1.0.0.dist-info/METADATA'),
+        'verify_package-1.0.0.dist-info/RECORD,,\n',
+    ]))
+    (package_dir / 'modified.py').write_text('modified.p_')
+    (package_dir / 'missing.py').unlink()
+    (package_dir / 'untracked.py').write_text('')
+    packages = PackageCollection.installed_packages(
+        environment=environment.PathEnvironment(paths=[str(site_packages)])
+    )
+
+    # action
+    verified, unverifiable = integrity.verify_packages(
+        packages=packages, jobs=jobs
+    )
+
+    # verification
+    assert [package.key for package in unverifiable] == [
+        'unverifiable-package'
+    ]
+    assert len(verified) == 1
+    package, missing, modified, untracked = verified[0]
+    assert package.key == 'verify-package'
+    assert missing == [str(package_dir / 'missing.py')]
+    assert modified == [str(package_dir / 'modified.py')]
+    assert untracked == [str(package_dir / 'untracked.py')]
+
+
+def test_verify_packages_shared_directories(tmp_path):
+    # preconditions
+    site_packages = tmp_path / 'site-packages'
+    namespace_dir = site_packages / 'namespace'
+    namespace_dir.mkdir(parents=True)
+    for name in ('verify-package1', 'verify-package2'):
+        dist_info = create_distribution(site_packages, name, '1.0.0')
+        module = '{}.py'.format(name.replace('-', '_'))
+        (namespace_dir / module).write_text(name)
+        (dist_info / 'RECORD').write_text(
+            record_row(site_packages, 'namespace/{}'.format(module))
+        )
+    (namespace_dir / 'untracked.py').write_text('')
+    packages = PackageCollection.installed_packages(
+        environment=environment.PathEnvironment(paths=[str(site_packages)])
+    )
+
+    # action
+    verified, _ = integrity.verify_packages(
+        packages=packages, jobs=1, sample=5, seed=1
+    )
+
+    # verification
+    assert [
+        (package.key, untracked) for package, _, _, untracked in verified
+    ] == [
+        ('verify-package1', [str(namespace_dir / 'untracked.py')]),
+        ('verify-package2', [str(namespace_dir / 'untracked.py')]),
+    ]
+    with pytest.raises(ValueError):
+        integrity.verify_packages(packages=packages, sample=-1)
@@ -70,3 +70,23 @@ def test_version_model():
     assert installed3 == required3
     assert installed4 == required4
     assert installed5 == required5
+
+
+def test_versions_read_settings_once(mocker):
+    # preconditions
+    installed = InstalledVersion(obj=Version('1.2.3'))
+    required = RequiredVersion(obj=SpecifierSet())
+    any_version = installed.any_version
+    current_settings = mocker.patch(
+        'dante.core.models.current_settings',
+        side_effect=AssertionError('Settings read while comparing')
+    )
+
+    # action
+    equal = installed == required
+    specifiers = installed.specifier, required.specifier
+
+    # verification
+    assert not equal
+    assert specifiers == ('==1.2.3', any_version)
+    assert current_settings.call_count == 0
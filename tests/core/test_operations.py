@@ -4,7 +4,7 @@ from collections import OrderedDict
 import pytest
 
 from dante.config import Config
-from dante.core import operations
+from dante.core import environment, operations
 from dante.core.graph import FILE_PATH_FORMAT
 from dante.core.models import (
     PackageCollection, Requirement, RequirementCollection
@@ -12,6 +12,8 @@ from dante.core.models import (
 
 from dante.vendor import pkg_resources
 
+from tests.conftest import create_distribution
+
 pytestmark = pytest.mark.operations
 
 INSTALLER = 'pip install --no-deps'
@@ -412,6 +414,160 @@ def test_dependency_tree(virtualenv, mocker):
     )
 
 
+def tree_keys(tree):
+    return [
+        (requirement.key, tree_keys(subtree))
+        for requirement, subtree in tree.items()
+    ]
+
+
+def test_dependency_tree_shared():
+    # preconditions
+    fake_environment = environment.FakeEnvironment({
+        'tree-package1': ('1.0.0', ['tree-package3', 'tree-package4']),
+        'tree-package2': ('1.0.0', ['tree-package4', 'tree-package6']),
+        'tree-package3': ('1.0.0', ['tree-package4', 'tree-package6']),
+        'tree-package4': ('1.0.0', ['tree-package5']),
+        'tree-package5': ('1.0.0', ['tree-package4']),
+        'tree-package6': ('1.0.0', ['tree-package7']),
+        'tree-package7': '1.0.0',
+    })
+    packages = PackageCollection.installed_packages(
+        environment=fake_environment
+    )
+
+    # action
+    tree = operations.dependency_tree(packages=packages)
+
+    # verification
+    package1, package2 = tree
+    assert [package1.key, package2.key] == ['tree-package1', 'tree-package2']
+    subtree3, subtree4 = tree[package1].values()
+    # Trees without cycles are shared
+    assert list(tree[package2].values())[1] is list(subtree3.values())[1]
+    assert tree_keys(list(tree[package2].values())[0]) == tree_keys(subtree4)
+    # Cyclic requirement is not expanded again
+    (requirement5, subtree5), = subtree4.items()
+    assert requirement5.key == 'tree-package5'
+    assert [
+        (requirement.key, subtree) for requirement, subtree in subtree5.items()
+    ] == [('tree-package4', OrderedDict())]
+
+
+def test_dependency_tree_cut_subtrees():
+    # preconditions
+    fake_environment = environment.FakeEnvironment({
+        'tree-package1': ('1.0.0', ['tree-package2', 'tree-package3']),
+        'tree-package2': ('1.0.0', ['tree-package3']),
+        'tree-package3': ('1.0.0', ['tree-package2']),
+    })
+    packages = PackageCollection.installed_packages(
+        environment=fake_environment
+    )
+
+    # action
+    tree = operations.package_dependency_tree(
+        dependency=packages.get(key='tree-package1')
+    )
+
+    # verification
+    # Subtree of tree-package3 cut below tree-package2 is not reused
+    assert tree_keys(tree) == [
+        ('tree-package2', [('tree-package3', [('tree-package2', [])])]),
+        ('tree-package3', [('tree-package2', [('tree-package3', [])])]),
+    ]
+
+
+def test_iter_dependency_tree():
+    # preconditions
+    fake_environment = environment.FakeEnvironment({
+        'tree-package1': ('1.0.0', ['tree-package3', 'tree-package4']),
+        'tree-package2': ('1.0.0', ['tree-package4']),
+        'tree-package3': ('1.0.0', ['tree-package4']),
+        'tree-package4': ('1.0.0', ['tree-package5']),
+        'tree-package5': ('1.0.0', ['tree-package4']),
+    })
+    packages = PackageCollection.installed_packages(
+        environment=fake_environment
+    )
+
+    # action
+    nodes = list(operations.iter_dependency_tree(
+        operations.tree_roots(packages=packages)
+    ))
+
+    # verification
+    assert [
+        (depth, dependency.key, mark) for depth, dependency, mark in nodes
+    ] == [
+        (0, 'tree-package1', None),
+        (1, 'tree-package3', None),
+        (2, 'tree-package4', None),
+        (3, 'tree-package5', None),
+        (4, 'tree-package4', operations.TREE_CYCLIC),
+        (1, 'tree-package4', operations.TREE_REPEATED),
+        (0, 'tree-package2', None),
+        (1, 'tree-package4', operations.TREE_REPEATED),
+    ]
+
+
+def test_iter_dependency_tree_max_depth():
+    # preconditions
+    fake_environment = environment.FakeEnvironment({
+        'tree-package1': ('1.0.0', ['tree-package2']),
+        'tree-package2': ('1.0.0', ['tree-package3']),
+        'tree-package3': '1.0.0',
+    })
+    packages = PackageCollection.installed_packages(
+        environment=fake_environment
+    )
+
+    # action
+    nodes = list(operations.iter_dependency_tree(
+        operations.tree_roots(packages=packages), max_depth=1
+    ))
+
+    # verification
+    assert [
+        (depth, dependency.key, mark) for depth, dependency, mark in nodes
+    ] == [
+        (0, 'tree-package1', None),
+        (1, 'tree-package2', None),
+    ]
+
+
+def test_iter_reverse_dependency_tree():
+    # preconditions
+    fake_environment = environment.FakeEnvironment({
+        'tree-package1': ('1.0.0', ['tree-package3>=1.0.0']),
+        'tree-package2': ('1.0.0', ['tree-package4']),
+        'tree-package3': ('1.0.0', ['tree-package4']),
+        'tree-package4': ('1.0.0', ['tree-package5']),
+        'tree-package5': ('1.0.0', ['tree-package4']),
+    })
+    packages = PackageCollection.installed_packages(
+        environment=fake_environment
+    )
+
+    # action
+    nodes = list(operations.iter_reverse_dependency_tree(
+        dependency=packages.get(key='tree-package4'), packages=packages
+    ))
+
+    # verification
+    assert [
+        (depth, package.key, str(version), mark)
+        for depth, package, version, mark in nodes
+    ] == [
+        (0, 'tree-package4', 'None', None),
+        (1, 'tree-package2', 'Any', None),
+        (1, 'tree-package3', 'Any', None),
+        (2, 'tree-package1', '>=1.0.0', None),
+        (1, 'tree-package5', 'Any', None),
+        (2, 'tree-package4', 'Any', operations.TREE_CYCLIC),
+    ]
+
+
 def test_locked_requirements(virtualenv, mocker):
     # preconditions
     locked_package1_path = PACKAGES_DIR / 'locked' / 'locked-package1'
@@ -555,3 +711,242 @@ def test_render_graph(tmp_path):
     assert graph_filepath.endswith(FILE_PATH_FORMAT.format(
         filename=filename, format=file_format
     ))
+
+
+def test_environment_diff(tmp_path):
+    # preconditions
+    site_packages = tmp_path / 'site-packages'
+    other_site_packages = tmp_path / 'other-site-packages'
+    create_distribution(site_packages, 'diff-package1', '1.0.0')
+    create_distribution(
+        site_packages, 'diff-package2', '1.0.0', ['diff-package1']
+    )
+    create_distribution(site_packages, 'diff-package3', '2.0.0')
+    create_distribution(site_packages, 'diff-package4', '1.0.0')
+    create_distribution(
+        other_site_packages, 'diff-package2', '1.0.0', ['diff-package5']
+    )
+    create_distribution(other_site_packages, 'diff-package3', '1.0.0')
+    create_distribution(other_site_packages, 'diff-package4', '1.1.0')
+    create_distribution(other_site_packages, 'diff-package5', '1.0.0')
+
+    packages, other_packages = [
+        PackageCollection.installed_packages(
+            environment=environment.PathEnvironment(paths=[str(path)])
+        )
+        for path in (site_packages, other_site_packages)
+    ]
+
+    # action
+    diff = operations.environment_diff(
+        packages=packages, other_packages=other_packages
+    )
+
+    # verification
+    assert [
+        (
+            change,
+            (package or other_package).key,
+            [requirement.key for requirement in removed],
+            [requirement.key for requirement in added],
+        )
+        for change, package, other_package, removed, added in diff
+    ] == [
+        (operations.REMOVED, 'diff-package1', [], []),
+        (operations.CHANGED, 'diff-package2',
+         ['diff-package1'], ['diff-package5']),
+        (operations.DOWNGRADED, 'diff-package3', [], []),
+        (operations.UPGRADED, 'diff-package4', [], []),
+        (operations.ADDED, 'diff-package5', [], []),
+    ]
+
+
+def test_duplicate_packages(tmp_path):
+    # preconditions
+    site_packages = tmp_path / 'site-packages'
+    user_site = tmp_path / 'user-site'
+    create_distribution(site_packages, 'duplicate-package1', '1.0.0')
+    create_distribution(site_packages, 'duplicate-package2', '1.0.0')
+    create_distribution(user_site, 'duplicate-package2', '2.0.0')
+    environment_ = environment.PathEnvironment(
+        paths=[str(site_packages), str(user_site)]
+    )
+
+    # action
+    duplicates = operations.duplicate_packages(environment=environment_)
+
+    # verification
+    assert [
+        (active.key, active.version_id, shadowed.keys(),
+         [package.version_id for package in shadowed])
+        for active, shadowed in duplicates
+    ] == [('duplicate-package2', '1.0.0', ['duplicate-package2'], ['2.0.0'])]
+
+
+def test_validate_requirements():
+    # preconditions
+    fake_environment = environment.FakeEnvironment({
+        'validate-package1': ('1.0.0', ['validate-package2>=2.0.0']),
+        'validate-package2': ('2.1.0', ['validate-package3']),
+        'validate-package3': '3.0.0',
+        'validate-package4': '4.0.0',
+    })
+    packages = PackageCollection.installed_packages(
+        environment=fake_environment
+    )
+    requirements = RequirementCollection([
+        Requirement.from_requirement_string(
+            requirement_string=requirement, environment=fake_environment
+        )
+        for requirement in ('validate-package1', 'validate-package3>=4.0')
+    ])
+    locked = RequirementCollection([
+        Requirement.from_requirement_string(
+            requirement_string=requirement, environment=fake_environment
+        )
+        for requirement in (
+            'validate-package1==1.0.0',
+            'validate-package3==3.0.0',
+            'validate-package4==3.0.0',
+        )
+    ])
+
+    # action
+    validation = operations.validate_requirements(
+        packages=packages, requirements=requirements, locked=locked
+    )
+
+    # verification
+    assert validation.unlocked_requirements.keys() == ['validate-package1']
+    assert validation.unset_locks.keys() == ['validate-package2']
+    assert [
+        (package.key, required)
+        for package, required in validation.lock_version_mismatch
+    ] == [('validate-package4', '==3.0.0')]
+    assert [
+        (requirement.key, required)
+        for requirement, required in validation.required_version_mismatch
+    ] == [('validate-package3', '==3.0.0')]
+    assert validation.unnecessary_packages.keys() == []
+    assert validation.unnecessary_locks.keys() == ['validate-package4']
+    assert validation.unset_locks.keys() == operations.unset_locks(
+        requirements=requirements, locked=locked
+    ).keys()
+
+
+def test_validate_requirement_files():
+    # preconditions
+    requirements = RequirementCollection([
+        Requirement.from_requirement_string(
+            requirement_string=requirement, standalone=True
+        )
+        for requirement in (
+            'Validate_Package1',
+            'validate-package2>=2.0',
+            'validate-package3<2.0',
+            'validate-package5>=1.0',
+        )
+    ])
+    locked = RequirementCollection([
+        Requirement.from_requirement_string(
+            requirement_string=requirement, standalone=True
+        )
+        for requirement in (
+            'validate-package1==1.0.0',
+            'validate-package3==2.1.0',
+            'validate-package4==3.0.0',
+            'validate-package5==0.1-named-version',
+        )
+    ])
+
+    # action
+    validation = operations.validate_requirement_files(
+        requirements=requirements,
+        locked=locked,
+        allow_named_versions=True,
+        named_version_patterns=['0.*version'],
+    )
+
+    # verification
+    assert validation.unlocked_requirements.keys() == ['validate-package1']
+    assert validation.unset_locks.keys() == ['validate-package2']
+    assert validation.lock_version_mismatch == []
+    assert [
+        (requirement.key, required)
+        for requirement, required in validation.required_version_mismatch
+    ] == [('validate-package3', '==2.1.0')]
+    assert validation.unnecessary_packages.keys() == []
+    assert validation.unnecessary_locks.keys() == ['validate-package4']
+
+
+def test_find_cyclic_dependency():
+    # preconditions
+    fake_environment = environment.FakeEnvironment({
+        'cyclic-package1': ('1.0.0', ['cyclic-package2']),
+        'cyclic-package2': ('1.0.0', ['cyclic-package3']),
+        'cyclic-package3': ('1.0.0', ['cyclic-package2']),
+        'cyclic-package4': '1.0.0',
+    })
+    packages = PackageCollection.installed_packages(
+        environment=fake_environment
+    )
+
+    # action
+    cyclic_path = operations.find_cyclic_dependency(packages=packages)
+
+    # verification
+    assert [package.key for package in cyclic_path] == [
+        'cyclic-package2', 'cyclic-package3'
+    ]
+    assert operations.find_cyclic_dependency(packages=PackageCollection([
+        package for package in packages if package.key == 'cyclic-package4'
+    ])) is None
+
+
+def test_first_validation_failure():
+    # preconditions
+    fake_environment = environment.FakeEnvironment({
+        'validate-package1': ('1.0.0', ['validate-package2>=2.0.0']),
+        'validate-package2': '2.1.0',
+        'validate-package3': '3.0.0',
+    })
+    packages = PackageCollection.installed_packages(
+        environment=fake_environment
+    )
+    requirements = RequirementCollection([
+        Requirement.from_requirement_string(
+            requirement_string='validate-package1==1.0.0',
+            environment=fake_environment
+        )
+    ])
+    locked = RequirementCollection([
+        Requirement.from_requirement_string(
+            requirement_string=requirement, environment=fake_environment
+        )
+        for requirement in (
+            'validate-package1==1.0.0',
+            'validate-package2==2.0.0',
+            'validate-package3==3.0.0',
+        )
+    ])
+
+    # action
+    validation = operations.first_validation_failure(
+        packages=packages, requirements=requirements, locked=locked
+    )
+
+    # verification
+    assert [
+        (package.key, required)
+        for package, required in validation.lock_version_mismatch
+    ] == [('validate-package2', '==2.0.0')]
+    assert not any(
+        items for field, items in validation._asdict().items()
+        if field != 'lock_version_mismatch'
+    )
+    assert list(operations.validation_failures(
+        packages=packages, requirements=requirements, locked=locked,
+        strict=True
+    ))[1:] == [
+        ('unnecessary_locks', locked[2]),
+    ]
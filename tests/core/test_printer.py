@@ -1,3 +1,5 @@
+import io
+
 import pytest
 from faker import Faker
 
@@ -7,7 +9,7 @@ from dante.core.printer import Printer
 pytestmark = pytest.mark.printer
 
 generator = Faker()
-printer = Printer()
+printer = Printer(colors=True)
 
 
 def test_colored_message():
@@ -179,3 +181,46 @@ def test_table(capsys):
     # verification
     captured = capsys.readouterr()
     assert expected == captured.out
+
+
+@pytest.mark.parametrize('colors', [True, False])
+def test_table_colors(colors, mocker):
+    # preconditions
+    output = io.StringIO()
+    table_printer = Printer(stream=output, colors=colors)
+    mocker.patch('dante.core.printer.TABLE_CHUNK_SIZE', 2)
+    package = table_printer.colored_message(
+        message='package', message_color=table_printer.color_package
+    )
+    headers = ['name', 'version']
+    tabular_data = [[package, '1.0.0'], ['other-package', '2.0.0']]
+
+    expected = (
+        'name           version\n'
+        '-------------  -------\n'
+        '{}        1.0.0\n'
+        'other-package  2.0.0\n'
+    ).format(package if colors else 'package')
+
+    # action
+    table_printer.table(headers=headers, tabular_data=tabular_data)
+
+    # verification
+    assert expected == output.getvalue()
+
+
+def test_messages_without_terminal():
+    # preconditions
+    output = io.StringIO()
+    stream_printer = Printer(stream=output)
+
+    # action
+    stream_printer.error(message='error')
+    message = stream_printer.colored_message(
+        message='package', message_color=stream_printer.color_package
+    )
+
+    # verification
+    assert not stream_printer.use_colors
+    assert 'error\n' == output.getvalue()
+    assert 'package' == message
@@ -0,0 +1,99 @@
+import shutil
+
+import pytest
+
+from dante.core import operations
+from dante.core.session import Session
+from dante.core.environment import PathEnvironment
+
+from tests.conftest import create_distribution
+
+pytestmark = pytest.mark.session
+
+
+@pytest.fixture
+def session(tmp_path):
+    site_packages = tmp_path / 'site-packages'
+    create_distribution(
+        site_packages,
+        'session-package1', '1.0.0', ['session-package2>=2.0.0']
+    )
+    create_distribution(site_packages, 'session-package2', '1.0.0')
+    (tmp_path / 'requirements.txt').write_text(
+        'session-package1\nsession-package3\n'
+    )
+    return Session(
+        environment=PathEnvironment(paths=[str(site_packages)]),
+        requirements_files=[str(tmp_path / 'requirements.txt')],
+        lock_files=[],
+    )
+
+
+def test_session_caches_results(session, mocker):
+    # preconditions
+    conflicting_dependencies = mocker.spy(
+        operations, 'conflicting_dependencies'
+    )
+    dependency_list = mocker.spy(operations, 'dependency_list')
+
+    # action
+    conflicts = session.conflicting_dependencies()
+    cyclic = session.cyclic_dependencies()
+    missing = session.missing_requirements()
+
+    # verification
+    assert [requirement.key for requirement, _ in conflicts] == [
+        'session-package2'
+    ]
+    assert cyclic == []
+    assert [requirement.key for requirement, _ in missing] == [
+        'session-package3'
+    ]
+    assert session.conflicting_dependencies() is conflicts
+    assert conflicting_dependencies.call_count == 1
+    assert dependency_list.call_count == 1
+
+
+def test_session_invalidate(session, mocker):
+    # preconditions
+    conflicts = session.conflicting_dependencies()
+    missing = session.missing_requirements()
+    packages = session.packages
+    dependency_list = mocker.spy(operations, 'dependency_list')
+
+    # action
+    session.invalidate('missing_requirements')
+
+    # verification
+    assert session.conflicting_dependencies() is conflicts
+    assert session.missing_requirements() is not missing
+    assert session.packages is packages
+
+    # action
+    session.invalidate('requirements')
+
+    # verification
+    assert session.conflicting_dependencies() is not conflicts
+    assert session.packages is packages
+    assert dependency_list.call_count == 0
+
+
+def test_session_refresh(session, tmp_path):
+    # preconditions
+    assert session.conflicting_dependencies()
+    create_distribution(
+        tmp_path / 'site-packages', 'session-package3', '1.0.0'
+    )
+    shutil.rmtree(
+        str(tmp_path / 'site-packages' / 'session_package2-1.0.0.dist-info')
+    )
+    create_distribution(
+        tmp_path / 'site-packages', 'session-package2', '2.1.0'
+    )
+
+    # action
+    session.refresh()
+
+    # verification
+    assert session.conflicting_dependencies() == []
+    assert session.missing_requirements() == []
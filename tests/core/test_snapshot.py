@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from dante.core import environment, snapshot
+from dante.core.models import PackageCollection
+
+pytestmark = pytest.mark.snapshot
+
+
+def test_snapshot_round_trip(venv_path, tmp_path):
+    # preconditions
+    snapshot_file = tmp_path / 'env.json'
+    distributions = environment.load(path=str(venv_path)).working_set
+
+    # action
+    snapshot.save_snapshot(
+        distributions=distributions, filepath=snapshot_file
+    )
+    environment.use(environment.create(snapshot=str(snapshot_file)))
+    packages = PackageCollection.installed_packages()
+    package1 = packages.get(key='env-package1')
+    requirement = package1.requirements.get(key='env-package2')
+
+    # verification
+    assert json.loads(snapshot_file.read_text()) == {
+        'version': snapshot.SNAPSHOT_VERSION,
+        'packages': [
+            ['env-package1', '1.0.0', ['env-package2>=2.0.0']],
+            ['env-package2', '2.1.0', []],
+        ]
+    }
+    assert packages.keys() == ['env-package1', 'env-package2']
+    assert package1.version_id == '1.0.0'
+    assert requirement.specified_version == '>=2.0.0'
+    assert requirement.version_id == '2.1.0'
+
+
+def test_snapshot_unsupported_version():
+    # action/verification
+    with pytest.raises(ValueError):
+        snapshot.from_json(json.dumps({'version': 0, 'packages': []}))
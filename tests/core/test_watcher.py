@@ -0,0 +1,53 @@
+import sys
+
+import pytest
+
+from dante.core import watcher
+
+from tests.conftest import create_distribution
+
+pytestmark = pytest.mark.watcher
+
+
+def test_polling_watcher(tmp_path):
+    # preconditions
+    requirements_file = tmp_path / 'requirements.txt'
+    requirements_file.write_text('watch-package1\n')
+    polling_watcher = watcher.PollingWatcher(
+        files=[str(requirements_file)], interval=0.01
+    )
+
+    # action
+    unchanged = polling_watcher.changed(timeout=0.05)
+    requirements_file.write_text('watch-package1\nwatch-package2\n')
+    changed = polling_watcher.changed(timeout=0.05)
+
+    # verification
+    assert (unchanged, changed) == (False, True)
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith('linux'), reason='inotify is Linux only'
+)
+def test_inotify_watcher(tmp_path):
+    # preconditions
+    site_packages = tmp_path / 'site-packages'
+    site_packages.mkdir()
+    requirements_file = tmp_path / 'requirements.txt'
+    requirements_file.write_text('watch-package1\n')
+
+    with watcher.create_watcher(
+            files=[str(requirements_file)],
+            directories=[str(site_packages)]) as inotify_watcher:
+        # action
+        (site_packages / 'module.py').write_text('')
+        (tmp_path / 'other.txt').write_text('')
+        unrelated = inotify_watcher.changed(timeout=0.05)
+        create_distribution(site_packages, 'watch-package1', '1.0.0')
+        installed = inotify_watcher.changed(timeout=0.05)
+        requirements_file.write_text('watch-package2\n')
+        edited = inotify_watcher.changed(timeout=0.05)
+
+    # verification
+    assert isinstance(inotify_watcher, watcher.InotifyWatcher)
+    assert (unrelated, installed, edited) == (False, True, True)
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from dante import aio
+from dante.config import Settings, use_settings
+
+from tests.conftest import create_distribution
+
+pytestmark = pytest.mark.aio
+
+
+def run_coroutine(coroutine):
+    """Run a coroutine in a new event loop, asyncio.run is not available
+        before python 3.7
+    :param coroutine: Coroutine object
+    :return: Coroutine result
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_check_environments(tmp_path):
+    # preconditions
+    create_distribution(
+        tmp_path / 'env1' / 'site-packages',
+        'aio-package1', '1.0.0', ['aio-package2>=2.0.0']
+    )
+    create_distribution(
+        tmp_path / 'env1' / 'site-packages', 'aio-package2', '1.0.0'
+    )
+    create_distribution(
+        tmp_path / 'env2' / 'site-packages', 'aio-package1', '1.0.0'
+    )
+    (tmp_path / 'requirements.txt').write_text('aio-package1\naio-package2\n')
+
+    async def check(path):
+        environment = await aio.load_environment(path=path)
+        requirements = await aio.read_requirements(
+            filepaths=[str(tmp_path / 'requirements.txt')],
+            environment=environment,
+        )
+        return await aio.check_environment(
+            environment=environment,
+            requirements=requirements,
+            checks=['conflicts', 'cyclic', 'missing'],
+        )
+
+    async def check_all():
+        return await asyncio.gather(*(
+            check(str(tmp_path / name / 'site-packages'))
+            for name in ['env1', 'env2']
+        ))
+
+    # action
+    env1_results, env2_results = run_coroutine(check_all())
+
+    # verification
+    assert list(env1_results) == ['conflicts', 'cyclic', 'missing']
+    assert [
+        requirement.key for requirement, _ in env1_results['conflicts']
+    ] == ['aio-package2']
+    assert env1_results['cyclic'] == []
+    assert env1_results['missing'] == []
+    assert env2_results['conflicts'] == []
+    assert [
+        requirement.key for requirement, _ in env2_results['missing']
+    ] == ['aio-package2']
+
+
+def test_run_in_executor_uses_settings():
+    # preconditions
+    settings = Settings.defaults()._replace(any_version='Unpinned')
+
+    async def run():
+        with use_settings(settings):
+            return await aio.run_in_executor(
+                lambda: aio.current_settings().any_version
+            )
+
+    # action
+    any_version = run_coroutine(run())
+
+    # verification
+    assert any_version == 'Unpinned'
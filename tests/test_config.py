@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+
+from dante.config import Config, Settings, current_settings, use_settings
+from dante.core.models import InstalledVersion
+
+pytestmark = pytest.mark.config
+
+
+def test_settings_are_frozen(tmp_path):
+    # preconditions
+    (tmp_path / 'setup.cfg').write_text(
+        '[dante]\n'
+        'checks =\n'
+        '    conflicts\n'
+        '    cyclic\n'
+        'requirements_files =\n'
+        '    requirements/base.txt\n'
+        '\n'
+        '[dante:graph_node_attributes]\n'
+        'color = red\n'
+    )
+
+    # action
+    settings = Settings.from_file(directory=str(tmp_path))
+
+    # verification
+    assert settings.directory == str(tmp_path)
+    assert settings.checks == ('conflicts', 'cyclic')
+    assert settings.requirements_files == (
+        str(tmp_path / 'requirements' / 'base.txt'),
+    )
+    assert settings.lock_files == (str(tmp_path / 'requirements.lock'),)
+    assert dict(settings.graph_node_attributes) == {
+        'shape': 'box3d', 'color': 'red'
+    }
+    with pytest.raises(AttributeError):
+        settings.checks = ['validate']
+    assert hash(settings)
+
+
+def test_config_changes_invalidate_settings(monkeypatch):
+    # preconditions
+    settings = current_settings()
+
+    # action
+    monkeypatch.setattr(Config, 'checks', ['conflicts'])
+
+    # verification
+    assert current_settings() is not settings
+    assert current_settings().checks == ('conflicts',)
+
+
+def test_use_settings_in_threads():
+    # preconditions
+    any_versions = ['Any', 'Unpinned']
+    results = {}
+    # Both threads use their settings at the same time
+    barrier = threading.Barrier(len(any_versions))
+
+    def run(any_version):
+        settings = Settings.defaults()._replace(any_version=any_version)
+        with use_settings(settings):
+            barrier.wait()
+            results[any_version] = (
+                InstalledVersion.from_packaging_version(version=None)
+            )
+
+    threads = [
+        threading.Thread(target=run, args=(any_version,))
+        for any_version in any_versions
+    ]
+
+    # action
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # verification
+    assert results == {'Any': 'Any', 'Unpinned': 'Unpinned'}
+    assert current_settings().any_version == Config.any_version